@@ -1,81 +1,90 @@
-import os
+import importlib  # Standard library
+import sys
 
-import pyfiglet
-
-from mekus import (
-    PokemonGame, 
-    RockPaperScissors, 
-    MobileLegendsStats, 
-    NBA2K25,
-    ValorantOps
-)
+from mekus import metrics, randomness, screen
+from mekus.banners import render_banner
 
 EXIT_CHOICE = "0"
+# Menu key -> (description, module, class); a module is only imported,
+# with its third-party dependencies, the first time it is chosen
 MENU_CHOICES = {
-    "1": "Agulto's Module",
-    "2": "Dazo's Module",
-    "3": "Jundam's Module",
-    "4": "Olazo's Module",
-    "5": "Serohijo's Module",
-    "0": "Exit"
+    "1": ("Agulto's Module", "mekus.agulto", "NBA2K25"),
+    "2": ("Dazo's Module", "mekus.dazo", "MobileLegendsStats"),
+    "3": ("Jundam's Module", "mekus.jundam", "ValorantOps"),
+    "4": ("Olazo's Module", "mekus.olazo", "PokemonGame"),
+    "5": ("Serohijo's Module", "mekus.serohijos", "RockPaperScissors"),
+    EXIT_CHOICE: ("Exit", None, None)
 }
 
 class MekusModules:
     """Handles the Mekus project module menu."""
 
+    __slots__ = ("title", "modules")
+
     def __init__(self):
-        """Initialize menu title."""
+        """Initialize menu title and the session's module instances."""
         self.title = "Mekus"
+        self.modules = {}  # Menu key -> instance, kept for the session
 
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        screen.clear_screen()
 
     def display_menu(self):
         """Show the menu options."""
         self.clear_screen()
-        print(pyfiglet.figlet_format(self.title))
+        print(render_banner(self.title))
         print("=== Mekus Module Menu ===\n")
-        for key, description in MENU_CHOICES.items():
+        for key, (description, _, _) in MENU_CHOICES.items():
             print(f"{key}. {description}")
 
-    def run_agulto_module(self):
-        """Run Agulto's module."""
-        NBA2K25().menu()
+    def get_module(self, choice):
+        """
+        Return the module instance for a menu choice.
+
+        The module is imported and instantiated on first use, then reused
+        so its state carries over between visits.
+
+        Parameters:
+            choice (str): A menu key other than EXIT_CHOICE.
 
-    def run_dazo_module(self):
-        """Run Dazo's module."""
-        MobileLegendsStats().menu()
+        Returns:
+            object: The module instance, or None for an unknown choice.
+        """
+        instance = self.modules.get(choice)
+        if instance is not None:
+            return instance
 
-    def run_jundam_module(self):
-        """Run Jundam's module."""
-        ValorantOps().menu()
+        entry = MENU_CHOICES.get(choice)
+        if entry is None or entry[1] is None:
+            return None
 
-    def run_olazo_module(self):
-        """Run Olazo's module."""
-        PokemonGame().menu()
+        _, module_name, class_name = entry
+        module = importlib.import_module(module_name)
+        instance = self.modules[choice] = getattr(module, class_name)()
+        return instance
 
-    def run_serohijos_module(self):
-        """Run Serohijos's module."""
-        RockPaperScissors().menu()
+    def suspend(self):
+        """Return a snapshot of every module opened in this session."""
+        from mekus import snapshot
+
+        return snapshot.suspend_session(self.modules)
+
+    def resume(self, data):
+        """Restore the modules of a session snapshot from suspend()."""
+        from mekus import snapshot
+
+        self.modules = snapshot.resume_session(data)
 
     def handle_user_choice(self, choice):
         """Handle a menu choice and run the selected module."""
-        menu_handlers = {
-            "1": self.run_agulto_module,
-            "2": self.run_dazo_module,
-            "3": self.run_jundam_module,
-            "4": self.run_olazo_module,
-            "5": self.run_serohijos_module
-        }
-
         if choice == EXIT_CHOICE:
             print("\nExiting... Goodbye!")
             return False
 
-        handler = menu_handlers.get(choice)
-        if handler:
-            handler()
+        module = self.get_module(choice)
+        if module is not None:
+            metrics.call_handler(module.menu)
         else:
             print("Invalid choice. Try again.")
 
@@ -92,5 +101,11 @@ class MekusModules:
                 break
 
 if __name__ == "__main__":
+    try:
+        # Build the random source now, so a bad MEKUS_SEED stops the
+        # program before play instead of losing the draw log at exit
+        randomness.current()
+    except ValueError as error:
+        sys.exit(error)
     mekus = MekusModules()
-    mekus.main()
\ No newline at end of file
+    mekus.main()
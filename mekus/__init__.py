@@ -1,5 +1,28 @@
-from .dazo import MobileLegendsStats
-from .serohijos import RockPaperScissors
-from .olazo import PokemonGame
-from .agulto import NBA2K25
-from .jundam import ValorantOps
\ No newline at end of file
+import importlib  # Standard library
+
+# Public classes and the submodules defining them; a submodule (and its
+# third-party dependencies) is only imported when its class is first used
+LAZY_CLASSES = {
+    "MobileLegendsStats": ".dazo",
+    "RockPaperScissors": ".serohijos",
+    "PokemonGame": ".olazo",
+    "NBA2K25": ".agulto",
+    "ValorantOps": ".jundam"
+}
+
+__all__ = list(LAZY_CLASSES)
+
+
+def __getattr__(name):
+    """Import a public class's submodule on first access."""
+    module_name = LAZY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
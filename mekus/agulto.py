@@ -1,12 +1,19 @@
-import os
-import random
-
 # Third-party libraries
-from colorama import init, Fore  # Import colorama for colored terminal text 
-import pyfiglet  # Import pyfiglet for ASCII art text
-
-# Initialize colorama to automatically reset styles
-init(autoreset=True)
+from colorama import Fore  # Import colorama for colored terminal text
+
+from . import figlet_tables, metrics, randomness, screen, stats
+from .banners import render_banner
+from .nba_rules import (
+    MAX_STAMINA,
+    ROLL_MAX,
+    ROLL_MIN,
+    SHOT_TYPES,
+    recover_stamina,
+    resolve_shot
+)
+from .nba_league import PlayerProfile, simulate_season
+from .nba_playlog import MADE, MISSED, NO_STAMINA, PlayLog
+from .nba_policy import solve_policy
 
 # Constants
 BACK_CHOICE = "0"  # Menu option to exit the game
@@ -19,9 +26,34 @@ MENU_CHOICES = {
     "4": "Three-Pointer",
     "5": "Check Stats",
     "6": "Rest and Recover",
+    "7": "Coach's Tip",
+    "8": "Simulate League Season",
     "0": "Back"
 }
 
+# Menu choice -> name of the method it runs, bound only when chosen
+MENU_ACTIONS = {
+    "1": "select_player",
+    "2": "shoot",
+    "3": "dunk",
+    "4": "three_pointer",
+    "5": "check_stats",
+    "6": "rest_and_recover",
+    "7": "coach_tip",
+    "8": "simulate_league"
+}
+
+# Number of upcoming actions the coach plans for
+COACH_HORIZON = 10
+
+# Menu wording of each action the coach can suggest
+COACH_ACTION_NAMES = {
+    "shoot": "Shoot",
+    "dunk": "Dunk",
+    "three_pointer": "Three-Pointer",
+    "rest_and_recover": "Rest and Recover"
+}
+
 # List of possible NBA teams
 TEAMS = [
     "Los Angeles Lakers",
@@ -32,25 +64,48 @@ TEAMS = [
     "Denver Nuggets"
 ]
 
+# Default player profile and skill ratings
+DEFAULT_PLAYER_NAME = "LeBron James"
+DEFAULT_TEAM = "Los Angeles Lakers"
+DEFAULT_SHOOTING_SKILL = 85
+DEFAULT_DUNK_SKILL = 90
+DEFAULT_THREE_POINT_SKILL = 75
+
 # Class representing the NBA2K25 game
 class NBA2K25:
 
-    def __init__(self):
+    # Instances carry no __dict__; many idle games can share a process
+    __slots__ = (
+        "player_name", "team", "points", "stamina", "shooting_skill",
+        "dunk_skill", "three_point_skill", "field_goal_attempted",
+        "field_goal_made", "play_log", "rng"
+    )
+
+    def __init__(
+        self, player_name=DEFAULT_PLAYER_NAME, team=DEFAULT_TEAM,
+        shooting_skill=DEFAULT_SHOOTING_SKILL, dunk_skill=DEFAULT_DUNK_SKILL,
+        three_point_skill=DEFAULT_THREE_POINT_SKILL, play_log=None,
+        rng=None
+    ):
         # Initialize player attributes
-        self.player_name = "LeBron James"
-        self.team = "Los Angeles Lakers"
+        self.player_name = player_name
+        self.team = team
         self.points = 0
-        self.stamina = 100
-        self.shooting_skill = 85
-        self.dunk_skill = 90
-        self.three_point_skill = 75
+        self.stamina = MAX_STAMINA
+        self.shooting_skill = shooting_skill
+        self.dunk_skill = dunk_skill
+        self.three_point_skill = three_point_skill
         self.field_goal_attempted = 0
         self.field_goal_made = 0
+        # Play-by-play record of every action (see nba_playlog)
+        self.play_log = play_log if play_log is not None else PlayLog()
+        # Every roll and team pick (see randomness.SessionRandom)
+        self.rng = rng if rng is not None else randomness.current()
 
     # Displays the game title using ASCII art
     def display_title(self):
-        os.system('cls' if os.name == 'nt' else 'clear')  # Clear terminal
-        title = pyfiglet.figlet_format("NBA 2K25", font="slant")
+        screen.clear_screen()  # Start a new terminal frame
+        title = render_banner("NBA 2K25", font="slant")
         print(Fore.RED + title)
 
     # Allows player to input name and assigns a random team
@@ -59,10 +114,11 @@ class NBA2K25:
             Fore.YELLOW + "Enter player name: "
         ).strip()
         if not self.player_name:
-            self.player_name = "LeBron James"  # Default name if input is empty
+            self.player_name = DEFAULT_PLAYER_NAME  # Default if input is empty
 
-        self.team = random.choice(TEAMS)  # Randomly assign a team
-        print(Fore.GREEN + pyfiglet.figlet_format(
+        self.team = self.rng.choice(TEAMS)  # Randomly assign a team
+        print(Fore.GREEN + metrics.call_external(
+            "figlet.render", figlet_tables.render,
             f"{self.player_name}", font="digital"
         ))
         print(Fore.LIGHTBLUE_EX + f"\nWelcome to {self.team}!")
@@ -71,10 +127,7 @@ class NBA2K25:
     # Performs a 2-point jump shot attempt
     def shoot(self):
         self._attempt_shot(
-            action_name="shoot",
-            stamina_cost=5,
-            points=2,
-            success_chance=self.shooting_skill,
+            shot_type="shoot",
             success_text="SWISH!",
             success_message=f"{self.player_name} makes a jump shot! +2 points",
             fail_text="MISSED!",
@@ -84,52 +137,64 @@ class NBA2K25:
     # Performs a dunk attempt
     def dunk(self):
         self._attempt_shot(
-            action_name="dunk",
-            stamina_cost=15,
-            points=2,
-            success_chance=self.dunk_skill,
+            shot_type="dunk",
             success_text="SLAM DUNK!",
             success_message=(
                 f"🔥 {self.player_name} throws it down! +2 points 🔥"
             ),
             fail_text="BLOCKED!",
-            fail_message="The defender swats it away!",
-            min_stamina=15
+            fail_message="The defender swats it away!"
         )
 
     # Performs a 3-point shot attempt
     def three_pointer(self):
         self._attempt_shot(
-            action_name="three-pointer",
-            stamina_cost=10,
-            points=3,
-            success_chance=self.three_point_skill,
+            shot_type="three_pointer",
             success_text="THREE!",
             success_message=(
                 f"💰 {self.player_name} from downtown! +3 points 💰"
             ),
             fail_text="BRICK!",
-            fail_message="Clanks off the backboard!",
-            min_stamina=10
+            fail_message="Clanks off the backboard!"
         )
 
-    # Handles the logic for shot attempts including success/failure
+    # Rolls and resolves a shot with the shared rules in nba_rules
+    def _resolve_shot(self, shot_type):
+        shot = SHOT_TYPES[shot_type]
+        roll = self.rng.randint(ROLL_MIN, ROLL_MAX)
+        stamina_before = self.stamina
+        attempted, made, points, stamina_after = resolve_shot(
+            stamina=stamina_before,
+            skill=getattr(self, shot["skill"]),
+            roll=roll,
+            stamina_cost=shot["stamina_cost"],
+            points=shot["points"],
+            min_stamina=shot["min_stamina"]
+        )
+        if attempted:
+            self.field_goal_attempted += 1
+            self.field_goal_made += made
+            self.points += points
+            self.stamina = stamina_after
+
+        outcome = (MADE if made else MISSED) if attempted else NO_STAMINA
+        self.play_log.record(stamina_before, shot_type, roll, outcome)
+        return attempted, made
+
+    # Handles the rendering of shot attempts including success/failure
     def _attempt_shot(
-        self, action_name, stamina_cost, points, success_chance,
-        success_text, success_message, fail_text, fail_message,
-        min_stamina=0
+        self, shot_type, success_text, success_message, fail_text,
+        fail_message
     ):
-        if self.stamina < min_stamina:
-            print(Fore.RED + f"Not enough stamina to {action_name}!")
+        attempted, made = self._resolve_shot(shot_type)
+        if not attempted:
+            label = SHOT_TYPES[shot_type]["label"]
+            print(Fore.RED + f"Not enough stamina to {label}!")
             input(Fore.WHITE + "\nPress Enter to continue...")
             return
 
-        self.field_goal_attempted += 1
-        self.stamina -= stamina_cost
-
-        # Check for success based on chance
-        if random.randint(1, 100) > success_chance:
-            print(Fore.RED + pyfiglet.figlet_format(
+        if not made:
+            print(Fore.RED + render_banner(
                 fail_text, font="digital"
             ))
             print(Fore.LIGHTRED_EX + fail_message)
@@ -137,17 +202,14 @@ class NBA2K25:
             input(Fore.WHITE + "\nPress Enter to continue...")
             return
 
-        # If successful, update points and field goals made
-        self.points += points
-        self.field_goal_made += 1
-
         # Choose color and font based on type of shot
+        points = SHOT_TYPES[shot_type]["points"]
         success_color = (
             Fore.LIGHTBLUE_EX if points == 3 else Fore.LIGHTGREEN_EX
         )
         font = "smslant" if points != 2 else "big"
 
-        print(success_color + pyfiglet.figlet_format(
+        print(success_color + render_banner(
             success_text, font=font
         ))
         print(success_color + success_message)
@@ -161,10 +223,10 @@ class NBA2K25:
         print(Fore.CYAN + f"Team: {self.team}")
         print(Fore.GREEN + f"Points: {self.points}")
 
-        if self.field_goal_attempted > 0:
-            field_goal_pct = (
-                self.field_goal_made / self.field_goal_attempted
-            ) * 100
+        field_goal_pct = stats.percentage(
+            self.field_goal_made, self.field_goal_attempted
+        )
+        if stats.is_finite(field_goal_pct):
             print(Fore.LIGHTCYAN_EX +
                   f"FG: {self.field_goal_made}/{self.field_goal_attempted} "
                   f"({field_goal_pct:.1f}%)")
@@ -182,23 +244,93 @@ class NBA2K25:
     def check_stats(self):
         self.display_title()
         self.display_stats()
+        self.display_shot_breakdown()
         input(Fore.WHITE + "\nPress Enter to continue...")
 
+    # Displays per-shot-type FG% and streaks from the play-by-play log
+    def display_shot_breakdown(self):
+        summary = self.play_log.summary()
+        if not any(summary["attempts"].values()):
+            return
+
+        print(Fore.YELLOW + f"\n=== LAST {len(self.play_log)} ACTIONS ===")
+        for shot_type, shot in SHOT_TYPES.items():
+            attempted = summary["attempts"][shot_type]
+            if attempted == 0:
+                continue
+            made = summary["made"][shot_type]
+            print(Fore.LIGHTCYAN_EX +
+                  f"{shot['label'].title()}: {made}/{attempted} "
+                  f"({stats.percentage(made, attempted):.1f}%)")
+
+        streak = summary["current_streak"]
+        streak_text = (
+            f"{streak} made" if streak > 0 else f"{-streak} missed"
+        )
+        print(Fore.LIGHTYELLOW_EX + f"Current streak: {streak_text}")
+        print(Fore.LIGHTGREEN_EX +
+              f"Longest make streak: {summary['longest_make_streak']}")
+        print(Fore.LIGHTRED_EX +
+              f"Longest miss streak: {summary['longest_miss_streak']}")
+
     # Restores player stamina with a limit of 100
     def rest_and_recover(self):
         """Recover stamina up to a max of 100."""
-        recovered = 20
         original_stamina = self.stamina
-        self.stamina = min(100, self.stamina + recovered)
+        self.stamina = recover_stamina(self.stamina)
+        self.play_log.record(original_stamina, "rest_and_recover")
         gained = self.stamina - original_stamina
 
-        print(Fore.GREEN + pyfiglet.figlet_format("Rest", font="standard"))
+        print(Fore.GREEN + render_banner("Rest", font="standard"))
         print(Fore.LIGHTGREEN_EX +
               f"{self.player_name} takes a breather and recovers "
               f"{gained} stamina.")
         self.display_stats()
         input(Fore.WHITE + "\nPress Enter to continue...")
 
+    # Suggests the best next move from the memoized policy table
+    def coach_tip(self):
+        policy = solve_policy(
+            self.shooting_skill, self.dunk_skill, self.three_point_skill
+        )
+        action = policy.best_action(self.stamina, COACH_HORIZON)
+        expected = policy.expected_points(self.stamina, COACH_HORIZON)
+
+        print(Fore.YELLOW + "\n=== COACH'S TIP ===")
+        print(Fore.CYAN + f"Stamina: {self.stamina}/{MAX_STAMINA}")
+        print(Fore.LIGHTGREEN_EX +
+              f"Best move: {COACH_ACTION_NAMES[action]}")
+        print(Fore.LIGHTCYAN_EX +
+              f"Expected points over the next {COACH_HORIZON} actions: "
+              f"{expected:.1f}")
+        input(Fore.WHITE + "\nPress Enter to continue...")
+
+    # Simulates a full season with this player on their team's roster
+    def simulate_league(self):
+        self.display_title()
+        print(Fore.YELLOW + "Simulating the season...")
+        season = simulate_season(
+            TEAMS, seed=self.rng.getrandbits(32),
+            featured=PlayerProfile.from_game(self)
+        )
+
+        print(Fore.YELLOW + "\n=== STANDINGS ===")
+        for rank, (team, wins, losses, _, _) in enumerate(
+            season["standings"], start=1
+        ):
+            print(Fore.CYAN + f"{rank}. {team:<24} {wins:>2}-{losses:<2}")
+
+        team, points, made, attempted, games = (
+            season["player_totals"][self.player_name]
+        )
+        field_goal_pct = stats.percentage(made, attempted)
+        print(Fore.YELLOW + "\n=== YOUR SEASON ===")
+        print(Fore.LIGHTGREEN_EX +
+              f"{self.player_name} ({team}): {points / games:.1f} PPG, "
+              f"FG {made}/{attempted} "
+              f"({stats.format_ratio(field_goal_pct, 1, '%')})")
+        input(Fore.WHITE + "\nPress Enter to continue...")
+
     # Displays the main menu and handles user input
     def menu(self):
         while True:
@@ -219,24 +351,17 @@ class NBA2K25:
 
     # Handles execution of menu choices
     def _handle_menu_choice(self, choice):
-        MENU_ACTIONS = {
-            "1": self.select_player,
-            "2": self.shoot,
-            "3": self.dunk,
-            "4": self.three_pointer,
-            "5": self.check_stats,
-            "6": self.rest_and_recover 
-        }
         if choice not in MENU_ACTIONS:
             print(Fore.RED + "Invalid choice. Try again.")
             input(Fore.WHITE + "\nPress Enter to continue...")
             return
 
-        MENU_ACTIONS[choice]()  # Call the corresponding method
+        # Call the corresponding method
+        metrics.call_handler(getattr(self, MENU_ACTIONS[choice]))
 
     # Displays game over message and final stats
     def _exit_game(self):
-        print(Fore.RED + pyfiglet.figlet_format(
+        print(Fore.RED + render_banner(
             "Game Over!", font="slant"
         ))
         print(Fore.YELLOW + "Final Stats:")
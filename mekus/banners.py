@@ -0,0 +1,146 @@
+import hashlib  # Standard library
+import json
+import os
+import threading
+
+from . import figlet_tables, metrics
+
+# Defaults matching pyfiglet.figlet_format
+DEFAULT_FONT = "standard"
+DEFAULT_WIDTH = 80
+DEFAULT_JUSTIFY = "auto"
+
+# Banners rendered ahead of time and shipped with the package
+PRERENDERED_FILE = os.path.join(os.path.dirname(__file__), "banners.json")
+
+# Where banners rendered at run time are kept between sessions
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".mekus", "banners")
+CACHE_DIR_ENV = "MEKUS_CACHE_DIR"
+
+# Every static banner the modules draw: (text, font, width, justify)
+STATIC_BANNERS = (
+    ("Mekus", DEFAULT_FONT, DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("ML STATS", "slant", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("VALORANT STATS", "slant", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("NBA 2K25", "slant", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("Game Over!", "slant", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("Rest", "standard", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("SWISH!", "big", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("SLAM DUNK!", "big", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("THREE!", "smslant", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("MISSED!", "digital", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("BLOCKED!", "digital", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("BRICK!", "digital", DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("Rock! Paper! Scissors!", DEFAULT_FONT, DEFAULT_WIDTH, DEFAULT_JUSTIFY),
+    ("Who's That Pokemon?", "cosmic", 80, "center")
+)
+
+# Banners already rendered in this process
+_memory_cache = {}
+_local = threading.local()
+_prerendered_loaded = False
+
+
+def render_banner(
+    text, font=DEFAULT_FONT, width=DEFAULT_WIDTH, justify=DEFAULT_JUSTIFY
+):
+    """
+    Return figlet_format(text, font=font, width=width, justify=justify).
+
+    Looks in memory, then in the banners shipped with the package, then
+    in the on-disk cache; it is only rendered on a miss.
+    """
+    key = (text, font, width, justify)
+    banner = _memory_cache.get(key)
+    if banner is not None:
+        return banner
+
+    if not _prerendered_loaded:
+        load_prerendered()
+        banner = _memory_cache.get(key)
+        if banner is not None:
+            return banner
+
+    path = cache_path(key)
+    try:
+        with open(path, encoding="utf-8") as file:
+            banner = file.read()
+    except OSError:
+        banner = figlet_render(*key)
+        save_to_disk(path, banner)
+
+    _memory_cache[key] = banner
+    return banner
+
+
+def figlet_render(text, font, width, justify):
+    """Render a banner from the compiled font tables, or with pyfiglet."""
+    if figlet_tables.has_font(font):
+        return metrics.call_external(
+            "figlet.render", figlet_tables.render, text, font, width, justify
+        )
+
+    # Imported here so cached redraws never load pyfiglet
+    import pyfiglet
+
+    return metrics.call_external(
+        "pyfiglet.figlet_format", pyfiglet.figlet_format,
+        text, font=font, width=width, justify=justify
+    )
+
+
+def load_prerendered():
+    """Load the banners shipped in PRERENDERED_FILE into memory."""
+    global _prerendered_loaded
+    _prerendered_loaded = True
+    try:
+        with open(PRERENDERED_FILE, encoding="utf-8") as file:
+            entries = json.load(file)
+    except (OSError, ValueError):
+        return
+
+    for text, font, width, justify, banner in entries:
+        _memory_cache.setdefault((text, font, width, justify), banner)
+
+
+def bind_cache_dir(directory):
+    """Give the calling thread its own disk cache, or None to unbind."""
+    _local.directory = directory
+
+
+def cache_path(key):
+    """Return the on-disk cache file of a banner key."""
+    directory = (
+        getattr(_local, "directory", None)
+        or os.environ.get(CACHE_DIR_ENV)
+        or DEFAULT_CACHE_DIR
+    )
+    digest = hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()
+    return os.path.join(directory, f"{digest}.txt")
+
+
+def save_to_disk(path, banner):
+    """Store a rendered banner; failures only cost a re-render later."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(banner)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def prerender(path=PRERENDERED_FILE):
+    """Render STATIC_BANNERS and write them to path."""
+    entries = [
+        [*key, figlet_render(*key)] for key in STATIC_BANNERS
+    ]
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(entries, file, indent=1)
+    return len(entries)
+
+
+if __name__ == "__main__":
+    # Run as part of installing: python -m mekus.banners
+    print(f"Pre-rendered {prerender()} banners to {PRERENDERED_FILE}")
@@ -0,0 +1,509 @@
+import builtins  # Standard library
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from . import driver, figlet_tables, screen
+from .banners import figlet_render, render_banner
+
+# Stored results compared against by default
+BASELINE_FILE = os.path.join(
+    os.path.dirname(__file__), "benchmark_baselines.json"
+)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A result slower than baseline * threshold is a regression
+DEFAULT_THRESHOLD = 1.3
+# Whole-process timings are noisier than in-process loops
+PROCESS_THRESHOLD = 1.6
+
+# Each in-process benchmark loops for about TARGET_SECONDS per repeat
+# and reports the fastest repeat
+TARGET_SECONDS = 0.2
+REPEATS = 5
+PROCESS_RUNS = 7
+
+# used_pokemon_ids fill levels measured for generate_unique_pokemon_id
+POKEMON_FILL_LEVELS = (0, 50, 90, 99)
+
+# Rows per batch in the stats.* benchmarks
+STATS_BATCH_ROWS = 1_000_000
+
+# Idle sessions built to measure memory per session, and the most one
+# may hold: 100,000 of them then fit in about 256 MB
+MEMORY_SESSIONS = 1000
+SESSION_BYTES_TARGET = 2560
+
+# Registered benchmarks: name -> (setup, threshold)
+BENCHMARKS = {}
+
+
+def benchmark(name, threshold=DEFAULT_THRESHOLD):
+    """Register a setup function returning the callable to time."""
+    def register(setup):
+        BENCHMARKS[name] = (setup, threshold)
+        return setup
+    return register
+
+
+class NullStream(io.TextIOBase):
+    """Text stream that discards everything, standing in for a terminal."""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        return len(text)
+
+
+@contextlib.contextmanager
+def offline_console():
+    """Discard output and answer every input() with an empty line."""
+    saved_input, saved_stdout = builtins.input, sys.stdout
+    builtins.input = lambda prompt="": ""
+    sys.stdout = screen.FrameRenderer(NullStream())
+    try:
+        yield
+    finally:
+        builtins.input, sys.stdout = saved_input, saved_stdout
+
+
+def offline_pokemon_game():
+    """Return a PokemonGame; its data comes from the local shared table."""
+    from .olazo import PokemonGame
+
+    game = PokemonGame()
+    game.player_name = "Bench"
+    return game
+
+
+def time_callable(function):
+    """Return the fastest per-call time of function, in seconds."""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - started
+        if elapsed >= TARGET_SECONDS / 10 or loops >= 1 << 24:
+            break
+        loops *= 10
+    loops = max(1, int(loops * TARGET_SECONDS / max(elapsed, 1e-9)))
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best
+
+
+def time_process(arguments, stdin=b""):
+    """Return the median wall time of a fresh Python process."""
+    command = [sys.executable] + arguments
+    environment = dict(os.environ, TERM="dumb")
+    runs = []
+    for _ in range(PROCESS_RUNS):
+        started = time.perf_counter()
+        subprocess.run(
+            command, input=stdin, capture_output=True, check=True,
+            cwd=PROJECT_ROOT, env=environment
+        )
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs)
+
+
+@benchmark("pokemon.create_silhouette")
+def bench_create_silhouette():
+    game = offline_pokemon_game()
+    ascii_art = game.pokedex.ascii(6)
+    return lambda: game.create_silhouette(ascii_art)
+
+
+@benchmark("pokemon.display_round_state")
+def bench_display_round_state():
+    game = offline_pokemon_game()
+    with offline_console():
+        game.setup_round()
+    return game.display_round_state
+
+
+def make_fill_benchmark(percent):
+    def setup():
+        from .olazo import DIFFICULTIES
+
+        game = offline_pokemon_game()
+        max_id = DIFFICULTIES[game.difficulty]["MAX_POKEMON"]
+        used = set(range(1, int(max_id * percent / 100) + 1))
+        game.used_pokemon_ids = used
+        return game.generate_unique_pokemon_id
+    return setup
+
+
+for _percent in POKEMON_FILL_LEVELS:
+    benchmark(f"pokemon.generate_unique_pokemon_id[{_percent}%]")(
+        make_fill_benchmark(_percent)
+    )
+
+
+@benchmark("rps.determine_winner")
+def bench_determine_winner():
+    from .serohijos import RockPaperScissors
+
+    game = RockPaperScissors()
+    rounds = [(user, computer) for user in game.choices
+              for computer in game.choices]
+
+    def run():
+        for user, computer in rounds:
+            game.determine_winner(user, computer)
+    return run
+
+
+@benchmark("nba._attempt_shot")
+def bench_attempt_shot():
+    from .agulto import NBA2K25
+
+    game = NBA2K25()
+
+    def run():
+        game.stamina = 100
+        game.shoot()
+    return run
+
+
+@benchmark("stats.wilson_intervals[1M]")
+def bench_wilson_intervals():
+    import numpy as np
+
+    from . import stats
+
+    generator = np.random.default_rng(0)
+    trials = generator.integers(0, 50, STATS_BATCH_ROWS)
+    successes = generator.binomial(trials, 0.4)
+    return lambda: stats.wilson_intervals(successes, trials)
+
+
+@benchmark("rng.randint")
+def bench_rng_randint():
+    from .randomness import SessionRandom
+
+    source = SessionRandom(0)
+    return lambda: source.randint(1, 100)
+
+
+@benchmark("rng.randint[record]")
+def bench_rng_randint_record():
+    from .randomness import SessionRandom
+
+    source = SessionRandom(0, record=True)
+
+    def run():
+        source.randint(1, 100)
+        if len(source.draws) > 1_000_000:
+            del source.draws[:]  # Keep the log from growing unbounded
+    return run
+
+
+@benchmark("banner.figlet_format")
+def bench_figlet_format():
+    import pyfiglet
+
+    return lambda: pyfiglet.figlet_format("NBA 2K25", font="slant")
+
+
+@benchmark("banner.compiled_tables")
+def bench_compiled_tables():
+    figlet_tables.load_font("slant")
+    return lambda: figlet_render("NBA 2K25", "slant", 80, "auto")
+
+
+@benchmark("banner.render_banner")
+def bench_render_banner():
+    render_banner("NBA 2K25", font="slant")
+    return lambda: render_banner("NBA 2K25", font="slant")
+
+
+def make_redraw_benchmark(build, entry):
+    """Time drawing a module's menu frame, up to its first prompt."""
+    def setup():
+        instance = build()
+        return lambda: driver.run_session(lambda: instance, [], entry)
+    return setup
+
+
+def build_main_menu():
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    from main import MekusModules
+
+    return MekusModules()
+
+
+def build_agulto():
+    from .agulto import NBA2K25
+
+    return NBA2K25()
+
+
+def build_dazo():
+    from .dazo import MobileLegendsStats
+
+    return MobileLegendsStats()
+
+
+def build_jundam():
+    from .jundam import ValorantOps
+    from .valorant_profiles import ProfileStore
+
+    # Removed with the rest of the driver's state at exit
+    store = ProfileStore(os.path.join(driver.state_root(), "bench"))
+    return ValorantOps(codename="Bench", profile_store=store)
+
+
+def build_serohijos():
+    from .serohijos import RockPaperScissors
+
+    return RockPaperScissors()
+
+
+# Menu loops redrawn by the redraw.* benchmarks: name -> (build, entry)
+MENU_BUILDERS = {
+    "main": (build_main_menu, "main"),
+    "agulto": (build_agulto, "menu"),
+    "dazo": (build_dazo, "menu"),
+    "jundam": (build_jundam, "menu"),
+    "olazo": (offline_pokemon_game, "menu"),
+    "serohijos": (build_serohijos, "menu")
+}
+
+for _name, (_build, _entry) in MENU_BUILDERS.items():
+    benchmark(f"redraw.{_name}")(make_redraw_benchmark(_build, _entry))
+
+
+@benchmark("startup.import_main", PROCESS_THRESHOLD)
+def bench_import_main():
+    return lambda: time_process(["-c", "import main"])
+
+
+@benchmark("startup.first_menu", PROCESS_THRESHOLD)
+def bench_first_menu():
+    return lambda: time_process(["main.py"], stdin=b"0\n")
+
+
+def build_session(profile_dir):
+    """
+    Return a main menu session with every module opened, as a server
+    session holding all five games would be.
+    """
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    from main import MekusModules
+
+    from .agulto import NBA2K25
+    from .dazo import MobileLegendsStats
+    from .jundam import ValorantOps
+    from .olazo import PokemonGame
+    from .randomness import SessionRandom
+    from .serohijos import RockPaperScissors
+    from .valorant_profiles import ProfileStore
+
+    rng = SessionRandom()
+    session = MekusModules()
+    session.modules = {
+        "1": NBA2K25(rng=rng),
+        "2": MobileLegendsStats(),
+        "3": ValorantOps(
+            codename="Bench", profile_store=ProfileStore(profile_dir)
+        ),
+        "4": PokemonGame(rng=rng),
+        "5": RockPaperScissors(rng=rng)
+    }
+    return session
+
+
+def session_bytes(count=MEMORY_SESSIONS):
+    """
+    Return the memory one idle session holds, in bytes.
+
+    One session is built first, so imports, the agent profile and the
+    tables every session shares are not counted.
+    """
+    import tempfile
+    import tracemalloc
+
+    with offline_console(), tempfile.TemporaryDirectory(
+        prefix="mekus-bench-"
+    ) as profile_dir:
+        build_session(profile_dir)
+        tracemalloc.start()
+        try:
+            sessions = [build_session(profile_dir) for _ in range(count)]
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+    return size / len(sessions)
+
+
+def run_benchmarks(names=None):
+    """
+    Run the registered benchmarks offline.
+
+    Parameters:
+        names (list): Benchmark names or name prefixes; all if None.
+
+    Returns:
+        dict: Benchmark name -> seconds per call.
+    """
+    results = {}
+    for name, (setup, _) in BENCHMARKS.items():
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+        with offline_console():
+            function = setup()
+            if name.startswith("startup."):
+                results[name] = function()
+            else:
+                results[name] = time_callable(function)
+    return results
+
+
+def current_commit():
+    """Return the checked-out git commit, or None outside a repository."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def save_results(results, path):
+    """
+    Store results with the commit and interpreter they came from.
+
+    Entries already in path that were not measured again are kept, so
+    a run of some prefixes only updates those. "commits" records the
+    commit every entry was measured at; "commit" is the latest one.
+    """
+    try:
+        saved = load_results(path)
+    except (OSError, ValueError):
+        saved = {}
+    commit = current_commit()
+    commits = saved.get("commits", {})
+    commits.update(dict.fromkeys(results, commit))
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({
+            "commit": commit,
+            "commits": commits,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": dict(saved.get("results", {}), **results)
+        }, file, indent=1, sort_keys=True)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare(results, baseline):
+    """
+    Compare results with a stored baseline.
+
+    Returns:
+        list: (name, baseline seconds or None, seconds, ratio or None,
+        regressed) per benchmark, in results order.
+    """
+    rows = []
+    stored = baseline.get("results", {})
+    for name, seconds in results.items():
+        threshold = BENCHMARKS.get(name, (None, DEFAULT_THRESHOLD))[1]
+        before = stored.get(name)
+        ratio = seconds / before if before else None
+        regressed = ratio is not None and ratio > threshold
+        rows.append((name, before, seconds, ratio, regressed))
+    return rows
+
+
+def format_time(seconds):
+    """Format a duration with a readable unit."""
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(arguments):
+    """
+    Usage: python -m mekus.benchmarks [--save PATH] [--baseline PATH]
+    [PREFIX...]
+
+    Runs the benchmarks (optionally only names starting with a PREFIX),
+    compares them with the baseline, and exits with 1 on a regression.
+    --save writes the results, e.g. to compare two commits or, with
+    --save mekus/benchmark_baselines.json, to update the baseline;
+    entries of benchmarks that were not run are kept.
+    Without a PREFIX, or with the PREFIX "memory", the memory of an
+    idle session is also checked against SESSION_BYTES_TARGET.
+    """
+    options = {"--save": None, "--baseline": BASELINE_FILE}
+    names = []
+    arguments = list(arguments)
+    while arguments:
+        argument = arguments.pop(0)
+        if argument in options:
+            options[argument] = arguments.pop(0)
+        elif argument.startswith("-"):
+            print(main.__doc__)
+            return 2
+        else:
+            names.append(argument)
+
+    results = run_benchmarks(names)
+    try:
+        baseline = load_results(options["--baseline"])
+    except (OSError, ValueError):
+        baseline = {}
+
+    print(f"Baseline: {baseline.get('commit') or 'none'}, "
+          f"current: {current_commit() or 'unknown'}\n")
+    print(f"{'Benchmark':<44}{'Baseline':>11}{'Current':>11}{'Ratio':>8}")
+    regressions = 0
+    for name, before, seconds, ratio, regressed in compare(
+        results, baseline
+    ):
+        ratio_text = f"{ratio:.2f}x" if ratio is not None else "-"
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<44}{format_time(before):>11}"
+              f"{format_time(seconds):>11}{ratio_text:>8}{flag}")
+        regressions += regressed
+
+    if not names or "memory" in names:
+        size = session_bytes()
+        over = size > SESSION_BYTES_TARGET
+        print(f"\nIdle session: {size:,.0f} bytes "
+              f"(target {SESSION_BYTES_TARGET:,})"
+              f"{'  REGRESSION' if over else ''}")
+        regressions += over
+
+    if options["--save"]:
+        save_results(results, options["--save"])
+        print(f"\nSaved results to {options['--save']}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
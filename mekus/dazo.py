@@ -1,22 +1,43 @@
-import os  # Standard library
-
-import pyfiglet  # Third-party library
+from . import log_tail, metrics, screen, stats
+from .banners import render_banner
 
 WIN = "win"
 LOSS = "loss"
 
+# Columns of a match log: one row per finished match
+MATCH_LOG_COLUMNS = ("kills", "deaths", "assists", "result")
+# Totals a match log adds to; kept with its read offsets
+LOG_TOTALS = ("kills", "deaths", "assists", "matches_played", "wins")
+LOG_FOLLOWER_NAME = "mobile-legends"
+
 MENU_CHOICES = {
     "1": "Enter Match Stats (Kills/Deaths/Assists)",
     "2": "Calculate Overall KDA",
     "3": "Log Match Outcome (Win/Loss)",
     "4": "View Win Rate",
     "5": "View Full Match Summary",
+    "6": "Follow Match Logs",
     "0": "Exit Module"
 }
 
+# Menu choice -> name of the method it runs
+MENU_ACTIONS = {
+    "1": "enter_match_stats",
+    "2": "calculate_kda",
+    "3": "log_match_outcome",
+    "4": "view_win_rate",
+    "5": "view_summary",
+    "6": "follow_match_logs"
+}
+
 class MobileLegendsStats:
     """A class to track and display Mobile Legends player statistics."""
 
+    __slots__ = (
+        "codename", "kills", "deaths", "assists", "matches_played", "wins",
+        "log_follower", "followed_totals"
+    )
+
     def __init__(self):
         """Initialize player stats with default values."""
         self.codename = "Dazo"
@@ -25,10 +46,13 @@ class MobileLegendsStats:
         self.assists = 0
         self.matches_played = 0
         self.wins = 0
+        self.log_follower = None  # Followed match logs, once opened
+        # The part of the totals above that came from match logs
+        self.followed_totals = {}
 
     def clear_screen(self):
-        """Clear the terminal screen based on the operating system."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen."""
+        screen.clear_screen()
 
     def enter_match_stats(self):
         """
@@ -67,11 +91,14 @@ class MobileLegendsStats:
         self.clear_screen()
         print("--- KDA Calculation ---\n")
 
-        if self.deaths == 0:
+        kda_ratio = stats.kda(self.kills, self.deaths, self.assists)
+        if stats.is_undefined(kda_ratio):
+            print("No match stats recorded yet.")
+            return
+        if not stats.is_finite(kda_ratio):
             print("KDA Ratio: ∞ (Perfect record!)")
             return
 
-        kda_ratio = (self.kills + self.assists) / self.deaths
         print(f"Overall KDA Ratio: {kda_ratio:.2f}")
 
     def log_match_outcome(self):
@@ -100,11 +127,11 @@ class MobileLegendsStats:
         self.clear_screen()
         print("--- Win Rate ---\n")
 
-        if self.matches_played == 0:
+        win_rate = stats.percentage(self.wins, self.matches_played)
+        if not stats.is_finite(win_rate):
             print("No matches logged yet.")
             return
 
-        win_rate = (self.wins / self.matches_played) * 100
         print(
             f"Win Rate: {win_rate:.2f}% "
             f"({self.wins} out of {self.matches_played} matches)"
@@ -112,16 +139,13 @@ class MobileLegendsStats:
 
     def print_kda_summary(self):
         """Display a short KDA summary in the match summary view."""
-        if self.deaths == 0:
-            print("KDA Ratio       : ∞")
-        else:
-            kda_ratio = (self.kills + self.assists) / self.deaths
-            print(f"KDA Ratio       : {kda_ratio:.2f}")
+        kda_ratio = stats.kda(self.kills, self.deaths, self.assists)
+        print(f"KDA Ratio       : {stats.format_ratio(kda_ratio)}")
 
     def print_win_rate_summary(self):
         """Display a short win rate summary in the match summary view."""
-        if self.matches_played > 0:
-            win_rate = (self.wins / self.matches_played) * 100
+        win_rate = stats.percentage(self.wins, self.matches_played)
+        if stats.is_finite(win_rate):
             print(f"Win Rate        : {win_rate:.2f}%")
 
     def display_totals(self):
@@ -136,15 +160,120 @@ class MobileLegendsStats:
     def view_summary(self):
         """Display a full summary of all tracked stats."""
         self.clear_screen()
+        self.poll_logs()
         print("--- Full Match Summary ---\n")
         self.display_totals()
         self.print_win_rate_summary()
         self.print_kda_summary()
 
+    def attach_log_follower(self, paths):
+        """
+        Return the match log follower, adding paths to it.
+
+        The first time, the totals already read from the logs (saved
+        with their read offsets) are added to the live totals, less what
+        they already include, e.g. from before the game was suspended.
+        """
+        if self.log_follower is not None:
+            self.log_follower.add_paths(paths)
+            return self.log_follower
+
+        follower = log_tail.LogFollower(LOG_FOLLOWER_NAME, paths)
+        for field in LOG_TOTALS:
+            added = (
+                follower.totals.get(field, 0)
+                - self.followed_totals.get(field, 0)
+            )
+            setattr(self, field, getattr(self, field) + added)
+        # ingest_match_log() updates both from here on
+        self.followed_totals = follower.totals
+        self.log_follower = follower
+        return follower
+
+    def ingest_match_log(self, path, header, rows):
+        """
+        Fold newly appended match log rows into the totals.
+
+        The rows are summed first and the totals updated once, so a log
+        without the expected columns changes nothing.
+
+        Returns:
+            int: Rows skipped for missing columns or non-integer counts.
+        """
+        missing = [
+            column for column in MATCH_LOG_COLUMNS if column not in header
+        ]
+        if missing:
+            raise ValueError(f"{path} has no {', '.join(missing)} column")
+        columns = [header.index(column) for column in MATCH_LOG_COLUMNS]
+        kills, deaths, assists, result = columns
+        width = max(columns) + 1
+
+        added = dict.fromkeys(LOG_TOTALS, 0)
+        skipped = 0
+        for row in rows:
+            if len(row) < width:
+                skipped += 1
+                continue
+            try:
+                counts = [
+                    int(row[column] or 0)
+                    for column in (kills, deaths, assists)
+                ]
+            except ValueError:
+                skipped += 1
+                continue
+            added["kills"] += counts[0]
+            added["deaths"] += counts[1]
+            added["assists"] += counts[2]
+            added["matches_played"] += 1
+            added["wins"] += row[result].strip().lower() == WIN
+
+        totals = self.log_follower.totals
+        for field, value in added.items():
+            setattr(self, field, getattr(self, field) + value)
+            totals[field] = totals.get(field, 0) + value
+        return skipped
+
+    def poll_logs(self):
+        """Catch up on followed match logs, if any."""
+        if self.log_follower is None:
+            return
+        try:
+            _, skipped = log_tail.catch_up(
+                self.log_follower, self.ingest_match_log
+            )
+        except (OSError, ValueError) as error:
+            print(f"Could not read match logs: {error}\n")
+            return
+        if skipped:
+            print(f"Skipped {skipped} malformed match log row(s).\n")
+
+    def follow_match_logs(self):
+        """Tail match logs, showing the summary live until Enter."""
+        self.clear_screen()
+        text = input(
+            "Match logs to follow (comma-separated, blank for last): "
+        )
+        try:
+            paths = log_tail.parse_paths(text)
+        except ValueError as error:
+            print(f"Could not follow match logs: {error}")
+            return
+        follower = self.attach_log_follower(paths)
+        if not follower.files:
+            print("No log files to follow.")
+            return
+
+        try:
+            log_tail.follow(follower, self.ingest_match_log, self.view_summary)
+        except (OSError, ValueError) as error:
+            print(f"Could not follow match logs: {error}")
+
     def display_menu(self):
         """Display the main menu with formatted title and menu choices."""
         self.clear_screen()
-        title = pyfiglet.figlet_format("ML STATS", font="slant")
+        title = render_banner("ML STATS", font="slant")
         print(title)
         print(f"Legend: {self.codename}\n")
 
@@ -153,22 +282,14 @@ class MobileLegendsStats:
 
     def handle_user_choice(self, choice):
         """Execute the appropriate action based on the user's menu choice."""
-        actions = {
-            "1": self.enter_match_stats,
-            "2": self.calculate_kda,
-            "3": self.log_match_outcome,
-            "4": self.view_win_rate,
-            "5": self.view_summary
-        }
-
         if choice == "0":
             print("\nSee you next game, Legend!")
             return False
 
-        action = actions.get(choice)
+        action = MENU_ACTIONS.get(choice)
 
         if action is not None:
-            action()
+            metrics.call_handler(getattr(self, action))
         else:
             print("Invalid choice. Try again.")
 
@@ -0,0 +1,299 @@
+import atexit  # Standard library
+import builtins
+import importlib
+import io
+import itertools
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from . import banners, log_tail, randomness, screen, valorant_profiles
+from .screen import FrameRenderer
+
+# Target of a session: "module:Class" or "module:Class.method"; modules
+# of the project root, like main, are found wherever the driver runs
+DEFAULT_ENTRY = "menu"
+DEFAULT_TARGET = "main:MekusModules.main"
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Latency percentiles reported for a batch of sessions
+LATENCY_PERCENTILES = (50, 90, 99)
+
+# Driver sessions keep profiles and banners under one directory per
+# process; see state_root()
+_state_root = None
+_session_numbers = itertools.count()
+
+
+class ScriptExhausted(EOFError):
+    """Raised by the scripted input() once every line has been used."""
+
+
+class Step:
+    """One scripted input and the screen output that preceded it.
+
+    output is everything printed since the previous input, i.e. the
+    frame the user answered; seconds is how long the code took to
+    produce it. The last step of a finished session has line None.
+    """
+
+    def __init__(self, line, output, seconds):
+        self.line = line
+        self.output = output
+        self.seconds = seconds
+
+
+class SessionResult:
+    """Outcome of one headless session."""
+
+    def __init__(self, steps, completed, error, source):
+        self.steps = steps
+        self.completed = completed  # True if the loop returned by itself
+        self.error = error  # Unexpected exception, or None
+        self.source = source  # The session's recording SessionRandom
+
+    @property
+    def draw_log(self):
+        """Return every random draw as a log; see run_session()."""
+        return self.source.to_bytes()
+
+    @property
+    def frames(self):
+        """Return the output of every step, in order."""
+        return [step.output for step in self.steps]
+
+    @property
+    def latencies(self):
+        """Return every step's latency in seconds."""
+        return [step.seconds for step in self.steps]
+
+    @property
+    def total_seconds(self):
+        return sum(self.latencies)
+
+
+class ScriptedConsole:
+    """Scripted replacement for input() and sys.stdout.
+
+    Frames are composed by a non-terminal FrameRenderer over an
+    in-memory stream, so clear_screen() and colored output behave
+    exactly as they do when the output is piped.
+    """
+
+    def __init__(self, script):
+        self.lines = iter(script)
+        self.stream = io.StringIO()
+        self.renderer = FrameRenderer(self.stream)
+        self.steps = []
+        self.started = time.perf_counter()
+
+    def input(self, prompt=""):
+        """Stand-in for builtins.input that returns the next line."""
+        self.renderer.write(str(prompt))
+        self.renderer.flush()
+        line = next(self.lines, None)
+        self.end_step(line)
+        if line is None:
+            raise ScriptExhausted("Script has no more input")
+        return line
+
+    def wait_for_line(self, seconds):
+        """Stand-in for screen.wait_for_line: the next line comes at once."""
+        return self.input()
+
+    def end_step(self, line):
+        """Record the output produced since the previous input."""
+        finished = time.perf_counter()
+        self.steps.append(
+            Step(line, self.stream.getvalue(), finished - self.started)
+        )
+        self.stream.seek(0)
+        self.stream.truncate()
+        # Time spent by the driver itself is not charged to the next step
+        self.started = time.perf_counter()
+
+
+def load_target(target):
+    """
+    Resolve a target string to a class and the name of its entry method.
+
+    Parameters:
+        target (str): "module:Class" or "module:Class.method", for
+            example "mekus.agulto:NBA2K25" or "main:MekusModules.main".
+
+    Returns:
+        tuple: (class, entry method name)
+    """
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    module_name, _, attribute = target.partition(":")
+    class_name, _, entry = attribute.partition(".")
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name), entry or DEFAULT_ENTRY
+
+
+def state_root():
+    """
+    Return this process's temporary directory for driver sessions.
+
+    Banners rendered by any session are cached in its "banners"
+    folder. Every session gets its own numbered folder for its profile
+    store and followed-log state, which is only created if the session
+    saves one. The directory is removed when the process exits.
+    """
+    global _state_root
+    if _state_root is None:
+        _state_root = tempfile.mkdtemp(prefix="mekus-driver-")
+        atexit.register(shutil.rmtree, _state_root, True)
+    return _state_root
+
+
+def run_session(factory, script, entry=DEFAULT_ENTRY, seed=None,
+                replay=None):
+    """
+    Run one menu loop headlessly on a scripted input stream.
+
+    The session ends when the loop returns, or when the script runs out
+    (input() then raises ScriptExhausted, an EOFError, like a closed
+    stdin would). Every session starts from an empty profile store and
+    followed-log state, and banners are cached under state_root(), so
+    the user's ~/.mekus is never touched.
+
+    Parameters:
+        factory (callable): Builds the object whose loop is run, e.g. a
+            module class.
+        script (list): Input lines, without newlines.
+        entry (str): Name of the loop method to call.
+        seed (int): Seeds the session's random source; random if None.
+        replay (bytes): A draw_log from an earlier result; every random
+            outcome is replayed from it instead of being drawn.
+
+    Returns:
+        SessionResult: Output frames, per-step latency and draw log.
+    """
+    if replay is not None:
+        source = randomness.replay_source(replay, record=True)
+    else:
+        source = randomness.SessionRandom(seed, record=True)
+
+    console = ScriptedConsole(script)
+    root = state_root()
+    session_dir = os.path.join(root, str(next(_session_numbers)))
+    saved_input, saved_stdout = builtins.input, sys.stdout
+    builtins.input, sys.stdout = console.input, console.renderer
+    randomness.bind(source)
+    screen.bind_line_source(console.wait_for_line)
+    banners.bind_cache_dir(os.path.join(root, "banners"))
+    log_tail.bind_state_dir(os.path.join(session_dir, "tail"))
+    valorant_profiles.bind(
+        valorant_profiles.ProfileStore(os.path.join(session_dir, "profiles"))
+    )
+    completed, error = False, None
+    try:
+        getattr(factory(), entry)()
+        completed = True
+    except ScriptExhausted:
+        pass
+    except Exception as exception:
+        error = exception
+    finally:
+        builtins.input, sys.stdout = saved_input, saved_stdout
+        randomness.bind(None)
+        screen.bind_line_source(None)
+        banners.bind_cache_dir(None)
+        log_tail.bind_state_dir(None)
+        valorant_profiles.bind(None)
+
+    if completed or error is not None:
+        console.renderer.flush()
+        console.end_step(None)
+    return SessionResult(console.steps, completed, error, source)
+
+
+def run_sessions(factory, scripts, entry=DEFAULT_ENTRY, seed=None):
+    """Run run_session once per script; seeds count up from seed."""
+    return [
+        run_session(
+            factory, script, entry,
+            None if seed is None else seed + number
+        )
+        for number, script in enumerate(scripts)
+    ]
+
+
+def load_script(path):
+    """Read a recorded session: one input line per file line."""
+    with open(path, encoding="utf-8") as file:
+        return file.read().splitlines()
+
+
+def latency_summary(results):
+    """
+    Summarize step latencies over a batch of sessions.
+
+    Returns:
+        dict: "sessions", "steps", "errors" and "completed" counts, plus
+        "p50"/"p90"/"p99" and "max" step latency in milliseconds.
+    """
+    latencies = sorted(
+        seconds * 1000 for result in results for seconds in result.latencies
+    )
+    summary = {
+        "sessions": len(results),
+        "steps": len(latencies),
+        "completed": sum(result.completed for result in results),
+        "errors": sum(result.error is not None for result in results)
+    }
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        for percentile in LATENCY_PERCENTILES:
+            summary[f"p{percentile}"] = cuts[percentile - 1]
+    if latencies:
+        summary["max"] = latencies[-1]
+    return summary
+
+
+def main(arguments):
+    """Replay script files against a target and print latency stats."""
+    if not arguments:
+        print(
+            "Usage: python -m mekus.driver [module:Class[.method]] "
+            "SCRIPT... [--repeat N]"
+        )
+        return 2
+
+    repeat = 1
+    if "--repeat" in arguments:
+        position = arguments.index("--repeat")
+        repeat = int(arguments[position + 1])
+        del arguments[position:position + 2]
+
+    target = DEFAULT_TARGET
+    if ":" in arguments[0]:
+        target = arguments.pop(0)
+    factory, entry = load_target(target)
+    scripts = [load_script(path) for path in arguments] * repeat
+
+    started = time.perf_counter()
+    results = run_sessions(factory, scripts, entry, seed=0)
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        if result.error is not None:
+            print(f"Session error: {result.error!r}")
+            break
+    summary = latency_summary(results)
+    print(f"{target}: {len(results) / elapsed:,.0f} sessions/s")
+    for key, value in summary.items():
+        if isinstance(value, float):
+            print(f"  {key}: {value:.3f} ms")
+        else:
+            print(f"  {key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
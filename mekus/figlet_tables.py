@@ -0,0 +1,326 @@
+import os  # Standard library
+import pickle
+
+# Fonts the modules render text with
+PROJECT_FONTS = ("slant", "digital", "big", "smslant", "standard", "cosmic")
+
+# Compiled glyph tables shipped with the package
+TABLES_FILE = os.path.join(os.path.dirname(__file__), "figlet_fonts.pickle")
+TABLES_VERSION = 1
+
+# Smush mode bits, as defined by figlet
+SM_EQUAL = 1  # Smush equal chars (not hardblanks)
+SM_LOWLINE = 2  # Smush _ with any char in the hierarchy
+SM_HIERARCHY = 4  # Hierarchy: |, /\, [], {}, (), <>
+SM_PAIR = 8  # [ + ] -> |, { + } -> |, ( + ) -> |
+SM_BIGX = 16  # / + \ -> X, > + < -> X
+SM_HARDBLANK = 32  # Hardblank + hardblank -> hardblank
+SM_KERN = 64
+SM_SMUSH = 128
+
+LOWLINE_RULES = (("_", r"|/\[]{}()<>"),)
+HIERARCHY_RULES = (
+    ("|", r"/\[]{}()<>"),
+    (r"\/", "[]{}()<>"),
+    ("[]", "{}()<>"),
+    ("{}", "()<>"),
+    ("()", "<>"),
+)
+
+LEFT_TO_RIGHT = "left-to-right"
+RIGHT_TO_LEFT = "right-to-left"
+
+# Tables loaded in this process
+_fonts = {}
+
+
+class GlyphFont:
+    """A parsed figlet font: header values plus a glyph per code point."""
+
+    def __init__(
+        self, height, hard_blank, print_direction, smush_mode, glyphs
+    ):
+        self.height = height
+        self.hard_blank = hard_blank
+        self.print_direction = print_direction
+        self.smush_mode = smush_mode
+        self.glyphs = glyphs  # Code point -> (width, rows)
+
+
+def compile_fonts(fonts=PROJECT_FONTS, path=TABLES_FILE):
+    """Parse fonts once with pyfiglet and pickle their glyph tables."""
+    import pyfiglet  # Only needed when (re)building the tables
+
+    tables = {}
+    for name in fonts:
+        font = pyfiglet.FigletFont(name)
+        tables[name] = (
+            font.height,
+            font.hardBlank,
+            font.printDirection,
+            font.smushMode,
+            {
+                code: (font.width[code], tuple(rows))
+                for code, rows in font.chars.items()
+            }
+        )
+
+    with open(path, "wb") as file:
+        pickle.dump((TABLES_VERSION, tables), file, pickle.HIGHEST_PROTOCOL)
+    return len(tables)
+
+
+def load_font(name):
+    """Return the compiled GlyphFont for a project font."""
+    font = _fonts.get(name)
+    if font is not None:
+        return font
+
+    with open(TABLES_FILE, "rb") as file:
+        version, tables = pickle.load(file)
+    if version != TABLES_VERSION:
+        raise ValueError(f"Outdated font tables in {TABLES_FILE}")
+
+    for font_name, table in tables.items():
+        _fonts.setdefault(font_name, GlyphFont(*table))
+    if name not in _fonts:
+        raise KeyError(f"Font not compiled: {name}")
+    return _fonts[name]
+
+
+def has_font(name):
+    """Return True if a font is available in the compiled tables."""
+    try:
+        load_font(name)
+    except (OSError, KeyError, ValueError):
+        return False
+    return True
+
+
+def render(text, font="standard", width=80, justify="auto", direction="auto"):
+    """
+    Render text exactly like pyfiglet.figlet_format, from compiled tables.
+
+    Raises ValueError when a single character is wider than width.
+    """
+    glyph_font = load_font(font)
+    if direction == "auto":
+        direction = (
+            RIGHT_TO_LEFT if glyph_font.print_direction == 1
+            else LEFT_TO_RIGHT
+        )
+    if justify == "auto":
+        justify = "right" if direction == RIGHT_TO_LEFT else "left"
+
+    builder = _Builder(text, glyph_font, direction, width)
+    while builder.position < len(builder.text):
+        builder.add_char()
+        builder.position += 1
+    return builder.result(justify)
+
+
+class _Builder:
+    """Line-wrapping and smushing state for one render() call.
+
+    Mirrors pyfiglet's FigletBuilder step for step so the output is
+    byte-identical, including its wrapping quirks.
+    """
+
+    def __init__(self, text, font, direction, width):
+        self.text = [ord(char) for char in text]
+        self.font = font
+        self.direction = direction
+        self.width = width
+
+        self.position = 0
+        self.max_smush = 0
+        self.cur_width = 0
+        self.prev_width = 0
+        self.blank_markers = []
+        self.lines = []
+        self.buffer = [""] * font.height
+
+    def glyph_at(self, position):
+        """Return (width, rows) of the glyph at position, or None."""
+        if 0 <= position < len(self.text):
+            return self.font.glyphs.get(self.text[position])
+        return None
+
+    def add_char(self):
+        code = self.text[self.position]
+        if code == 10:  # "\n"
+            self.blank_markers.append((list(self.buffer), self.position))
+            self.new_line()
+            return
+
+        glyph = self.glyph_at(self.position)
+        if glyph is None:
+            return
+        glyph_width, rows = glyph
+        if self.width < glyph_width:
+            raise ValueError("Width is not enough to print this character")
+
+        self.cur_width = glyph_width
+        self.max_smush = self.smush_amount(rows)
+        total_width = len(self.buffer[0]) + glyph_width - self.max_smush
+
+        if code == 32:  # " "
+            self.blank_markers.append((list(self.buffer), self.position))
+
+        if total_width >= self.width:
+            self.new_line()
+        else:
+            for row in range(self.font.height):
+                self.add_row(rows, row)
+
+        self.prev_width = self.cur_width
+
+    def add_row(self, rows, row):
+        left = self.buffer[row]
+        right = rows[row]
+        if self.direction == RIGHT_TO_LEFT:
+            left, right = right, left
+
+        for i in range(self.max_smush):
+            index = len(left) - self.max_smush + i
+            left_char = left[index] if 0 <= index < len(left) else ""
+            smushed = self.smush_chars(left_char, right[i])
+            if 0 <= index <= len(left):
+                chars = list(left)
+                chars[index] = smushed
+                left = "".join(chars)
+
+        self.buffer[row] = left + right[self.max_smush:]
+
+    def new_line(self):
+        if self.blank_markers:
+            saved_buffer, saved_position = self.blank_markers.pop()
+            self.lines.append(saved_buffer)
+            self.position = saved_position
+        else:
+            self.lines.append(self.buffer)
+            self.position -= 1
+
+        self.buffer = [""] * self.font.height
+        self.blank_markers = []
+        self.prev_width = 0
+        glyph = self.glyph_at(self.position)
+        if glyph is not None:
+            self.max_smush = self.smush_amount(glyph[1])
+
+    def smush_amount(self, rows):
+        font = self.font
+        if (font.smush_mode & (SM_SMUSH | SM_KERN)) == 0:
+            return 0
+
+        max_smush = self.cur_width
+        for row in range(font.height):
+            line_left = self.buffer[row]
+            line_right = rows[row]
+            if self.direction == RIGHT_TO_LEFT:
+                line_left, line_right = line_right, line_left
+
+            # Only ASCII spaces are stripped, to match figlet exactly
+            left_edge = max(len(line_left.rstrip(" ")) - 1, 0)
+            if left_edge < len(line_left):
+                left_char = line_left[left_edge]
+            else:
+                left_edge = 0
+                left_char = ""
+
+            right_edge = len(line_right) - len(line_right.lstrip(" "))
+            if right_edge < len(line_right):
+                right_char = line_right[right_edge]
+            else:
+                right_edge = len(line_right)
+                right_char = ""
+
+            amount = right_edge + len(line_left) - 1 - left_edge
+            if left_char == "" or left_char == " ":
+                amount += 1
+            elif (right_char != ""
+                    and self.smush_chars(left_char, right_char) is not None):
+                amount += 1
+
+            if amount < max_smush:
+                max_smush = amount
+        return max_smush
+
+    def smush_chars(self, left, right):
+        if left == " ":
+            return right
+        if right == " ":
+            return left
+
+        # No overlapping when either character is one column or less
+        if self.prev_width < 2 or self.cur_width < 2:
+            return None
+
+        mode = self.font.smush_mode
+        hard_blank = self.font.hard_blank
+        if (mode & SM_SMUSH) == 0:
+            return None
+
+        if (mode & 63) == 0:
+            # Universal overlapping prefers visible characters
+            if left == hard_blank:
+                return right
+            if right == hard_blank:
+                return left
+            return left if self.direction == RIGHT_TO_LEFT else right
+
+        if mode & SM_HARDBLANK and left == hard_blank == right:
+            return left
+        if left == hard_blank or right == hard_blank:
+            return None
+        if mode & SM_EQUAL and left == right:
+            return left
+
+        rules = ()
+        if mode & SM_LOWLINE:
+            rules += LOWLINE_RULES
+        if mode & SM_HIERARCHY:
+            rules += HIERARCHY_RULES
+        for weaker, stronger in rules:
+            if left in weaker and right in stronger:
+                return right
+            if right in weaker and left in stronger:
+                return left
+
+        if mode & SM_PAIR and (left + right in ("[]", "{}", "()")
+                               or right + left in ("[]", "{}", "()")):
+            return "|"
+
+        if mode & SM_BIGX:
+            if left == "/" and right == "\\":
+                return "|"
+            if right == "/" and left == "\\":
+                return "Y"
+            if left == ">" and right == "<":
+                return "X"
+        return None
+
+    def result(self, justify):
+        if self.buffer[0] != "":
+            self.lines.append(self.buffer)
+
+        output = []
+        for buffer in self.lines:
+            if justify == "right":
+                buffer = [
+                    " " * (self.width - len(line) - 1) + line
+                    for line in buffer
+                ]
+            elif justify == "center":
+                buffer = [
+                    " " * int((self.width - len(line)) / 2) + line
+                    for line in buffer
+                ]
+            text = "\n".join(buffer) + "\n"
+            output.append(text.replace(self.font.hard_blank, " "))
+        return "".join(output)
+
+
+if __name__ == "__main__":
+    # Run as part of installing: python -m mekus.figlet_tables
+    print(f"Compiled {compile_fonts()} fonts to {TABLES_FILE}")
@@ -1,6 +1,14 @@
-import os  # Standard library
-
-import pyfiglet  # Third-party library
+from . import log_tail, metrics, screen, stats, valorant_profiles
+from .banners import render_banner
+from .valorant_index import (
+    MatchIndex,
+    defusal_success,
+    headshot_accuracy,
+    kda_ratio,
+    plant_success,
+    win_rate
+)
+from .valorant_telemetry import LiveTelemetry, summarize_files
 
 # Dictionary of menu choices
 MENU_CHOICES = {
@@ -9,35 +17,101 @@ MENU_CHOICES = {
     "3": "Check Win Rate",
     "4": "Check Spike Plant Success",
     "5": "Check Bomb Defusal Success",
+    "6": "Record Match (Map/Weapon)",
+    "7": "View Map/Weapon Breakdown",
+    "8": "Switch Agent",
+    "9": "Import Round Telemetry",
+    "10": "Follow Telemetry Logs",
     "0": "Exit Program"
 }
 
+# Menu choice -> name of the method it runs
+MENU_ACTIONS = {
+    "1": "compute_kda",
+    "2": "calculate_headshot_accuracy",
+    "3": "evaluate_win_rate",
+    "4": "analyze_spike_plant_success",
+    "5": "check_bomb_defusal_success",
+    "6": "record_match",
+    "7": "view_breakdown",
+    "8": "switch_agent",
+    "9": "import_telemetry",
+    "10": "follow_telemetry"
+}
+
 class ValorantOps:
     """Handles Valorant statistics analysis for the agent."""
 
-    def __init__(self):
-        # Get agent's profile via user input
-        self.agent_codename = input("Enter your agent codename: ")
-        self.agent_rank = input("Enter your agent rank: ")
-        self.agent_main_weapon = input("Enter your main weapon: ")
-        self.agent_favorite_map = input("Enter your favorite map: ")
-
-        # Menu actions mapped to corresponding methods
-        self.actions = {
-            "1": self.compute_kda,
-            "2": self.calculate_headshot_accuracy,
-            "3": self.evaluate_win_rate,
-            "4": self.analyze_spike_plant_success,
-            "5": self.check_bomb_defusal_success
-        }
+    __slots__ = (
+        "profile_store", "agent_codename", "agent_rank", "agent_main_weapon",
+        "agent_favorite_map", "match_index", "log_followers", "live_telemetry"
+    )
+
+    def __init__(self, codename=None, profile_store=None):
+        """
+        Loads the agent profile, prompting only for unknown agents.
+
+        Parameters:
+            codename (str): Agent to load; defaults to the last agent used.
+            profile_store (ProfileStore): Where profiles are saved;
+                defaults to the thread's store (valorant_profiles.current).
+        """
+        self.profile_store = profile_store or valorant_profiles.current()
+        last_codename = self.profile_store.last_codename()
+        if codename is None:
+            codename = last_codename
+        while not codename:
+            codename = input("Enter your agent codename: ").strip()
+            if not codename:
+                print("Codename cannot be empty.")
+        self.load_profile(codename)
+        if codename != last_codename:
+            self.profile_store.remember(codename)
+
+        # Per-agent/map/weapon totals of every recorded match
+        self.match_index = MatchIndex()
+        # Agent codename -> its followed telemetry logs, kept for the
+        # session, and the matches they have added to match_index
+        self.log_followers = {}
+        self.live_telemetry = {}
+
+    def load_profile(self, codename):
+        """Loads a saved profile, or creates one from user input."""
+        profile = self.profile_store.load(codename)
+        if profile is None:
+            # New agent: ask for the rest of the profile once and save it
+            profile = {
+                "codename": codename,
+                "rank": input("Enter your agent rank: "),
+                "main_weapon": input("Enter your main weapon: "),
+                "favorite_map": input("Enter your favorite map: ")
+            }
+            self.profile_store.save(profile)
+
+        self.agent_codename = profile["codename"]
+        self.agent_rank = profile["rank"]
+        self.agent_main_weapon = profile["main_weapon"]
+        self.agent_favorite_map = profile["favorite_map"]
+
+    def switch_agent(self):
+        """Switches to another saved agent or registers a new one."""
+        self.clear_screen()
+        codename = input("Enter agent codename: ").strip()
+        if not codename:
+            print("Codename cannot be empty.")
+            return
+
+        self.load_profile(codename)
+        self.profile_store.remember(codename)
+        print(f"Now playing as {self.agent_codename.upper()}.")
 
     def clear_screen(self):
         """Clears the terminal screen for better readability."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        screen.clear_screen()
 
     def display_banner(self):
         """Displays the banner and agent profile."""
-        banner = pyfiglet.figlet_format("VALORANT STATS", font="slant")
+        banner = render_banner("VALORANT STATS", font="slant")
         print(banner)
         print(f"Agent Codename : {self.agent_codename.upper()}")
         print(f"Rank           : {self.agent_rank}")
@@ -63,13 +137,13 @@ class ValorantOps:
             print("Great job, Agent. Signing off...")
             return False
 
-        if choice not in self.actions:
+        if choice not in MENU_ACTIONS:
             print("Invalid option. Try again.")
             input("\nPress Enter to continue...")
             return True
 
         print("\n--- Result ---")
-        self.actions[choice]()
+        metrics.call_handler(getattr(self, MENU_ACTIONS[choice]))
         input("\nPress Enter to continue...")
         return True
 
@@ -84,11 +158,11 @@ class ValorantOps:
             print("Invalid input. Please enter numbers only.")
             return
 
-        if deaths == 0:
+        kda = stats.kda(kills, deaths, assists)
+        if not stats.is_finite(kda):
             print("\nKDA: No deaths, nice! You’re untouchable.")
             return
 
-        kda = (kills + assists) / deaths
         print(
             f"\nKDA Breakdown:\n"
             f" - Kills  : {kills}\n"
@@ -108,11 +182,11 @@ class ValorantOps:
             print("Please type numbers only.")
             return
 
-        if shots == 0:
+        accuracy = stats.percentage(headshots, shots)
+        if not stats.is_finite(accuracy):
             print("You didn't fire any shots.")
             return
 
-        accuracy = (headshots / shots) * 100
         print(f"Headshot Accuracy: {accuracy:.2f}%")
 
     def evaluate_win_rate(self):
@@ -125,11 +199,11 @@ class ValorantOps:
             print("Please type numbers only.")
             return
 
-        if games == 0:
+        rate = stats.percentage(wins, games)
+        if not stats.is_finite(rate):
             print("No games played yet.")
             return
 
-        rate = (wins / games) * 100
         print(f"Win Rate: {rate:.2f}%")
 
     def analyze_spike_plant_success(self):
@@ -142,11 +216,11 @@ class ValorantOps:
             print("Please type numbers only.")
             return
 
-        if tries == 0:
+        rate = stats.percentage(success, tries)
+        if not stats.is_finite(rate):
             print("You didn't try planting.")
             return
 
-        rate = (success / tries) * 100
         print(f"Spike Plant Success: {rate:.2f}%")
 
     def check_bomb_defusal_success(self):
@@ -159,13 +233,208 @@ class ValorantOps:
             print("Please type numbers only.")
             return
 
-        if attempts == 0:
+        success_rate = stats.percentage(defusals, attempts)
+        if not stats.is_finite(success_rate):
             print("No defusal attempts made.")
             return
 
-        success_rate = (defusals / attempts) * 100
         print(f"Bomb Defusal Success Rate: {success_rate:.2f}%")
 
+    def read_count(self, prompt):
+        """Prompt for a non-negative whole number; None if invalid."""
+        try:
+            value = int(input(prompt))
+        except ValueError:
+            return None
+        return value if value >= 0 else None
+
+    def record_match(self):
+        """Records one match tagged with agent, map and weapon."""
+        self.clear_screen()
+        map_name = input(
+            f"Enter map [{self.agent_favorite_map}]: "
+        ).strip() or self.agent_favorite_map
+        weapon = input(
+            f"Enter weapon [{self.agent_main_weapon}]: "
+        ).strip() or self.agent_main_weapon
+
+        prompts = {
+            "kills": "Enter kills: ",
+            "deaths": "Enter deaths: ",
+            "assists": "Enter assists: ",
+            "headshots": "Enter headshots: ",
+            "shots": "Enter total shots: ",
+            "plants": "Enter successful spike plants: ",
+            "plant_attempts": "Enter total plant attempts: ",
+            "defusals": "Enter successful defusals: ",
+            "defusal_attempts": "Enter total defusal attempts: "
+        }
+        counts = {}
+        for field, prompt in prompts.items():
+            counts[field] = self.read_count(prompt)
+            if counts[field] is None:
+                print("Please type whole numbers only.")
+                return
+
+        result = input("Did you win? (y/n): ").strip().lower()
+        if result not in ("y", "n"):
+            print("Please answer 'y' or 'n'.")
+            return
+        counts["wins"] = 1 if result == "y" else 0
+
+        self.match_index.record(
+            self.agent_codename, map_name, weapon, counts
+        )
+        print(f"Match on {map_name} with {weapon} recorded.")
+
+    def format_rate(self, value, suffix="%"):
+        """Formats a ratio for display, or ∞ / N/A when not finite."""
+        return stats.format_ratio(value, suffix=suffix)
+
+    def print_totals(self, label, totals):
+        """Prints the derived rates of one group of matches."""
+        print(
+            f"{label}: {totals['matches']} match(es) | "
+            f"KDA {self.format_rate(kda_ratio(totals), '')} | "
+            f"HS {self.format_rate(headshot_accuracy(totals))} | "
+            f"Win {self.format_rate(win_rate(totals))} | "
+            f"Plant {self.format_rate(plant_success(totals))} | "
+            f"Defuse {self.format_rate(defusal_success(totals))}"
+        )
+
+    def view_breakdown(self):
+        """Displays rates for a map/weapon filter and per-map rollups."""
+        self.clear_screen()
+        self.poll_logs()
+        map_name = input("Filter by map (blank for all): ").strip()
+        weapon = input("Filter by weapon (blank for all): ").strip()
+
+        totals = self.match_index.totals(map_name=map_name, weapon=weapon)
+        if totals["matches"] == 0:
+            print("No recorded matches for that filter.")
+            return
+
+        label = f"{weapon or 'Any weapon'} on {map_name or 'any map'}"
+        self.print_totals(label, totals)
+
+        print("\nBy map:")
+        by_map = self.match_index.breakdown("map", weapon=weapon)
+        for name, map_totals in by_map.items():
+            self.print_totals(f" - {name}", map_totals)
+
+        print("\nBy weapon:")
+        by_weapon = self.match_index.breakdown("weapon", map_name=map_name)
+        for name, weapon_totals in by_weapon.items():
+            self.print_totals(f" - {name}", weapon_totals)
+
+    def import_telemetry(self):
+        """Streams round telemetry files into this agent's match index."""
+        self.clear_screen()
+        text = input("Enter telemetry file paths (comma-separated): ")
+        try:
+            paths = log_tail.parse_paths(text)
+            if not paths:
+                print("No files given.")
+                return
+            imported = summarize_files(paths, agent=self.agent_codename)
+        except (OSError, ValueError) as error:
+            print(f"Could not import telemetry: {error}")
+            return
+
+        self.match_index.merge(imported)
+        totals = imported.totals()
+        print(
+            f"Imported {totals['matches']} match(es) "
+            f"({totals['rounds']} rounds) for {self.agent_codename}."
+        )
+        self.print_totals("Imported", totals)
+
+    def attach_log_follower(self, paths):
+        """
+        Returns this agent's log follower, adding paths to it.
+
+        The first time in a session, the matches already folded in from
+        the logs (saved with their read offsets) are merged into the
+        index, less any the index already holds from before a suspend.
+        """
+        codename = self.agent_codename
+        follower = self.log_followers.get(codename)
+        if follower is not None:
+            follower.add_paths(paths)
+            return follower
+
+        follower = log_tail.LogFollower(f"valorant-{codename}", paths)
+        live = LiveTelemetry(codename, follower.totals)
+        self.match_index.merge(live.index)
+        merged = self.live_telemetry.get(codename)
+        if merged is not None:
+            self.match_index.merge(merged.index, sign=-1)
+        self.live_telemetry[codename] = live
+        self.log_followers[codename] = follower
+        return follower
+
+    def ingest_telemetry(self, path, header, rows):
+        """
+        Folds newly appended telemetry rows into the match index.
+
+        Returns:
+            int: Rows skipped as malformed.
+        """
+        live = self.live_telemetry[self.agent_codename]
+        skipped = []
+        for match in live.ingest(path, header, rows, skipped):
+            self.match_index.record(*match)
+        self.log_followers[self.agent_codename].totals = live.to_checkpoint()
+        return len(skipped)
+
+    def poll_logs(self):
+        """Catches up on followed logs, if any, before showing totals."""
+        follower = self.log_followers.get(self.agent_codename)
+        if follower is None:
+            return
+        try:
+            _, skipped = log_tail.catch_up(follower, self.ingest_telemetry)
+        except (OSError, ValueError) as error:
+            print(f"Could not read telemetry logs: {error}")
+            return
+        if skipped:
+            print(f"Skipped {skipped} malformed telemetry row(s).")
+
+    def show_live_totals(self):
+        """Draws the agent's totals while following logs."""
+        self.clear_screen()
+        self.display_banner()
+        totals = self.match_index.totals(agent=self.agent_codename)
+        self.print_totals("Live", totals)
+        by_map = self.match_index.breakdown(
+            "map", agent=self.agent_codename
+        )
+        for name, map_totals in by_map.items():
+            self.print_totals(f" - {name}", map_totals)
+
+    def follow_telemetry(self):
+        """Tails telemetry logs, folding rounds in as they are written."""
+        self.clear_screen()
+        text = input(
+            "Telemetry logs to follow (comma-separated, blank for last): "
+        )
+        try:
+            paths = log_tail.parse_paths(text)
+        except ValueError as error:
+            print(f"Could not follow telemetry logs: {error}")
+            return
+        follower = self.attach_log_follower(paths)
+        if not follower.files:
+            print("No log files to follow.")
+            return
+
+        try:
+            log_tail.follow(
+                follower, self.ingest_telemetry, self.show_live_totals
+            )
+        except (OSError, ValueError) as error:
+            print(f"Could not follow telemetry logs: {error}")
+
     def menu(self):
         """Main loop that runs the Valorant statistics program."""
         while True:
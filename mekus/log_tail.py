@@ -0,0 +1,304 @@
+import csv  # Standard library
+import json
+import os
+import sys
+import threading
+from urllib.parse import quote
+
+from . import screen
+
+# Where followers keep their read positions unless MEKUS_TAIL_DIR
+# overrides it
+DEFAULT_STATE_DIR = os.path.join(os.path.expanduser("~"), ".mekus", "tail")
+STATE_DIR_ENV = "MEKUS_TAIL_DIR"
+
+READ_SIZE = 1 << 20  # Bytes read per call while catching up
+POLL_SECONDS = 1.0  # Pause between polls in follow mode
+
+# State directories, and the directories typed paths must stay inside,
+# bound to threads that run their own session
+_local = threading.local()
+
+
+class TailedFile:
+    """Read position in one CSV log file that keeps growing.
+
+    Only complete lines are consumed, and the offset only ever points
+    just past one, so a record being written is read once it is whole.
+    The file's device and inode are kept with the offset: when the path
+    is rotated to a new file, the rest of the old one is read first,
+    then the new one from its start.
+    """
+
+    def __init__(self, path, state=None):
+        self.path = path
+        self.file = None
+        self.restore(state or {})
+
+    def restore(self, state):
+        """Go back to a position from to_state(), reopening the file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.device = state.get("device")
+        self.inode = state.get("inode")
+        self.offset = state.get("offset", 0)
+        self.header = state.get("header")  # Column names, once read
+
+    def to_state(self):
+        return {
+            "device": self.device,
+            "inode": self.inode,
+            "offset": self.offset,
+            "header": self.header
+        }
+
+    def read_batches(self):
+        """
+        Return the records appended since the last call.
+
+        Returns:
+            list: (header, rows, state) per file read; more than one
+            only when the log was rotated in between. state is the
+            to_state() position just after that batch.
+        """
+        batches = []
+        try:
+            status = os.stat(self.path)
+            identity = (status.st_dev, status.st_ino)
+        except FileNotFoundError:
+            status = identity = None
+
+        if self.inode is not None and identity != (self.device, self.inode):
+            # Rotated: finish the old file, wherever it was moved to
+            old_file = self.file or self.open_rotated()
+            if old_file is not None:
+                self.drain(old_file, batches)
+                old_file.close()
+            self.file = None
+            self.device = self.inode = self.header = None
+            self.offset = 0
+
+        if status is None:
+            return batches
+        if status.st_size < self.offset:
+            # Truncated in place: the file restarts from its beginning
+            self.offset = 0
+            self.header = None
+        if self.file is None:
+            self.file = open(self.path, "rb")
+            self.device, self.inode = identity
+        self.drain(self.file, batches)
+        return batches
+
+    def open_rotated(self):
+        """Open the file this tail was reading, if it is still nearby."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return None
+        for entry in entries:
+            try:
+                status = entry.stat()
+            except OSError:
+                continue
+            if (status.st_dev, status.st_ino) == (self.device, self.inode):
+                return open(entry.path, "rb")
+        return None
+
+    def drain(self, file, batches):
+        """Read every complete line after the offset into batches."""
+        file.seek(self.offset)
+        pending = b""
+        rows = []
+        while True:
+            data = file.read(READ_SIZE)
+            if not data:
+                break
+            data = pending + data
+            end = data.rfind(b"\n") + 1
+            pending = data[end:]
+            if end:
+                self.offset += end
+                rows.extend(parse_lines(data[:end]))
+
+        rows = [row for row in rows if row]
+        if self.header is None and rows:
+            self.header = [column.strip() for column in rows.pop(0)]
+        if rows:
+            batches.append((self.header, rows, self.to_state()))
+
+
+def parse_lines(data):
+    """
+    Parse complete CSV lines into rows.
+
+    A line the csv module rejects is kept as a one-field row, so the
+    consumer's own row checks skip it along with other malformed rows.
+    """
+    lines = data.decode("utf-8", "replace").splitlines()
+    try:
+        return list(csv.reader(lines))
+    except csv.Error:
+        rows = []
+        for line in lines:
+            try:
+                rows.extend(csv.reader([line]))
+            except csv.Error:
+                rows.append([line])
+        return rows
+
+
+class LogFollower:
+    """Tails a set of log files, persisting where each one was read to.
+
+    The state file also holds a checkpoint of whatever the consumer
+    built from the records (`totals`, a JSON-compatible dict), saved
+    together with the offsets, so a restart neither loses nor rereads
+    processed records.
+    """
+
+    def __init__(self, name, paths=None, state_dir=None):
+        directory = state_dir or current_state_dir()
+        self.state_path = os.path.join(
+            directory, f"{quote(name.lower(), safe='')}.json"
+        )
+        try:
+            with open(self.state_path, encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            state = {}
+
+        self.totals = state.get("totals", {})
+        saved_files = state.get("files", {})
+        self.files = {
+            path: TailedFile(path, saved_files.get(path))
+            for path in (paths if paths else saved_files)
+        }
+
+    def add_paths(self, paths):
+        """Start following more files, from their beginning."""
+        for path in paths:
+            if path not in self.files:
+                self.files[path] = TailedFile(path)
+
+    def save(self):
+        """Write offsets and totals at once; a crash keeps the old pair."""
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({
+                "files": {
+                    path: tail.to_state() for path, tail in self.files.items()
+                },
+                "totals": self.totals
+            }, file)
+        os.replace(temp_path, self.state_path)
+
+
+def bind_state_dir(directory):
+    """Give the calling thread its own state directory, or None."""
+    _local.directory = directory
+
+
+def current_state_dir():
+    """Return the calling thread's state directory, or the user's."""
+    return (
+        getattr(_local, "directory", None)
+        or os.environ.get(STATE_DIR_ENV)
+        or DEFAULT_STATE_DIR
+    )
+
+
+def bind_allowed_dir(directory):
+    """Limit paths the calling thread's user types to directory, or None."""
+    _local.allowed_dir = directory
+
+
+def parse_paths(text):
+    """
+    Split a comma-separated list of file paths.
+
+    When the calling thread has an allowed directory bound, relative
+    paths are taken from it and any path leading outside it raises
+    ValueError.
+    """
+    paths = [path.strip() for path in text.split(",") if path.strip()]
+    allowed_dir = getattr(_local, "allowed_dir", None)
+    if allowed_dir is None:
+        return paths
+
+    root = os.path.realpath(allowed_dir)
+    resolved = []
+    for path in paths:
+        full_path = os.path.realpath(os.path.join(root, path))
+        if os.path.commonpath([root, full_path]) != root:
+            raise ValueError(f"{path} is outside {allowed_dir}")
+        resolved.append(full_path)
+    return resolved
+
+
+def catch_up(follower, ingest):
+    """
+    Fold everything appended since the last poll, then save the state.
+
+    A file's read position only moves past a batch once ingest has
+    returned for it. ingest must fold a batch in fully or not at all:
+    if it raises, the batch is read again on the next call.
+
+    Parameters:
+        follower (LogFollower): The files to read.
+        ingest (callable): Called as ingest(path, header, rows); returns
+            how many of the rows it skipped as malformed.
+
+    Returns:
+        tuple: (records folded in, malformed records skipped)
+    """
+    count = skipped = 0
+    try:
+        for path, tail in follower.files.items():
+            committed = tail.to_state()
+            try:
+                for header, rows, state in tail.read_batches():
+                    skipped += ingest(path, header, rows)
+                    count += len(rows)
+                    committed = state
+            except BaseException:
+                tail.restore(committed)
+                raise
+    finally:
+        if count:
+            follower.save()
+    return count - skipped, skipped
+
+
+def follow(follower, ingest, show, interval=POLL_SECONDS):
+    """
+    Fold new records and redraw the live view until Enter is pressed.
+
+    Ctrl+C also stops it; when the input ends (EOFError), the error is
+    raised once the last poll has been saved.
+
+    Parameters:
+        follower (LogFollower): The files to follow.
+        ingest (callable): Called as ingest(path, header, rows).
+        show (callable): Prints the current totals on a fresh screen.
+        interval (float): Seconds between polls.
+    """
+    skipped = 0
+    try:
+        while True:
+            skipped += catch_up(follower, ingest)[1]
+            show()
+            print(f"\nFollowing {len(follower.files)} log file(s).")
+            if skipped:
+                print(f"Skipped {skipped} malformed record(s).")
+            print("Press Enter to stop.")
+            sys.stdout.flush()
+            if screen.wait_for_line(interval) is not None:
+                break
+    except KeyboardInterrupt:
+        pass
+    # Every completed poll was saved by catch_up()
+    print("\nStopped following.")
@@ -0,0 +1,231 @@
+import atexit  # Standard library
+import builtins
+import json
+import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# Setting MEKUS_METRICS to a file path turns instrumentation on for the
+# whole run and writes the histograms there at exit (.prom for
+# Prometheus text, anything else for JSON)
+METRICS_ENV = "MEKUS_METRICS"
+
+# What a histogram measures
+HANDLER = "handler"  # A menu action picked from a dispatch table
+EXTERNAL = "external"  # A call into a slow dependency or the terminal
+INPUT = "input"  # Time spent waiting in input()
+
+KIND_HELP = {
+    HANDLER: "Time spent in menu handlers, excluding input() waits.",
+    EXTERNAL: "Time spent in external calls.",
+    INPUT: "Time spent waiting for the user in input()."
+}
+
+# Bucket upper bounds in seconds: powers of two from 1 us to ~67 s
+BUCKET_BOUNDS = tuple(1e-6 * 2 ** exponent for exponent in range(27))
+JSON_PERCENTILES = (50, 90, 99)
+
+_enabled = False
+_histograms = {}  # (kind, name) -> Histogram
+_original_input = None
+
+
+class _Clock(threading.local):
+    """Per-thread running totals, so concurrent sessions don't mix."""
+
+    input_seconds = 0.0  # Time blocked in input()
+    external_seconds = 0.0  # Time in external calls
+
+
+_clock = _Clock()
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; observe() is a bisect and an add."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)  # Last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def percentile(self, percent):
+        """Return the bucket upper bound holding the given percentile."""
+        if not self.count:
+            return None
+        rank = self.count * percent / 100
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+def is_enabled():
+    return _enabled
+
+
+def enable():
+    """Start recording; input() is wrapped so waits can be excluded."""
+    global _enabled, _original_input
+    if _enabled:
+        return
+    _original_input = builtins.input
+    builtins.input = _timed_input
+    _enabled = True
+
+
+def disable():
+    """Stop recording; histograms are kept until reset()."""
+    global _enabled
+    if not _enabled:
+        return
+    if builtins.input is _timed_input:
+        builtins.input = _original_input
+    _enabled = False
+
+
+def reset():
+    _histograms.clear()
+
+
+def histogram(kind, name):
+    """Return the histogram of one handler or external call."""
+    key = (kind, name)
+    found = _histograms.get(key)
+    if found is None:
+        found = _histograms[key] = Histogram()
+    return found
+
+
+def _timed_input(prompt=""):
+    clock = _clock
+    started = perf_counter()
+    external_before = clock.external_seconds
+    try:
+        return _original_input(prompt)
+    finally:
+        # input() flushes the pending frame first; drawing it is work,
+        # not waiting, and is recorded as an external call instead
+        waited = (
+            perf_counter() - started
+            - (clock.external_seconds - external_before)
+        )
+        clock.input_seconds += waited
+        histogram(INPUT, "input").observe(waited)
+
+
+def _timed_call(kind, name, function, args, kwargs):
+    clock = _clock
+    started = perf_counter()
+    waited_before = clock.input_seconds
+    try:
+        return function(*args, **kwargs)
+    finally:
+        elapsed = perf_counter() - started
+        if kind == EXTERNAL:
+            clock.external_seconds += elapsed
+        histogram(kind, name).observe(
+            elapsed - (clock.input_seconds - waited_before)
+        )
+
+
+def call_handler(handler):
+    """
+    Call a dispatch-table handler, timing it when instrumentation is on.
+
+    The histogram is named after the handler, e.g. "NBA2K25.shoot".
+    When off this costs one function call and a flag check.
+    """
+    if not _enabled:
+        return handler()
+    return _timed_call(HANDLER, handler.__qualname__, handler, (), {})
+
+
+def call_external(name, function, *args, **kwargs):
+    """Call an external function, timing it when instrumentation is on."""
+    if not _enabled:
+        return function(*args, **kwargs)
+    return _timed_call(EXTERNAL, name, function, args, kwargs)
+
+
+def snapshot():
+    """
+    Return the histograms as plain data.
+
+    Returns:
+        dict: kind -> name -> {"count", "sum", "p50"/"p90"/"p99"
+        (bucket upper bounds, in seconds) and "buckets", a list of
+        [upper bound, count] for non-empty buckets}.
+    """
+    data = {}
+    for (kind, name), found in sorted(_histograms.items()):
+        entry = {"count": found.count, "sum": found.sum}
+        for percent in JSON_PERCENTILES:
+            entry[f"p{percent}"] = found.percentile(percent)
+        entry["buckets"] = [
+            [bound, count]
+            for bound, count in zip(BUCKET_BOUNDS + ("+Inf",), found.counts)
+            if count
+        ]
+        data.setdefault(kind, {})[name] = entry
+    return data
+
+
+def to_json():
+    return json.dumps(snapshot(), indent=1)
+
+
+def escape_label(value):
+    return (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+def to_prometheus():
+    """Return the histograms in the Prometheus text exposition format."""
+    lines = []
+    for kind in KIND_HELP:
+        entries = [
+            (name, found) for (found_kind, name), found
+            in sorted(_histograms.items()) if found_kind == kind
+        ]
+        if not entries:
+            continue
+
+        metric = f"mekus_{kind}_seconds"
+        lines.append(f"# HELP {metric} {KIND_HELP[kind]}")
+        lines.append(f"# TYPE {metric} histogram")
+        for name, found in entries:
+            label = f'name="{escape_label(name)}"'
+            cumulative = 0
+            for bound, count in zip(BUCKET_BOUNDS, found.counts):
+                cumulative += count
+                lines.append(
+                    f'{metric}_bucket{{{label},le="{bound:.6g}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(
+                f'{metric}_bucket{{{label},le="+Inf"}} {found.count}'
+            )
+            lines.append(f"{metric}_sum{{{label}}} {found.sum:.9f}")
+            lines.append(f"{metric}_count{{{label}}} {found.count}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path):
+    """Write the histograms to path: Prometheus text for .prom, else JSON."""
+    text = to_prometheus() if path.endswith(".prom") else to_json()
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+
+
+if os.environ.get(METRICS_ENV):
+    enable()
+    atexit.register(dump, os.environ[METRICS_ENV])
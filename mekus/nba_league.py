@@ -0,0 +1,318 @@
+import heapq  # Standard library
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from .nba_policy import REST_ACTION, solve_policy
+from .nba_rules import (
+    MAX_STAMINA,
+    ROLL_MAX,
+    ROLL_MIN,
+    SHOT_TYPES,
+    recover_stamina,
+    resolve_shot
+)
+
+# Season and game shape
+GAMES_PER_TEAM = 82
+ROSTER_SIZE = 8
+ON_COURT = 5
+QUARTER_SECONDS = 12 * 60
+REGULATION_SECONDS = 4 * QUARTER_SECONDS
+OVERTIME_SECONDS = 5 * 60
+
+# Seconds a possession lasts, and how often benched players recover
+POSSESSION_SECONDS = (8, 24)
+BENCH_RECOVERY_SECONDS = 60
+
+# Actions ahead each player plans for when picking a shot
+PLAYER_LOOKAHEAD = 5
+
+# Range of generated skill values
+SKILL_RANGE = (60, 95)
+
+# Event kinds handled by the game clock
+POSSESSION = "possession"
+BENCH_RECOVERY = "bench_recovery"
+
+# Shared process pools bound to threads that run their own session
+_local = threading.local()
+
+
+class PlayerProfile:
+    """A league player using the NBA2K25 skill and stamina model."""
+
+    def __init__(
+        self, player_name, team, shooting_skill, dunk_skill,
+        three_point_skill, stamina=MAX_STAMINA
+    ):
+        self.player_name = player_name
+        self.team = team
+        self.shooting_skill = shooting_skill
+        self.dunk_skill = dunk_skill
+        self.three_point_skill = three_point_skill
+        self.stamina = stamina
+
+    @classmethod
+    def from_game(cls, game):
+        """Build a profile from an NBA2K25 player."""
+        return cls(
+            game.player_name, game.team, game.shooting_skill,
+            game.dunk_skill, game.three_point_skill
+        )
+
+    def policy(self):
+        """Return this player's memoized action policy."""
+        return solve_policy(
+            self.shooting_skill, self.dunk_skill, self.three_point_skill
+        )
+
+
+def build_rosters(teams, seed, featured=None):
+    """
+    Generate a deterministic roster for every team.
+
+    Parameters:
+        teams (list): Team names.
+        seed: League seed the rosters are derived from.
+        featured (PlayerProfile): Optional player placed on their team.
+
+    Returns:
+        dict: Team name mapped to a list of PlayerProfile.
+    """
+    rng = random.Random(f"{seed}:rosters")
+    rosters = {}
+    for team in teams:
+        rosters[team] = [
+            PlayerProfile(
+                f"{team.split()[-1]} #{number}",
+                team,
+                rng.randint(*SKILL_RANGE),
+                rng.randint(*SKILL_RANGE),
+                rng.randint(*SKILL_RANGE)
+            )
+            for number in range(1, ROSTER_SIZE + 1)
+        ]
+
+    if featured is not None and featured.team in rosters:
+        rosters[featured.team][0] = featured
+    return rosters
+
+
+def build_schedule(teams, games_per_team=GAMES_PER_TEAM):
+    """
+    Round-robin schedule where every team plays games_per_team games.
+
+    Uses the circle method: each round pairs every team once, and home
+    court alternates every full cycle of rounds.
+
+    Returns:
+        list: (game_id, home, away) tuples.
+    """
+    rotation = list(teams)
+    if len(rotation) % 2:
+        rotation.append(None)  # Bye slot for an odd number of teams
+
+    rounds_per_cycle = len(rotation) - 1
+    schedule = []
+    for round_number in range(games_per_team):
+        flip = (round_number // rounds_per_cycle) % 2
+        half = len(rotation) // 2
+        for home, away in zip(rotation[:half], reversed(rotation[half:])):
+            if home is None or away is None:
+                continue
+            if flip:
+                home, away = away, home
+            schedule.append((len(schedule), home, away))
+        # Keep the first team fixed and rotate the rest
+        rotation.insert(1, rotation.pop())
+    return schedule
+
+
+def choose_shooter(lineup, bench, rng):
+    """Pick a shooter and the action their policy recommends.
+
+    A player whose policy says to rest is swapped for the freshest
+    bench player, who shoots instead.
+    """
+    shooter = rng.choice(lineup)
+    action = shooter.policy().best_action(shooter.stamina, PLAYER_LOOKAHEAD)
+    if action != REST_ACTION or not bench:
+        return shooter, action
+
+    substitute = max(bench, key=lambda player: player.stamina)
+    bench.remove(substitute)
+    bench.append(shooter)
+    lineup[lineup.index(shooter)] = substitute
+    action = substitute.policy().best_action(
+        substitute.stamina, PLAYER_LOOKAHEAD
+    )
+    return substitute, action
+
+
+def simulate_game(game):
+    """
+    Play one game on a heap-based event clock.
+
+    Parameters:
+        game (tuple): (game_id, home, away, rosters, seed).
+
+    Returns:
+        dict: Final score and a box score line per player.
+    """
+    game_id, home, away, rosters, seed = game
+    rng = random.Random(seed)
+
+    teams = (home, away)
+    lineups, benches, box = {}, {}, {}
+    for team in teams:
+        players = [
+            PlayerProfile(
+                p.player_name, p.team, p.shooting_skill,
+                p.dunk_skill, p.three_point_skill
+            )
+            for p in rosters[team]
+        ]
+        lineups[team] = players[:ON_COURT]
+        benches[team] = players[ON_COURT:]
+        for player in players:
+            box[player.player_name] = [team, 0, 0, 0]  # team, PTS, FGM, FGA
+    score = dict.fromkeys(teams, 0)
+
+    # Heap of (clock, sequence, kind, team); sequence keeps ties ordered
+    events = [
+        (0, 0, POSSESSION, home),
+        (BENCH_RECOVERY_SECONDS, 1, BENCH_RECOVERY, None)
+    ]
+    heapq.heapify(events)
+    sequence = len(events)
+    game_end = REGULATION_SECONDS
+
+    while events:
+        clock, _, kind, team = heapq.heappop(events)
+        if clock >= game_end:
+            if score[home] != score[away]:
+                break
+            game_end += OVERTIME_SECONDS
+
+        if kind == BENCH_RECOVERY:
+            for bench in benches.values():
+                for player in bench:
+                    player.stamina = recover_stamina(player.stamina)
+            next_recovery = clock + BENCH_RECOVERY_SECONDS
+            heapq.heappush(
+                events, (next_recovery, sequence, BENCH_RECOVERY, None)
+            )
+            sequence += 1
+            continue
+
+        shooter, action = choose_shooter(lineups[team], benches[team], rng)
+        if action in SHOT_TYPES:
+            shot = SHOT_TYPES[action]
+            attempted, made, points, shooter.stamina = resolve_shot(
+                stamina=shooter.stamina,
+                skill=getattr(shooter, shot["skill"]),
+                roll=rng.randint(ROLL_MIN, ROLL_MAX),
+                stamina_cost=shot["stamina_cost"],
+                points=shot["points"],
+                min_stamina=shot["min_stamina"]
+            )
+            line = box[shooter.player_name]
+            line[1] += points
+            line[2] += made
+            line[3] += attempted
+            score[team] += points
+
+        # Ball goes to the other team after every possession
+        other = away if team == home else home
+        next_possession = clock + rng.randint(*POSSESSION_SECONDS)
+        heapq.heappush(events, (next_possession, sequence, POSSESSION, other))
+        sequence += 1
+
+    return {
+        "game_id": game_id,
+        "home": home,
+        "away": away,
+        "home_score": score[home],
+        "away_score": score[away],
+        "box_score": [
+            (name, team, points, made, attempted)
+            for name, (team, points, made, attempted) in box.items()
+        ]
+    }
+
+
+def bind_executor(executor):
+    """Give the calling thread a shared process pool to use, or None."""
+    _local.executor = executor
+
+
+def simulate_season(
+    teams, games_per_team=GAMES_PER_TEAM, seed=0, processes=None,
+    featured=None
+):
+    """
+    Simulate a full season, spreading games over a process pool.
+
+    Every game gets its own seed derived from the league seed and game
+    id, so results do not depend on which worker plays which game. A
+    pool bound with bind_executor() is used instead of a new one.
+
+    Returns:
+        dict: "standings", "games" and season "player_totals".
+    """
+    rosters = build_rosters(teams, seed, featured)
+    games = [
+        (game_id, home, away, rosters, f"{seed}:{game_id}")
+        for game_id, home, away in build_schedule(teams, games_per_team)
+    ]
+
+    executor = getattr(_local, "executor", None)
+    if processes == 1:
+        results = list(map(simulate_game, games))
+    elif executor is not None:
+        results = list(executor.map(simulate_game, games, chunksize=8))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(simulate_game, games, chunksize=8))
+
+    return {
+        "standings": compute_standings(teams, results),
+        "games": results,
+        "player_totals": compute_player_totals(results)
+    }
+
+
+def compute_standings(teams, results):
+    """Return (team, wins, losses, points for, points against) rows."""
+    table = {team: [0, 0, 0, 0] for team in teams}
+    for game in results:
+        home_won = game["home_score"] > game["away_score"]
+        winner, loser = (
+            (game["home"], game["away"]) if home_won
+            else (game["away"], game["home"])
+        )
+        table[winner][0] += 1
+        table[loser][1] += 1
+        table[game["home"]][2] += game["home_score"]
+        table[game["home"]][3] += game["away_score"]
+        table[game["away"]][2] += game["away_score"]
+        table[game["away"]][3] += game["home_score"]
+
+    return sorted(
+        ((team, *record) for team, record in table.items()),
+        key=lambda row: (-row[1], row[4] - row[3])
+    )
+
+
+def compute_player_totals(results):
+    """Return season totals per player: name -> [team, PTS, FGM, FGA, GP]."""
+    totals = {}
+    for game in results:
+        for name, team, points, made, attempted in game["box_score"]:
+            line = totals.setdefault(name, [team, 0, 0, 0, 0])
+            line[1] += points
+            line[2] += made
+            line[3] += attempted
+            line[4] += 1
+    return totals
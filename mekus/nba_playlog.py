@@ -0,0 +1,150 @@
+import mmap  # Standard library
+import os
+import struct
+
+from .nba_rules import SHOT_TYPES
+
+# One fixed-width record per action: stamina before, action, roll, outcome
+RECORD = struct.Struct("<bBBB")
+
+# Log header: magic, capacity, total actions ever recorded
+HEADER = struct.Struct("<4sIQ")
+MAGIC = b"NBPL"
+
+# Action codes stored in the log
+ACTION_CODES = {name: code for code, name in enumerate(SHOT_TYPES)}
+REST_CODE = len(ACTION_CODES)
+ACTION_NAMES = tuple(SHOT_TYPES) + ("rest_and_recover",)
+
+# Outcome codes stored in the log
+MISSED = 0
+MADE = 1
+NO_STAMINA = 2
+
+DEFAULT_CAPACITY = 4096
+# Records an in-memory log makes room for at first; it doubles from
+# there up to its capacity, so an idle game holds a few bytes, not 16 KiB
+INITIAL_RECORDS = 64
+
+
+class PlayLog:
+    """Ring buffer of fixed-width play-by-play records.
+
+    Records live in a bytearray that grows to capacity as actions are
+    logged, or in a memory-mapped file when spill_path is given so the
+    log survives the process. Once full, the oldest records are
+    overwritten.
+    """
+
+    __slots__ = ("capacity", "count", "file", "buffer")
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, spill_path=None):
+        self.capacity = capacity
+        self.count = 0
+        self.file = None
+
+        if spill_path is None:
+            self.buffer = bytearray(HEADER.size)
+        else:
+            self.buffer = self._map_file(
+                spill_path, HEADER.size + capacity * RECORD.size
+            )
+        HEADER.pack_into(self.buffer, 0, MAGIC, capacity, self.count)
+
+    def _map_file(self, path, size):
+        """Map the spill file, resuming its records if it matches."""
+        exists = os.path.exists(path)
+        self.file = open(path, "r+b" if exists else "w+b")
+        if os.path.getsize(path) != size:
+            self.file.truncate(size)
+        buffer = mmap.mmap(self.file.fileno(), size)
+
+        magic, capacity, count = HEADER.unpack_from(buffer, 0)
+        if exists and magic == MAGIC and capacity == self.capacity:
+            self.count = count
+        return buffer
+
+    def record(self, stamina, action, roll=0, outcome=MISSED):
+        """Append one action; overwrites the oldest once full."""
+        offset = HEADER.size + (self.count % self.capacity) * RECORD.size
+        if offset == len(self.buffer):
+            self._grow()
+        code = ACTION_CODES.get(action, REST_CODE)
+        RECORD.pack_into(self.buffer, offset, stamina, code, roll, outcome)
+        self.count += 1
+        HEADER.pack_into(self.buffer, 0, MAGIC, self.capacity, self.count)
+
+    def _grow(self):
+        """Double the in-memory buffer's records, up to capacity."""
+        records = (len(self.buffer) - HEADER.size) // RECORD.size
+        grown = min(self.capacity, max(INITIAL_RECORDS, records * 2))
+        self.buffer.extend(bytes((grown - records) * RECORD.size))
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def _field(self, position):
+        """Return one field of every record, oldest first, as views."""
+        records = memoryview(self.buffer)[HEADER.size:]
+        column = records[position::RECORD.size]
+        if self.count <= self.capacity:
+            return (column[:self.count],)
+        start = self.count % self.capacity
+        return column[start:], column[:start]
+
+    def summary(self):
+        """
+        Compute per-action FG% and streaks from the buffered records.
+
+        Iterates the action and outcome bytes directly through
+        memoryviews, so no Python object is built per record.
+
+        Returns:
+            dict: "attempts"/"made" per action, plus the current and
+            longest make streaks and the longest miss streak.
+        """
+        attempts = [0] * len(ACTION_NAMES)
+        made = [0] * len(ACTION_NAMES)
+        streak = longest_make = longest_miss = 0
+
+        for actions, outcomes in zip(self._field(1), self._field(3)):
+            for code, outcome in zip(actions, outcomes):
+                if code == REST_CODE or outcome == NO_STAMINA:
+                    continue
+                attempts[code] += 1
+                if outcome == MADE:
+                    made[code] += 1
+                    streak = streak + 1 if streak > 0 else 1
+                    longest_make = max(longest_make, streak)
+                else:
+                    streak = streak - 1 if streak < 0 else -1
+                    longest_miss = max(longest_miss, -streak)
+
+        return {
+            "attempts": dict(zip(ACTION_NAMES, attempts)),
+            "made": dict(zip(ACTION_NAMES, made)),
+            "current_streak": streak,
+            "longest_make_streak": longest_make,
+            "longest_miss_streak": longest_miss
+        }
+
+    def to_bytes(self):
+        """Return the header and records, e.g. to snapshot a game."""
+        return bytes(self.buffer)
+
+    def load_bytes(self, data):
+        """Replace the log's contents with bytes from to_bytes()."""
+        magic, capacity, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or capacity != self.capacity:
+            raise ValueError("Play log data does not match this log")
+        self.buffer[:len(data)] = data
+        self.count = count
+
+    def close(self):
+        """Flush and release a memory-mapped log."""
+        if self.file is None:
+            return
+        self.buffer.flush()
+        self.buffer.close()
+        self.file.close()
+        self.file = None
@@ -0,0 +1,123 @@
+from functools import lru_cache  # Standard library
+
+import numpy as np  # Third-party library
+
+from .nba_rules import (
+    MAX_STAMINA,
+    SHOT_TYPES,
+    make_probability,
+    recover_stamina
+)
+
+# Actions a player can choose from, in tie-breaking order
+REST_ACTION = "rest_and_recover"
+ACTIONS = tuple(SHOT_TYPES) + (REST_ACTION,)
+
+# A shot with no minimum stamina can push stamina below zero once
+MIN_STAMINA_STATE = min(
+    [0] + [
+        shot["min_stamina"] - shot["stamina_cost"]
+        for shot in SHOT_TYPES.values()
+    ]
+)
+STAMINA_STATES = np.arange(MIN_STAMINA_STATE, MAX_STAMINA + 1)
+
+# Default number of actions a policy table plans ahead
+DEFAULT_BUDGET = 50
+
+
+class PolicyTable:
+    """Best action and expected points for every (actions left, stamina).
+
+    Built once per skill configuration by solve_policy; lookups during
+    play are plain array indexing.
+    """
+
+    def __init__(self, values, policy):
+        self.values = values
+        self.policy = policy
+        self.budget = len(values) - 1
+
+    def _index(self, stamina, actions_left):
+        """Return the table row/column of a game state."""
+        actions_left = min(max(actions_left, 0), self.budget)
+        stamina = min(max(stamina, MIN_STAMINA_STATE), MAX_STAMINA)
+        return actions_left, stamina - MIN_STAMINA_STATE
+
+    def best_action(self, stamina, actions_left):
+        """Return the expected-points-maximizing action name."""
+        return ACTIONS[self.policy[self._index(stamina, actions_left)]]
+
+    def expected_points(self, stamina, actions_left):
+        """Return the expected points of playing the policy from here."""
+        return float(self.values[self._index(stamina, actions_left)])
+
+
+def action_transitions(skills):
+    """
+    Return the reward and next-stamina arrays of every action.
+
+    Parameters:
+        skills (dict): NBA2K25 skill attribute names mapped to values.
+
+    Returns:
+        list: (expected_points, next_state_index) array pairs, one per
+        action in ACTIONS; infeasible shots have -inf expected points.
+    """
+    transitions = []
+    for shot in SHOT_TYPES.values():
+        feasible = STAMINA_STATES >= shot["min_stamina"]
+        expected = make_probability(skills[shot["skill"]]) * shot["points"]
+        rewards = np.where(feasible, expected, -np.inf)
+        next_stamina = np.where(
+            feasible, STAMINA_STATES - shot["stamina_cost"], STAMINA_STATES
+        )
+        transitions.append((rewards, next_stamina - MIN_STAMINA_STATE))
+
+    rested = np.array([recover_stamina(int(s)) for s in STAMINA_STATES])
+    transitions.append(
+        (np.zeros(len(STAMINA_STATES)), rested - MIN_STAMINA_STATE)
+    )
+    return transitions
+
+
+@lru_cache(maxsize=128)
+def solve_policy(
+    shooting_skill, dunk_skill, three_point_skill, budget=DEFAULT_BUDGET
+):
+    """
+    Solve the best action for every stamina and remaining-action count.
+
+    Backward induction over the stamina states: the value of k actions
+    left is the best immediate expected points plus the value of k - 1
+    actions left from the resulting stamina. Results are cached per skill
+    configuration.
+
+    Returns:
+        PolicyTable: Values and best actions for 0..budget actions left.
+    """
+    skills = {
+        "shooting_skill": shooting_skill,
+        "dunk_skill": dunk_skill,
+        "three_point_skill": three_point_skill
+    }
+    transitions = action_transitions(skills)
+
+    state_count = len(STAMINA_STATES)
+    values = np.zeros((budget + 1, state_count))
+    policy = np.full(
+        (budget + 1, state_count), ACTIONS.index(REST_ACTION), dtype=np.int8
+    )
+
+    for actions_left in range(1, budget + 1):
+        previous = values[actions_left - 1]
+        candidates = np.stack([
+            rewards + previous[next_index]
+            for rewards, next_index in transitions
+        ])
+        policy[actions_left] = candidates.argmax(axis=0)
+        values[actions_left] = candidates.max(axis=0)
+
+    values.flags.writeable = False
+    policy.flags.writeable = False
+    return PolicyTable(values, policy)
@@ -0,0 +1,59 @@
+# Stamina limits shared by the interactive game and the simulators
+MAX_STAMINA = 100
+REST_RECOVERY = 20
+
+# A shot succeeds when a roll in ROLL_MIN..ROLL_MAX is <= the skill value
+ROLL_MIN = 1
+ROLL_MAX = 100
+
+# Rules of every shot type, keyed by NBA2K25 action method name
+SHOT_TYPES = {
+    "shoot": {
+        "label": "shoot",
+        "skill": "shooting_skill",
+        "stamina_cost": 5,
+        "points": 2,
+        "min_stamina": 0
+    },
+    "dunk": {
+        "label": "dunk",
+        "skill": "dunk_skill",
+        "stamina_cost": 15,
+        "points": 2,
+        "min_stamina": 15
+    },
+    "three_pointer": {
+        "label": "three-pointer",
+        "skill": "three_point_skill",
+        "stamina_cost": 10,
+        "points": 3,
+        "min_stamina": 10
+    }
+}
+
+
+def resolve_shot(stamina, skill, roll, stamina_cost, points, min_stamina=0):
+    """
+    Resolve shot attempts without any I/O.
+
+    Works element-wise on plain ints and on NumPy arrays alike, so the
+    interactive game and the vectorized simulator share one rule set.
+
+    Returns:
+        tuple: (attempted, made, points_scored, stamina_after)
+    """
+    attempted = stamina >= min_stamina
+    made = attempted & (roll <= skill)
+    return attempted, made, made * points, stamina - attempted * stamina_cost
+
+
+def make_probability(skill):
+    """Chance that a single roll succeeds against a skill value."""
+    roll_count = ROLL_MAX - ROLL_MIN + 1
+    winning_rolls = min(max(skill - ROLL_MIN + 1, 0), roll_count)
+    return winning_rolls / roll_count
+
+
+def recover_stamina(stamina):
+    """Return stamina after resting, capped at MAX_STAMINA."""
+    return min(MAX_STAMINA, stamina + REST_RECOVERY)
@@ -0,0 +1,145 @@
+import numpy as np  # Third-party library
+
+from . import randomness
+from .nba_rules import (
+    MAX_STAMINA,
+    ROLL_MAX,
+    ROLL_MIN,
+    SHOT_TYPES,
+    make_probability,
+    resolve_shot
+)
+
+# Percentiles reported for every FG% distribution
+FG_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Largest number of sessions simulated in one NumPy batch
+BATCH_SIZE = 1_000_000
+
+
+def simulate_sessions(
+    shot_type, skill, sessions, attempts, stamina=MAX_STAMINA, rng=None
+):
+    """
+    Simulate many players taking the same shot over and over.
+
+    Each session starts at `stamina` and tries `attempts` shots of one
+    type; the stamina cost and minimum-stamina check are applied at every
+    step, exactly as in NBA2K25._attempt_shot.
+
+    Returns:
+        dict: Per-session arrays "attempted", "made", "points" and
+        "stamina_spent".
+    """
+    rng = rng if rng is not None else randomness.current().numpy_generator()
+    shot = SHOT_TYPES[shot_type]
+
+    current = np.full(sessions, stamina, dtype=np.int32)
+    attempted = np.zeros(sessions, dtype=np.int32)
+    made = np.zeros(sessions, dtype=np.int32)
+    points = np.zeros(sessions, dtype=np.int32)
+
+    for _ in range(attempts):
+        rolls = rng.integers(ROLL_MIN, ROLL_MAX + 1, size=sessions)
+        step_attempted, step_made, step_points, current = resolve_shot(
+            stamina=current,
+            skill=skill,
+            roll=rolls,
+            stamina_cost=shot["stamina_cost"],
+            points=shot["points"],
+            min_stamina=shot["min_stamina"]
+        )
+        attempted += step_attempted
+        made += step_made
+        points += step_points
+
+    return {
+        "attempted": attempted,
+        "made": made,
+        "points": points,
+        "stamina_spent": stamina - current
+    }
+
+
+def simulate_attempts(
+    shot_type, skill, attempts, stamina=MAX_STAMINA, rng=None
+):
+    """
+    Simulate independent single attempts, in batches of BATCH_SIZE.
+
+    Returns:
+        dict: Totals plus "fg_pct" and "points_per_stamina".
+    """
+    rng = rng if rng is not None else randomness.current().numpy_generator()
+    totals = {"attempted": 0, "made": 0, "points": 0, "stamina_spent": 0}
+
+    remaining = attempts
+    while remaining > 0:
+        batch = min(remaining, BATCH_SIZE)
+        result = simulate_sessions(shot_type, skill, batch, 1, stamina, rng)
+        for key in totals:
+            totals[key] += int(result[key].sum())
+        remaining -= batch
+
+    totals["fg_pct"] = (
+        totals["made"] / totals["attempted"] * 100
+        if totals["attempted"] else None
+    )
+    totals["points_per_stamina"] = (
+        totals["points"] / totals["stamina_spent"]
+        if totals["stamina_spent"] else None
+    )
+    return totals
+
+
+def expected_points_per_stamina(shot_type, skill):
+    """Exact expected points per stamina point for one attempt."""
+    shot = SHOT_TYPES[shot_type]
+    return make_probability(skill) * shot["points"] / shot["stamina_cost"]
+
+
+def fg_distribution(
+    shot_type, skills, sessions=100_000, attempts=20,
+    stamina=MAX_STAMINA, rng=None
+):
+    """
+    FG% distribution across simulated sessions for each skill setting.
+
+    Parameters:
+        shot_type (str): Key of SHOT_TYPES.
+        skills (iterable): Skill values to compare.
+        sessions (int): Sessions simulated per skill value.
+        attempts (int): Attempts per session.
+        stamina (int): Starting stamina of each session.
+
+    Returns:
+        dict: Skill mapped to mean FG%, FG% percentiles and points per
+        stamina spent.
+    """
+    rng = rng if rng is not None else randomness.current().numpy_generator()
+    distributions = {}
+
+    for skill in skills:
+        result = simulate_sessions(
+            shot_type, skill, sessions, attempts, stamina, rng
+        )
+        attempted = result["attempted"]
+        played = attempted > 0
+        fg_pct = result["made"][played] / attempted[played] * 100
+        spent = int(result["stamina_spent"].sum())
+
+        distributions[skill] = {
+            "mean_fg_pct": float(fg_pct.mean()) if fg_pct.size else None,
+            "percentiles": (
+                dict(zip(
+                    FG_PERCENTILES,
+                    np.percentile(fg_pct, FG_PERCENTILES).tolist()
+                ))
+                if fg_pct.size else {}
+            ),
+            "points_per_stamina": (
+                int(result["points"].sum()) / spent if spent else None
+            )
+        }
+
+    return distributions
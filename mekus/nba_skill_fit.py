@@ -0,0 +1,159 @@
+import warnings  # Standard library
+
+import numpy as np  # Third-party library
+
+from . import stats
+from .agulto import NBA2K25
+from .nba_rules import ROLL_MAX, SHOT_TYPES
+
+# Columns of a shot-history file: one row per shot
+PLAYER_COLUMN = "player"
+SHOT_TYPE_COLUMN = "shot_type"
+MADE_COLUMN = "made"
+
+# Shot types in fitted-array column order
+SHOT_CODES = {name: code for code, name in enumerate(SHOT_TYPES)}
+MADE_VALUES = ("1", "true", "True", "TRUE", "yes", "made")
+
+# Rows parsed per batch; counts are folded in after every batch
+CHUNK_ROWS = 500_000
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+class SkillFit:
+    """Per-player, per-shot-type success estimates with Wilson intervals.
+
+    Arrays are shaped (players, shot types) with columns ordered like
+    SHOT_TYPES; players without attempts of a type get NaN.
+    """
+
+    def __init__(self, players, attempts, made, confidence):
+        self.players = players
+        self.index = {name: row for row, name in enumerate(players)}
+        self.attempts = attempts
+        self.made = made
+        self.confidence = confidence
+
+        self.probability = stats.ratios(made, attempts)
+        self.lower, self.upper = stats.wilson_intervals(
+            made, attempts, confidence
+        )
+
+    def skills_for(self, player):
+        """
+        Return a player's fitted NBA2K25 skill values.
+
+        Shot types the player never attempted are left out so the game's
+        defaults apply.
+        """
+        row = self.index[player]
+        skills = {}
+        for shot_type, code in SHOT_CODES.items():
+            if self.attempts[row, code]:
+                skill_name = SHOT_TYPES[shot_type]["skill"]
+                skills[skill_name] = int(
+                    round(self.probability[row, code] * ROLL_MAX)
+                )
+        return skills
+
+    def interval_for(self, player, shot_type):
+        """Return (estimate, lower, upper) success probabilities."""
+        row, code = self.index[player], SHOT_CODES[shot_type]
+        return (
+            float(self.probability[row, code]),
+            float(self.lower[row, code]),
+            float(self.upper[row, code])
+        )
+
+    def create_player(self, player, **kwargs):
+        """Create an NBA2K25 game using a player's fitted skills."""
+        return NBA2K25(player_name=player, **self.skills_for(player), **kwargs)
+
+
+def count_shots(paths, chunk_rows=CHUNK_ROWS):
+    """
+    Count attempts and makes per player and shot type.
+
+    Rows are parsed in batches by NumPy's C reader and folded in with
+    np.bincount, so memory stays proportional to the number of players,
+    not shots.
+
+    Returns:
+        tuple: (players, attempts, made) with arrays shaped
+        (players, shot types).
+    """
+    player_ids = {}
+    type_count = len(SHOT_CODES)
+    attempts = np.zeros(0, dtype=np.int64)
+    made = np.zeros(0, dtype=np.int64)
+
+    for path in paths:
+        for players, shot_types, outcomes in read_shot_chunks(
+            path, chunk_rows
+        ):
+            # Map this chunk's distinct names onto stable global ids
+            names, inverse = np.unique(players, return_inverse=True)
+            global_ids = np.array(
+                [player_ids.setdefault(name, len(player_ids))
+                 for name in names.tolist()],
+                dtype=np.int64
+            )
+
+            codes = np.full(shot_types.shape, -1, dtype=np.int64)
+            for shot_type, code in SHOT_CODES.items():
+                codes[shot_types == shot_type] = code
+            if (codes < 0).any():
+                unknown = shot_types[codes < 0][0]
+                raise ValueError(f"Unknown shot type in {path}: {unknown}")
+
+            hits = np.isin(outcomes, MADE_VALUES)
+            cells = global_ids[inverse] * type_count + codes
+
+            length = len(player_ids) * type_count
+            attempts = np.pad(attempts, (0, length - attempts.size))
+            made = np.pad(made, (0, length - made.size))
+            attempts += np.bincount(cells, minlength=length)
+            made += np.bincount(cells[hits], minlength=length)
+
+    players = list(player_ids)
+    shape = (len(players), type_count)
+    return players, attempts.reshape(shape), made.reshape(shape)
+
+
+def read_shot_chunks(path, chunk_rows=CHUNK_ROWS):
+    """Yield (players, shot_types, outcomes) string arrays per batch."""
+    with open(path, encoding="utf-8") as file:
+        header = [column.strip() for column in file.readline().split(",")]
+        if header == [""]:
+            return
+        columns = [
+            header.index(PLAYER_COLUMN),
+            header.index(SHOT_TYPE_COLUMN),
+            header.index(MADE_COLUMN)
+        ]
+
+        while True:
+            with warnings.catch_warnings():
+                # An exhausted file is reported as an empty batch
+                warnings.simplefilter("ignore", UserWarning)
+                # No comment character: '#' is part of names like
+                # "Lakers #1"; quoted fields may hold commas
+                rows = np.loadtxt(
+                    file, dtype=str, delimiter=",", comments=None,
+                    quotechar='"', usecols=columns, max_rows=chunk_rows,
+                    ndmin=2
+                )
+            if rows.size == 0:
+                return
+            yield rows[:, 0], rows[:, 1], rows[:, 2]
+
+
+def fit_skills(paths, confidence=DEFAULT_CONFIDENCE, chunk_rows=CHUNK_ROWS):
+    """Fit per-shot-type success probabilities from shot-history files.
+
+    The maximum likelihood estimate of a Bernoulli success rate is
+    makes / attempts, computed for every player at once.
+    """
+    players, attempts, made = count_shots(paths, chunk_rows)
+    return SkillFit(players, attempts, made, confidence)
@@ -1,11 +1,5 @@
-# Import necessary standard libraries
-import os
-import random
-
-# Import necessary third-party libraries
-import pypokedex
-from pokemon.skills import get_pokemon
-from pyfiglet import figlet_format
+from . import metrics, pokemon_data, randomness, screen
+from .banners import render_banner
 
 # Game constants
 FONT_STYLE = "cosmic"
@@ -54,10 +48,31 @@ DIFFICULTIES = {
 # Unit conversion for Pokemon height and weight
 POKEMON_UNIT_DIVISOR = 10
 
+# Menu option -> name of the method it runs, in menu order
+MAIN_MENU_OPTIONS = {
+    "START_GAME": "start_game",
+    "VIEW_INSTRUCTIONS": "display_instructions",
+    "CHANGE_DIFFICULTY": "change_difficulty",
+    "VIEW_STATS": "display_stats",
+    "RESET_GAME": "reset_game",
+}
+ROUND_MENU_OPTIONS = {
+    "MAKE_GUESS": "process_guess",
+    "VIEW_HINT": "show_hint",
+    "VIEW_STATS": "display_stats",
+}
+
 class PokemonGame:
     """Main game class that handles all Pokemon guessing game logic."""
 
-    def __init__(self):
+    __slots__ = (
+        "player_name", "is_class_running", "score", "highest_score",
+        "streak", "highest_streak", "difficulty", "used_pokemon_ids",
+        "current_pokemon", "current_pokemon_ascii", "is_game_active",
+        "hints", "attempts_left", "pokedex", "rng"
+    )
+
+    def __init__(self, rng=None):
         """Initialize the game with default values."""
         self.player_name = ""
         self.is_class_running = True
@@ -72,11 +87,18 @@ class PokemonGame:
         self.is_game_active = False
         self.hints = []
         self.attempts_left = INITIAL_ATTEMPTS  # Initalize attempts left to 0
+        # Pokemon details and ASCII art, mapped from the shared table
+        self.pokedex = pokemon_data.get_table()
+        # Source of Pokemon picks (see randomness.SessionRandom)
+        self.rng = rng if rng is not None else randomness.current()
 
     def menu(self):
         """Main game loop."""
+        # The same game may be reopened from the Mekus menu
+        self.is_class_running = True
         self.display_welcome()
-        self.get_player_name()
+        if not self.player_name:
+            self.get_player_name()
         self.clear_screen()
 
         # Call method to show the main menu
@@ -88,7 +110,7 @@ class PokemonGame:
 
         # Prepare welcome banner using ASCII art
         BANNER_JUSTIFICATION = "center"
-        banner = figlet_format(
+        banner = render_banner(
             "Who's That Pokemon?",
             font=FONT_STYLE,
             justify=BANNER_JUSTIFICATION,
@@ -124,26 +146,16 @@ class PokemonGame:
             self.display_main_menu_options()
             self.handle_main_menu_choice()
 
-    def get_main_menu_options(self):
-        """Return the main menu options dictionary."""
-        return {
-            "START_GAME": self.start_game,
-            "VIEW_INSTRUCTIONS": self.display_instructions,
-            "CHANGE_DIFFICULTY": self.change_difficulty,
-            "VIEW_STATS": self.display_stats,
-            "RESET_GAME": self.reset_game,
-        }
-
     def display_main_menu_options(self):
         """Display the main menu options."""
 
         # Prepare main menu title and options
         MAIN_MENU_TITLE = "MAIN MENU"
-        self.display_menu(self.get_main_menu_options(), MAIN_MENU_TITLE)
+        self.display_menu(MAIN_MENU_OPTIONS, MAIN_MENU_TITLE)
 
     def handle_main_menu_choice(self):
         """Process user's main menu selection."""
-        choice = self.get_choice(len(self.get_main_menu_options()))
+        choice = self.get_choice(len(MAIN_MENU_OPTIONS))
 
         # If choice is 0, exit the game
         if choice == 0:
@@ -151,7 +163,7 @@ class PokemonGame:
             return
 
         self.clear_screen(has_prompt=False)
-        self.execute_menu_action(self.get_main_menu_options(), choice)
+        self.execute_menu_action(MAIN_MENU_OPTIONS, choice)
 
     def go_back_to_main_menu(self):
         """Clear screen and return to main menu."""
@@ -205,7 +217,7 @@ class PokemonGame:
     def select_random_pokemon(self):
         """Select a random Pokemon that hasn't been used."""
         pokemon_id = self.generate_unique_pokemon_id()
-        self.current_pokemon = pypokedex.get(dex=pokemon_id)
+        self.current_pokemon = self.pokedex.get(pokemon_id)
         self.used_pokemon_ids.add(pokemon_id)
 
     def generate_unique_pokemon_id(self):
@@ -215,26 +227,22 @@ class PokemonGame:
 
         # Loop until a valid unique Pokemon ID is found
         while True:
-            pokemon_id = random.randint(MIN_POKEMON_ID, MAX_POKEMON_ID)
+            pokemon_id = self.rng.randint(MIN_POKEMON_ID, MAX_POKEMON_ID)
             if self.is_valid_pokemon_id(pokemon_id):
                 return pokemon_id  # Return the valid unique Pokemon ID
 
     def is_valid_pokemon_id(self, pokemon_id):
         """Check if Pokemon ID exists and hasn't been used."""
-        pokemon = None
-        try:
-            # Check if the Pokemon ID exists in the Pypokedex
-            pokemon = pypokedex.get(dex=pokemon_id)
-        except Exception:
-            # If ValueError is raised, the Pokemon ID does not exist
-            return False
-
-        return pokemon and (pokemon_id not in self.used_pokemon_ids)
+        # Check if the Pokemon ID exists in the Pokedex table
+        return (
+            self.pokedex.exists(pokemon_id)
+            and pokemon_id not in self.used_pokemon_ids
+        )
 
     def is_pokemon_unique(self, pokemon_id):
         """Check if the Pokemon ID is unique for this game."""
         if pokemon_id not in self.used_pokemon_ids:
-            self.current_pokemon = pypokedex.get(dex=pokemon_id)
+            self.current_pokemon = self.pokedex.get(pokemon_id)
             self.used_pokemon_ids.add(pokemon_id)
             return True
 
@@ -275,8 +283,7 @@ class PokemonGame:
 
     def display_pokemon(self):
         """Display Pokemon ASCII art as silhouette."""
-        pokemon_data = get_pokemon(pid=self.current_pokemon.dex)
-        ascii_art = pokemon_data[self.current_pokemon.dex]["ascii"]
+        ascii_art = self.pokedex.ascii(self.current_pokemon.dex)
         self.current_pokemon_ascii = ascii_art
 
         silhouette = self.create_silhouette(ascii_art)
@@ -299,22 +306,14 @@ class PokemonGame:
         self.display_round_state_menu_options()
         self.handle_round_menu_choice()
 
-    def get_round_menu_options(self):
-        """Return the round menu options dictionary."""
-        return {
-            "MAKE_GUESS": self.process_guess,
-            "VIEW_HINT": self.show_hint,
-            "VIEW_STATS": self.display_stats,
-        }
-
     def display_round_state_menu_options(self):
         """Display the round menu options."""
         ROUND_MENU_TITLE = "ROUND ACTIONS"
-        self.display_menu(self.get_round_menu_options(), ROUND_MENU_TITLE)
+        self.display_menu(ROUND_MENU_OPTIONS, ROUND_MENU_TITLE)
 
     def handle_round_menu_choice(self):
         """Process user's round menu selection."""
-        choice = self.get_choice(len(self.get_round_menu_options()))
+        choice = self.get_choice(len(ROUND_MENU_OPTIONS))
 
         if choice == 0:
             self.go_back_to_main_menu()
@@ -322,7 +321,7 @@ class PokemonGame:
 
         self.clear_screen(has_prompt=False)
         self.display_round_state()  # Show current round state
-        self.execute_menu_action(self.get_round_menu_options(), choice)
+        self.execute_menu_action(ROUND_MENU_OPTIONS, choice)
 
     def process_guess(self):
         """Handle player's Pokemon guess."""
@@ -672,7 +671,7 @@ class PokemonGame:
     def execute_menu_action(self, options_dict, choice):
         """Execute the selected menu action from the options dictionary."""
         selected_action = list(options_dict.values())[choice - 1]
-        selected_action()
+        metrics.call_handler(getattr(self, selected_action))
 
     def clear_screen(self, has_prompt=True):
         """Clear console screen."""
@@ -683,4 +682,4 @@ class PokemonGame:
             input("\nPress Enter to continue...")
 
         # Clear the console screen
-        os.system("cls" if os.name == "nt" else "clear")
\ No newline at end of file
+        screen.clear_screen()
\ No newline at end of file
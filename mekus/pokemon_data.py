@@ -0,0 +1,288 @@
+import json  # Standard library
+import mmap
+import os
+import struct
+import sys
+import time
+import unicodedata
+
+# Where the shared table lives; every game process maps the same file
+DEFAULT_DATA_FILE = os.path.join(
+    os.path.expanduser("~"), ".mekus", "pokemon_data.bin"
+)
+DATA_FILE_ENV = "MEKUS_POKEMON_DATA"
+
+# File layout, all little-endian:
+#   header  magic, version, number of slots (highest dex number)
+#   slots   one RECORD per dex number from 1, zero-filled if missing
+#   strings UTF-8 text referenced by (offset, length) pairs
+HEADER = struct.Struct("<4sII")
+MAGIC = b"PKDX"
+VERSION = 2  # 1 stored weights in the wrong unit; such tables are rebuilt
+# height (dm), weight (hg), then offset/length of name, types,
+# abilities and ASCII art
+RECORD = struct.Struct("<HH8I")
+LIST_SEPARATOR = ","
+
+# The pokemon package gives height in meters and weight in pounds; the
+# table stores PokeAPI's units, decimeters and hectograms
+DECIMETERS_PER_METER = 10
+HECTOGRAMS_PER_POUND = 4.5359237
+
+# Known (height dm, weight hg) per dex number, checked after a build
+KNOWN_SIZES = {
+    1: (7, 69),  # Bulbasaur
+    6: (17, 905),  # Charizard
+    25: (4, 60),  # Pikachu
+    143: (21, 4600)  # Snorlax
+}
+
+# Gender symbols as PokeAPI spells them in names
+NAME_REPLACEMENTS = {"♀": "-f", "♂": "-m"}
+
+_table = None  # This process's attached table
+
+
+def slugify(name):
+    """Spell a name the way PokeAPI (and so pypokedex) does."""
+    for symbol, replacement in NAME_REPLACEMENTS.items():
+        name = name.replace(symbol, replacement)
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    name = name.lower().replace(" ", "-")
+    return "".join(char for char in name if char.isalnum() or char == "-")
+
+
+def source_file():
+    """Return the pokemon package's database the table is built from."""
+    import pokemon  # Only needed when (re)building the table
+
+    return os.path.join(
+        os.path.dirname(pokemon.__file__), "database", "pokemons.json"
+    )
+
+
+def build(path=None, source=None):
+    """
+    Write the fixed-layout table from the pokemon package's database.
+
+    Parameters:
+        path (str): Output file; defaults to data_file().
+        source (str): pokemons.json to read; defaults to source_file().
+
+    Returns:
+        int: Number of Pokemon written.
+    """
+    path = path or data_file()
+    with open(source or source_file(), encoding="utf-8") as file:
+        entries = {int(dex): entry for dex, entry in json.load(file).items()}
+
+    slots = max(entries)
+    strings = bytearray()
+    string_base = HEADER.size + slots * RECORD.size
+
+    def add(text):
+        data = text.encode("utf-8")
+        offset = string_base + len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    table = bytearray(string_base)
+    HEADER.pack_into(table, 0, MAGIC, VERSION, slots)
+    for dex, entry in entries.items():
+        fields = (
+            add(slugify(entry["name"]))
+            + add(LIST_SEPARATOR.join(entry["type"]))
+            + add(LIST_SEPARATOR.join(
+                slugify(ability) for ability in entry["abilities"]
+            ))
+            + add(entry["ascii"])
+        )
+        RECORD.pack_into(
+            table, HEADER.size + (dex - 1) * RECORD.size,
+            round(entry["height"] * DECIMETERS_PER_METER),
+            round(entry["weight"] * HECTOGRAMS_PER_POUND),
+            *fields
+        )
+    check_sizes(table, entries)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(table)
+        file.write(strings)
+    os.replace(temp_path, path)  # Readers never see a partial table
+    return len(entries)
+
+
+def check_sizes(table, entries):
+    """Raise ValueError if a known Pokemon's size came out wrong."""
+    for dex, expected in KNOWN_SIZES.items():
+        if dex not in entries:
+            continue
+        size = RECORD.unpack_from(
+            table, HEADER.size + (dex - 1) * RECORD.size
+        )[:2]
+        if size != expected:
+            raise ValueError(
+                f"Pokemon {dex} has height/weight {size}, expected "
+                f"{expected}; has the source's unit changed?"
+            )
+
+
+def data_file():
+    return os.environ.get(DATA_FILE_ENV) or DEFAULT_DATA_FILE
+
+
+class Ability:
+    """An ability, shaped like pypokedex's so game code reads .name."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class PokemonEntry:
+    """The pypokedex.Pokemon fields the game uses, read from the table."""
+
+    def __init__(self, dex, name, types, abilities, height, weight):
+        self.dex = dex
+        self.name = name
+        self.types = types
+        self.abilities = abilities
+        self.height = height
+        self.weight = weight
+
+
+class PokedexTable:
+    """Read-only view of the table, mapped from the shared file.
+
+    Attaching maps the file and checks the header; nothing is parsed up
+    front. Pages come from the OS page cache, so every process reading
+    the same file shares one copy of the data.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.slots = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.buffer.close()
+            raise ValueError(f"Not a version {VERSION} Pokemon table: {path}")
+
+    def record(self, dex):
+        """Return a dex number's raw RECORD fields."""
+        if not 1 <= dex <= self.slots:
+            raise ValueError(f"No Pokemon with dex number {dex}")
+        fields = RECORD.unpack_from(
+            self.buffer, HEADER.size + (dex - 1) * RECORD.size
+        )
+        if not fields[3]:  # Empty name: a gap in the numbering
+            raise ValueError(f"No Pokemon with dex number {dex}")
+        return fields
+
+    def text(self, offset, length):
+        return self.buffer[offset:offset + length].decode("utf-8")
+
+    def exists(self, dex):
+        try:
+            self.record(dex)
+        except ValueError:
+            return False
+        return True
+
+    def get(self, dex):
+        """Return a Pokemon's details; raises ValueError if unknown."""
+        height, weight, *spans = self.record(dex)
+        name, types, abilities = (
+            self.text(spans[index], spans[index + 1])
+            for index in (0, 2, 4)
+        )
+        return PokemonEntry(
+            dex, name, types.split(LIST_SEPARATOR),
+            [Ability(ability) for ability in abilities.split(LIST_SEPARATOR)],
+            height, weight
+        )
+
+    def ascii(self, dex):
+        """Return a Pokemon's ASCII art."""
+        fields = self.record(dex)
+        return self.text(fields[8], fields[9])
+
+    def close(self):
+        self.buffer.close()
+
+
+def get_table():
+    """Attach this process to the shared table, building it if missing."""
+    global _table
+    if _table is not None:
+        return _table
+
+    path = data_file()
+    try:
+        _table = PokedexTable(path)
+    except (OSError, ValueError):
+        build(path)
+        _table = PokedexTable(path)
+    return _table
+
+
+def anonymous_memory_kb():
+    """
+    Return this process's anonymous resident memory (Linux), or None.
+
+    File-backed pages of the mapped table are left out: they live in the
+    page cache once, however many processes map them.
+    """
+    try:
+        with open("/proc/self/smaps_rollup", encoding="ascii") as file:
+            lines = file.read().splitlines()
+    except OSError:
+        return None
+    return sum(
+        int(line.split()[1]) for line in lines
+        if line.startswith("Anonymous:")
+    )
+
+
+def measure_worker(mode):
+    """Worker body: load every Pokemon's data, report time and memory."""
+    before = anonymous_memory_kb()
+    started = time.perf_counter()
+    if mode == "json":
+        with open(source_file(), encoding="utf-8") as file:
+            entries = json.load(file)
+        attached = time.perf_counter() - started
+        art = sum(len(entry["ascii"]) for entry in entries.values())
+    else:
+        table = PokedexTable(data_file())
+        attached = time.perf_counter() - started
+        art = sum(
+            len(table.ascii(dex)) for dex in range(1, table.slots + 1)
+            if table.exists(dex)
+        )
+    return attached, anonymous_memory_kb() - before, art
+
+
+def compare(workers=8):
+    """Compare per-worker cost of the shared table with loading JSON."""
+    import multiprocessing
+
+    get_table()
+    context = multiprocessing.get_context("spawn")
+    for mode in ("json", "table"):
+        with context.Pool(workers) as pool:
+            results = pool.map(measure_worker, [mode] * workers)
+        attach_ms = max(result[0] for result in results) * 1000
+        anonymous_kb = max(result[1] for result in results)
+        print(f"{mode:>5}: {workers} workers, load/attach <= "
+              f"{attach_ms:.2f} ms, anonymous memory <= {anonymous_kb} KiB "
+              "per worker")
+
+
+if __name__ == "__main__":
+    # Run as part of installing: python -m mekus.pokemon_data
+    if sys.argv[1:2] == ["--compare"]:
+        compare(int((sys.argv[2:3] or [8])[0]))
+    else:
+        print(f"Wrote {build()} Pokemon to {data_file()}")
@@ -0,0 +1,402 @@
+import asyncio  # Standard library
+import fcntl
+import os
+import shutil
+import statistics
+import struct
+import sys
+import tempfile
+import termios
+import time
+
+from . import (
+    driver, log_tail, pokemon_data, randomness, valorant_profiles
+)
+from .benchmarks import (
+    PROCESS_THRESHOLD, current_commit, load_results, save_results
+)
+from .screen import ANSI_SEQUENCE
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Every session runs main.py in a pseudo-terminal of this size
+TERMINAL_SIZE = (80, 24)
+TERMINAL_TYPE = "xterm-256color"
+READ_SIZE = 65536
+STEP_TIMEOUT = 30.0  # Seconds to wait for a frame before giving up
+
+DEFAULT_SESSIONS = 20
+LATENCY_PERCENTILES = (50, 90, 99)
+# Session N is seeded with N, so frame sizes repeat between runs of the
+# same build and more than this is a real regression
+BYTES_THRESHOLD = 1.1
+
+# Scripted users, one per menu; each starts and ends at the main menu.
+# The prompt expected after every line is taken from a headless run of
+# the same script, so the scripts stay plain lists of keystrokes.
+SCRIPTS = {
+    "agulto": [
+        "1", "1", "Bench", "", "2", "", "3", "", "4", "", "5", "", "6", "",
+        "7", "", "0", "", "0"
+    ],
+    "dazo": [
+        "2", "1", "10", "2", "5", "", "2", "", "3", "win", "", "4", "",
+        "5", "", "0", "", "0"
+    ],
+    "jundam": [
+        "3", "Bench", "Gold", "Vandal", "Ascent", "1", "10", "5", "3", "",
+        "3", "6", "10", "", "6", "", "", "12", "3", "4", "8", "20", "2",
+        "3", "1", "2", "y", "", "7", "", "", "", "0", "", "0"
+    ],
+    "olazo": [
+        "4", "Ash", "", "1", "2", "", "3", "", "1", "missingno", "", "0",
+        "0", "", "0"
+    ],
+    "serohijos": [
+        "5", "rock", "", "paper", "", "scissors", "", "quit", "", "0"
+    ]
+}
+
+
+class HarnessError(Exception):
+    """Raised when a session's output does not match its script."""
+
+
+def visible_text(data):
+    """Return terminal output as the plain text a user would read."""
+    text = data.decode("utf-8", "replace").replace("\r", "")
+    return ANSI_SEQUENCE.sub("", text)
+
+
+def expected_prompts(script):
+    """
+    Return the prompts a script's frames should end with.
+
+    The script is replayed headlessly with the driver; the last line of
+    every frame is the prompt the user answers next.
+
+    Returns:
+        tuple: (prompt of the first screen, list of the prompt expected
+        after each line; the last is None, as the last line exits)
+    """
+    factory, entry = driver.load_target(driver.DEFAULT_TARGET)
+    result = driver.run_session(factory, script, entry, seed=0)
+
+    if result.error is not None or not result.completed:
+        raise HarnessError(f"Script does not run to the end: {script}")
+    prompts = [visible_text(frame.encode("utf-8")).rsplit("\n", 1)[-1]
+               for frame in result.frames]
+    # frames[0] is the first screen and frames[-1] the goodbye output
+    return prompts[0], prompts[1:-1] + [None]
+
+
+class StepResult:
+    """Latency and size of the frame one keystroke produced."""
+
+    def __init__(self, line, seconds, size):
+        self.line = line
+        self.seconds = seconds  # From the keystroke to the full frame
+        self.size = size  # Bytes written to the terminal
+
+
+class PtySession:
+    """One scripted user driving main.py through a pseudo-terminal.
+
+    Echo is switched off on the terminal, so everything read back is
+    output of the program, exactly as a terminal would receive it.
+    """
+
+    def __init__(self, name, script, first_prompt, prompts, environment):
+        self.name = name
+        self.script = script
+        self.first_prompt = first_prompt
+        self.prompts = prompts
+        self.environment = environment
+        self.startup_seconds = None
+        self.steps = []
+        self.error = None
+        self.buffer = bytearray()
+        self.closed = False
+        self.changed = None
+
+    def open_terminal(self):
+        """Return (master, slave) descriptors of a new pseudo-terminal."""
+        master, slave = os.openpty()
+        columns, rows = TERMINAL_SIZE
+        fcntl.ioctl(
+            slave, termios.TIOCSWINSZ, struct.pack("HHHH", rows, columns,
+                                                   0, 0)
+        )
+        attributes = termios.tcgetattr(slave)
+        attributes[3] &= ~termios.ECHO
+        termios.tcsetattr(slave, termios.TCSANOW, attributes)
+        return master, slave
+
+    def on_readable(self, master):
+        try:
+            data = os.read(master, READ_SIZE)
+        except OSError:
+            data = b""  # EIO: every copy of the slave side is closed
+        if data:
+            self.buffer.extend(data)
+        else:
+            self.closed = True
+            asyncio.get_running_loop().remove_reader(master)
+        self.changed.set()
+
+    async def wait_for(self, prompt, started):
+        """Wait until the output ends in prompt (or closes, for None)."""
+        deadline = started + STEP_TIMEOUT
+        while True:
+            if prompt is None and self.closed:
+                return
+            if prompt is not None and visible_text(self.buffer).endswith(
+                prompt
+            ):
+                return
+            if self.closed:
+                raise HarnessError(
+                    f"Program exited while waiting for {prompt!r}"
+                )
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise HarnessError(
+                    f"No {prompt!r} after {STEP_TIMEOUT:.0f} s; screen "
+                    f"ends {visible_text(self.buffer)[-80:]!r}"
+                )
+            self.changed.clear()
+            try:
+                await asyncio.wait_for(self.changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self):
+        """Start main.py, then type the script one line per frame."""
+        loop = asyncio.get_running_loop()
+        self.changed = asyncio.Event()
+        master, slave = self.open_terminal()
+        started = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "main.py", stdin=slave, stdout=slave,
+            stderr=slave, cwd=PROJECT_ROOT, env=self.environment,
+            start_new_session=True
+        )
+        os.close(slave)
+        loop.add_reader(master, self.on_readable, master)
+        try:
+            await self.wait_for(self.first_prompt, started)
+            self.startup_seconds = time.perf_counter() - started
+            for line, prompt in zip(self.script, self.prompts):
+                self.buffer.clear()
+                started = time.perf_counter()
+                os.write(master, line.encode("utf-8") + b"\r")
+                await self.wait_for(prompt, started)
+                self.steps.append(StepResult(
+                    line, time.perf_counter() - started, len(self.buffer)
+                ))
+        except HarnessError as error:
+            self.error = error
+        finally:
+            if not self.closed:
+                loop.remove_reader(master)
+                process.kill()
+            await process.wait()
+            os.close(master)
+
+
+def session_environment(session_dir, seed):
+    """
+    Return the environment of one session's main.py.
+
+    Nothing a session touches leaves the machine: Pokemon come from the
+    locally built shared table, and agent profiles and followed-log
+    state from a private directory. Random outcomes follow the given
+    seed.
+    """
+    environment = dict(os.environ, TERM=TERMINAL_TYPE)
+    # Sizes must come from the terminal, as they would for a real user
+    environment.pop("COLUMNS", None)
+    environment.pop("LINES", None)
+    environment.pop("MEKUS_METRICS", None)
+    environment[pokemon_data.DATA_FILE_ENV] = pokemon_data.data_file()
+    environment[valorant_profiles.PROFILE_DIR_ENV] = os.path.join(
+        session_dir, "profiles"
+    )
+    environment[log_tail.STATE_DIR_ENV] = os.path.join(session_dir, "tail")
+    environment[randomness.SEED_ENV] = str(seed)
+    environment.pop(randomness.RECORD_ENV, None)
+    environment.pop(randomness.REPLAY_ENV, None)
+    return environment
+
+
+def percentiles(values):
+    """Return {"p50": ..., ...} of values, in milliseconds."""
+    if len(values) < 2:
+        return {}
+    cuts = statistics.quantiles(
+        [seconds * 1000 for seconds in values], n=100, method="inclusive"
+    )
+    return {f"p{percent}": cuts[percent - 1]
+            for percent in LATENCY_PERCENTILES}
+
+
+def summarize(sessions):
+    """
+    Reduce sessions to flat "<script>.<metric>" results.
+
+    Every script, and "all" for every session together, gets
+    latency_p50/p90/p99_ms (keystroke to complete frame), startup_p50_ms,
+    bytes_per_frame, max_bytes_per_frame and errors.
+    """
+    groups = {"all": sessions}
+    for session in sessions:
+        groups.setdefault(session.name, []).append(session)
+
+    results = {}
+    for name, members in sorted(groups.items()):
+        steps = [step for session in members for step in session.steps]
+        startups = [session.startup_seconds for session in members
+                    if session.startup_seconds is not None]
+        for key, value in percentiles(
+            [step.seconds for step in steps]
+        ).items():
+            results[f"{name}.latency_{key}_ms"] = value
+        if startups:
+            results[f"{name}.startup_p50_ms"] = (
+                statistics.median(startups) * 1000
+            )
+        if steps:
+            sizes = [step.size for step in steps]
+            results[f"{name}.bytes_per_frame"] = statistics.mean(sizes)
+            results[f"{name}.max_bytes_per_frame"] = max(sizes)
+        results[f"{name}.errors"] = sum(
+            session.error is not None for session in members
+        )
+    return results
+
+
+def run_harness(sessions=DEFAULT_SESSIONS, scripts=None):
+    """
+    Run concurrent scripted users, each in its own pseudo-terminal.
+
+    Parameters:
+        sessions (int): Users started at once; they take the scripts in
+            turn, so 100 sessions run each of the 5 menus 20 times.
+        scripts (list): Names from SCRIPTS; all if None.
+
+    Returns:
+        tuple: (summarize() results, the PtySession objects)
+    """
+    names = scripts or list(SCRIPTS)
+    pokemon_data.get_table()  # Built once, shared by every session
+    plans = {name: expected_prompts(SCRIPTS[name]) for name in names}
+
+    work_dir = tempfile.mkdtemp(prefix="mekus-pty-")
+    runs = []
+    for number in range(sessions):
+        name = names[number % len(names)]
+        first_prompt, prompts = plans[name]
+        session_dir = os.path.join(work_dir, str(number))
+        runs.append(PtySession(
+            name, SCRIPTS[name], first_prompt, prompts,
+            session_environment(session_dir, number)
+        ))
+
+    async def run_all():
+        await asyncio.gather(*(session.run() for session in runs))
+
+    try:
+        asyncio.run(run_all())
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return summarize(runs), runs
+
+
+def regression_threshold(name):
+    """
+    Return how much a metric may grow before it is a regression.
+
+    Latency is only judged over all sessions together; a single script's
+    share of a run is too small a sample under load.
+    """
+    group, _, metric = name.partition(".")
+    if metric == "bytes_per_frame":
+        return BYTES_THRESHOLD
+    if group == "all" and metric.startswith(("latency", "startup")):
+        return PROCESS_THRESHOLD
+    return None
+
+
+def print_report(results, baseline):
+    """Print results beside a baseline; return the regression count."""
+    stored = baseline.get("results", {})
+    print(f"Baseline: {baseline.get('commit') or 'none'}, "
+          f"current: {current_commit() or 'unknown'}\n")
+    print(f"{'Metric':<36}{'Baseline':>11}{'Current':>11}{'Ratio':>8}")
+    regressions = 0
+    for name, value in results.items():
+        before = stored.get(name)
+        ratio = value / before if before else None
+        threshold = regression_threshold(name)
+        if name.endswith(".errors"):
+            regressed = value > (before or 0)
+        else:
+            regressed = (
+                threshold is not None and ratio is not None
+                and ratio > threshold
+            )
+        before_text = "-" if before is None else f"{before:,.2f}"
+        ratio_text = f"{ratio:.2f}x" if ratio is not None else "-"
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<36}{before_text:>11}{value:>11,.2f}"
+              f"{ratio_text:>8}{flag}")
+        regressions += regressed
+    return regressions
+
+
+def main(arguments):
+    """
+    Usage: python -m mekus.pty_harness [--sessions N] [--save PATH]
+    [--baseline PATH] [SCRIPT...]
+
+    Runs N concurrent users (default 20) through the menus in
+    pseudo-terminals and reports keystroke-to-frame latency and bytes
+    per frame. To compare two builds, run one with --save PATH and the
+    other with --baseline PATH; exits with 1 on a regression or error.
+    """
+    options = {"--sessions": str(DEFAULT_SESSIONS), "--save": None,
+               "--baseline": None}
+    names = []
+    arguments = list(arguments)
+    while arguments:
+        argument = arguments.pop(0)
+        if argument in options and arguments:
+            options[argument] = arguments.pop(0)
+        elif argument in SCRIPTS:
+            names.append(argument)
+        else:
+            print(main.__doc__)
+            return 2
+
+    started = time.perf_counter()
+    results, sessions = run_harness(int(options["--sessions"]), names)
+    elapsed = time.perf_counter() - started
+    print(f"{len(sessions)} sessions in {elapsed:.1f} s")
+    for session in sessions:
+        if session.error is not None:
+            print(f"{session.name} session error: {session.error}")
+            break
+
+    baseline = {}
+    if options["--baseline"]:
+        baseline = load_results(options["--baseline"])
+    regressions = print_report(results, baseline)
+
+    if options["--save"]:
+        save_results(results, options["--save"])
+        print(f"\nSaved results to {options['--save']}")
+    return 1 if regressions or results["all.errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,204 @@
+import array  # Standard library
+import atexit
+import os
+import random
+import struct
+import sys
+import threading
+
+# Environment switches for the process-wide source used outside
+# sessions: a fixed seed, a file to record every draw to at exit, and a
+# recorded file to replay instead of drawing
+SEED_ENV = "MEKUS_SEED"
+RECORD_ENV = "MEKUS_RNG_RECORD"
+REPLAY_ENV = "MEKUS_RNG_REPLAY"
+
+# Draw log layout: HEADER (magic, version, seed), then every draw as a
+# little-endian int64, in the order the game made them
+HEADER = struct.Struct("<4sHq")
+MAGIC = b"MKRN"
+VERSION = 1
+DRAW_TYPE = "q"
+SEED_BITS = 63  # Seeds and getrandbits() draws must fit an int64
+
+# Sources bound to threads that run their own session
+_local = threading.local()
+_default = None
+
+
+class ReplayError(RuntimeError):
+    """Raised when a replayed session asks for a draw its log lacks."""
+
+
+class SessionRandom:
+    """Seeded random source for one session, optionally recorded.
+
+    Games draw through randint(), choice() and getrandbits(). When
+    recording, each result is appended to an int64 array; when
+    replaying, results come from a recorded log instead of the
+    generator, so a replay reproduces every outcome of the original
+    session exactly.
+    """
+
+    __slots__ = ("seed", "generator", "draws", "replay", "position")
+
+    def __init__(self, seed=None, record=False, replay=None):
+        if seed is not None and not 0 <= seed < 1 << SEED_BITS:
+            raise ValueError(
+                f"Seed must be from 0 to {(1 << SEED_BITS) - 1}: {seed}"
+            )
+        self.seed = seed  # Drawn from the OS on first use if None
+        # Seeded on the first draw: its state is about 2.5 KiB, and idle
+        # sessions never draw
+        self.generator = None
+        self.draws = array.array(DRAW_TYPE) if record else None
+        self.replay = replay  # array of logged draws, or None
+        self.position = 0  # Next logged draw to replay
+
+    def session_seed(self):
+        """Return the seed, drawing it from the OS on first use."""
+        if self.seed is None:
+            self.seed = random.SystemRandom().getrandbits(SEED_BITS)
+        return self.seed
+
+    def replayed(self, low, high):
+        """Return the next logged draw, checking it fits [low, high]."""
+        position = self.position
+        if position >= len(self.replay):
+            raise ReplayError(f"Log ends before draw {position + 1}")
+        value = self.replay[position]
+        if not low <= value <= high:
+            raise ReplayError(
+                f"Draw {position + 1} was {value}, outside {low}..{high}; "
+                "the session has diverged from the log"
+            )
+        self.position = position + 1
+        if self.draws is not None:
+            self.draws.append(value)
+        return value
+
+    def randint(self, low, high):
+        """Return a random integer N with low <= N <= high."""
+        if self.replay is not None:
+            return self.replayed(low, high)
+        generator = self.generator
+        if generator is None:
+            generator = self.generator = random.Random(self.session_seed())
+        value = generator.randint(low, high)
+        if self.draws is not None:
+            self.draws.append(value)
+        return value
+
+    def choice(self, sequence):
+        """Return a random element; the index is what gets logged."""
+        return sequence[self.randint(0, len(sequence) - 1)]
+
+    def getrandbits(self, bits):
+        """Return a random integer of up to SEED_BITS bits."""
+        if bits > SEED_BITS:
+            raise ValueError(f"Draws are limited to {SEED_BITS} bits")
+        if self.replay is not None:
+            return self.replayed(0, (1 << bits) - 1)
+        generator = self.generator
+        if generator is None:
+            generator = self.generator = random.Random(self.session_seed())
+        value = generator.getrandbits(bits)
+        if self.draws is not None:
+            self.draws.append(value)
+        return value
+
+    def numpy_generator(self):
+        """
+        Return a NumPy Generator seeded from this source.
+
+        Only the seed is drawn (and logged), so a simulation can take
+        millions of numbers from it at NumPy speed and still replay
+        exactly.
+        """
+        import numpy as np  # Only needed for block generation
+
+        return np.random.default_rng(self.getrandbits(SEED_BITS))
+
+    def randint_block(self, low, high, size):
+        """Return an int64 array of size draws with low <= N <= high."""
+        return self.numpy_generator().integers(low, high + 1, size)
+
+    def to_bytes(self):
+        """Encode the seed and the recorded draws as a draw log."""
+        if self.draws is None:
+            raise ValueError("This source is not recording")
+        draws = self.draws
+        if sys.byteorder == "big":
+            draws = array.array(DRAW_TYPE, draws)
+            draws.byteswap()
+        header = HEADER.pack(MAGIC, VERSION, self.session_seed())
+        return header + draws.tobytes()
+
+
+def load_log(data):
+    """
+    Decode a draw log written by SessionRandom.to_bytes().
+
+    Returns:
+        tuple: (seed, array of draws)
+    """
+    try:
+        magic, version, seed = HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise ValueError("Draw log is truncated") from None
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} Mekus draw log")
+    draws = array.array(DRAW_TYPE)
+    draws.frombytes(data[HEADER.size:])
+    if sys.byteorder == "big":
+        draws.byteswap()
+    return seed, draws
+
+
+def replay_source(data, record=False):
+    """Return a SessionRandom that replays a draw log."""
+    seed, draws = load_log(data)
+    return SessionRandom(seed, record=record, replay=draws)
+
+
+def save_log(source, path):
+    """Write a recording source's draw log to path."""
+    with open(path, "wb") as file:
+        file.write(source.to_bytes())
+
+
+def default_source():
+    """Build the process-wide source from the environment variables."""
+    replay_path = os.environ.get(REPLAY_ENV)
+    record_path = os.environ.get(RECORD_ENV)
+    if replay_path:
+        with open(replay_path, "rb") as file:
+            source = replay_source(file.read(), record=bool(record_path))
+    else:
+        seed = os.environ.get(SEED_ENV)
+        try:
+            source = SessionRandom(
+                None if seed is None else int(seed),
+                record=bool(record_path)
+            )
+        except ValueError as error:
+            raise ValueError(f"Bad {SEED_ENV}={seed!r}: {error}") from None
+    if record_path:
+        atexit.register(save_log, source, record_path)
+    return source
+
+
+def bind(source):
+    """Give the calling thread its own SessionRandom, or None to unbind."""
+    _local.source = source
+
+
+def current():
+    """Return the calling thread's SessionRandom, or the process's."""
+    global _default
+    source = getattr(_local, "source", None)
+    if source is not None:
+        return source
+    if _default is None:
+        _default = default_source()
+    return _default
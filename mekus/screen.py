@@ -0,0 +1,274 @@
+import atexit  # Standard library
+import builtins
+import io
+import os
+import re
+import select
+import shutil
+import sys
+import threading
+import time
+import unicodedata
+
+from . import metrics
+
+# ANSI control sequences used to draw frames
+HOME_AND_CLEAR = "\x1b[H\x1b[2J"
+CLEAR_TO_LINE_END = "\x1b[K"
+CLEAR_TO_SCREEN_END = "\x1b[J"
+RESET_STYLE = "\x1b[0m"
+ESCAPE = "\x1b["
+ANSI_SEQUENCE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+# Console mode flag that makes Windows 10+ terminals understand ANSI codes
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+STD_OUTPUT_HANDLE = -11
+
+# How often a Windows console is checked for a key while waiting
+KEY_POLL_SECONDS = 0.05
+
+# Renderers and line sources bound to threads that serve their own
+# terminal
+_local = threading.local()
+_builtin_input = builtins.input
+
+
+def visible_width(line):
+    """Return how many terminal columns a line occupies."""
+    text = ANSI_SEQUENCE.sub("", line)
+    return sum(
+        2 if unicodedata.east_asian_width(char) in "WF" else 1
+        for char in text
+    )
+
+
+def move_to(row):
+    """Return the sequence that moves the cursor to a line's start."""
+    return f"\x1b[{row + 1};1H"
+
+
+def enable_windows_ansi():
+    """Let the Windows console interpret ANSI sequences natively."""
+    if os.name != "nt":
+        return
+    import ctypes  # Only needed on Windows
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+    mode = ctypes.c_ulong()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(
+            handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        )
+
+
+class FrameRenderer(io.TextIOBase):
+    """Stand-in for sys.stdout that draws each screen as one ANSI frame.
+
+    clear_screen() starts a frame; everything printed afterwards is kept
+    in memory until the next flush (input() flushes before reading), and
+    is then written with a single write call. On a terminal only the
+    lines that differ from the previous frame are redrawn, using cursor
+    positioning instead of a full clear. Styles are reset after every
+    colored write, like colorama's autoreset.
+    """
+
+    def __init__(self, stream, size=None):
+        self.stream = stream
+        self.is_terminal = stream.isatty()
+        self.size = size  # (columns, rows); None asks the local terminal
+        self.pending = None  # Text of the frame being composed
+        self.screen = []  # Lines known to be on the terminal
+        self.dirty_from = 0  # First line whose on-screen text is unknown
+        self.extra_lines = 0  # Lines written since the last frame
+        self.full_redraw = True
+
+    @property
+    def encoding(self):
+        return getattr(self.stream, "encoding", None) or "utf-8"
+
+    @property
+    def errors(self):
+        return getattr(self.stream, "errors", None) or "strict"
+
+    def isatty(self):
+        return self.is_terminal
+
+    def writable(self):
+        return True
+
+    def begin_frame(self):
+        """Start composing a new screen, dropping any unshown text."""
+        self.pending = []
+
+    def write(self, text):
+        length = len(text)
+        if ESCAPE in text:
+            text += RESET_STYLE
+
+        if self.pending is not None:
+            self.pending.append(text)
+        else:
+            self.extra_lines += text.count("\n")
+            self.stream.write(text)
+        return length
+
+    def flush(self):
+        if self.pending is None:
+            # A prompt outside a frame: the user's Enter adds a line
+            self.extra_lines += 1
+            self.stream.flush()
+            return
+
+        frame = "".join(self.pending)
+        self.pending = None
+        metrics.call_external("screen.draw_frame", self.draw, frame)
+
+    def draw(self, frame):
+        """Write a composed frame to the real stream."""
+        self.write_once(self.render(frame))
+
+    def render(self, frame):
+        """Return the text that turns the current screen into frame."""
+        if not self.is_terminal:
+            return frame
+
+        lines = frame.split("\n")
+        columns, rows = self.size or shutil.get_terminal_size()
+        fits = len(lines) < rows and all(
+            visible_width(line) < columns for line in lines
+        )
+        scrolled = len(self.screen) + self.extra_lines >= rows
+
+        if self.full_redraw or scrolled or not fits:
+            output = HOME_AND_CLEAR + frame
+        else:
+            parts = []
+            last = len(lines) - 1
+            for row, line in enumerate(lines[:last]):
+                unchanged = (
+                    row < self.dirty_from
+                    and row < len(self.screen)
+                    and self.screen[row] == line
+                )
+                if not unchanged:
+                    parts.append(
+                        move_to(row) + line + CLEAR_TO_LINE_END
+                    )
+            # The last line is always redrawn so the cursor ends after it
+            parts.append(move_to(last) + lines[last] + CLEAR_TO_SCREEN_END)
+            output = "".join(parts)
+
+        self.screen = lines
+        self.dirty_from = len(lines) - 1
+        # Input echoed after this frame lands on the screen's last line
+        self.extra_lines = 1
+        self.full_redraw = not fits
+        return output
+
+    def write_once(self, text):
+        """
+        Write text to the real stream with as few syscalls as possible.
+
+        Bytes go straight to the file descriptor only on a POSIX
+        terminal. Anywhere else the stream writes them, so a Windows
+        console still gets Unicode text through WriteConsoleW.
+        """
+        self.stream.flush()
+        descriptor = None
+        if os.name != "nt" and self.is_terminal:
+            try:
+                descriptor = self.stream.fileno()
+            except (AttributeError, OSError, ValueError):
+                pass
+        if descriptor is None:
+            self.stream.write(text)
+            self.stream.flush()
+            return
+
+        data = text.encode(self.encoding, "replace")
+        while data:
+            written = os.write(descriptor, data)
+            data = data[written:]
+
+
+def bind_renderer(renderer):
+    """Give the calling thread its own FrameRenderer, or None to unbind."""
+    _local.renderer = renderer
+
+
+def bound_renderer():
+    """Return the calling thread's own FrameRenderer, or None."""
+    return getattr(_local, "renderer", None)
+
+
+def bind_line_source(source):
+    """
+    Give the calling thread its own wait_for_line(), or None to unbind.
+
+    source(seconds) must return an entered line, None if none came in
+    time, or raise EOFError once the input has ended.
+    """
+    _local.line_source = source
+
+
+def wait_for_line(seconds):
+    """
+    Wait up to seconds for the user to enter a line.
+
+    Returns:
+        str: The line, or None if nothing was entered in time.
+
+    Raises:
+        EOFError: The input has ended.
+    """
+    source = getattr(_local, "line_source", None)
+    if source is not None:
+        return source(seconds)
+    if builtins.input is not _builtin_input:
+        return input()  # Scripted input answers at once
+    if os.name == "nt":
+        return wait_for_console_line(seconds)
+    try:
+        ready, _, _ = select.select([sys.stdin], [], [], seconds)
+    except (AttributeError, OSError, ValueError):
+        return input()  # stdin is not a file, e.g. a StringIO
+    if not ready:
+        return None
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("Input ended")
+    return line.rstrip("\r\n")
+
+
+def wait_for_console_line(seconds):
+    """wait_for_line() on Windows, where select() only takes sockets."""
+    import msvcrt  # Only needed on Windows
+
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        if msvcrt.kbhit():
+            return input()
+        time.sleep(KEY_POLL_SECONDS)
+    return None
+
+
+def get_renderer():
+    """Return the active FrameRenderer, installing it over sys.stdout."""
+    renderer = getattr(_local, "renderer", None)
+    if renderer is not None:
+        return renderer
+    if isinstance(sys.stdout, FrameRenderer):
+        return sys.stdout
+
+    renderer = FrameRenderer(sys.stdout)
+    if renderer.is_terminal:
+        enable_windows_ansi()
+    sys.stdout = renderer
+    atexit.register(renderer.flush)
+    return renderer
+
+
+def clear_screen():
+    """Start a new screen; it is drawn when the output is next flushed."""
+    metrics.call_external("screen.clear_screen", get_renderer().begin_frame)
@@ -1,24 +1,25 @@
-import random
-import os
-
-import pyfiglet
+from . import randomness, screen
+from .banners import render_banner
 
 CHOICES = ['rock', 'paper', 'scissors']
 QUIT_COMMAND = 'quit'
 
 class RockPaperScissors:
-    def __init__(self):
+    __slots__ = ("rng", "choices", "quit_command", "score")
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else randomness.current()
         self.choices = CHOICES
         self.quit_command = QUIT_COMMAND
         self.score = {'player': 0, 'computer': 0}
 
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        screen.clear_screen()
 
     def display_title(self):
-        """Display the game title using pyfiglet."""
-        print(pyfiglet.figlet_format('Rock! Paper! Scissors!'))
+        """Display the game title using a cached figlet banner."""
+        print(render_banner('Rock! Paper! Scissors!'))
 
     def get_user_choice(self):
         """Prompt user for input and return it in lowercase."""
@@ -82,11 +83,15 @@ class RockPaperScissors:
                 input('Press Enter to continue...')
                 continue
 
-            computer_choice = random.choice(self.choices)
+            computer_choice = self.rng.choice(self.choices)
             print(f'Computer chose: {computer_choice}')
 
             winner = self.determine_winner(user_choice, computer_choice)
             self.handle_result(winner)
 
             self.display_score()
-            input('Press Enter to continue...')
\ No newline at end of file
+            input('Press Enter to continue...')
+
+    def menu(self):
+        """Entry point used by the Mekus module menu."""
+        self.main()
@@ -0,0 +1,508 @@
+"""
+Serve independent Mekus menu sessions over TCP (telnet-compatible).
+
+Unlike the original request, the games' blocking input() and print()
+calls were not turned into awaitable I/O, which would have made every
+menu method a coroutine. Only the sockets are asyncio; each session's
+menu loop runs unchanged on its own small-stack thread, with input()
+and print() routed to its connection, and a waiting session is a
+parked thread.
+"""
+
+import asyncio  # Standard library
+import builtins
+import io
+import ipaddress
+import multiprocessing
+import os
+import queue
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from . import (
+    log_tail,
+    nba_league,
+    randomness,
+    screen,
+    valorant_profiles,
+    valorant_telemetry
+)
+from .driver import DEFAULT_TARGET, load_target
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 2325
+MAX_SESSIONS = 5000
+
+# Telnet: IAC GA ("go ahead") is sent whenever a session waits for input,
+# so clients know a screen is complete; telnet terminals ignore it
+IAC = 0xFF
+GO_AHEAD = bytes([IAC, 0xF9])
+NEGOTIATION_COMMANDS = range(0xFB, 0xFF)  # WILL, WONT, DO, DONT
+
+# Frames are drawn for a classic 80x24 telnet window
+TERMINAL_SIZE = (80, 24)
+READ_SIZE = 4096
+
+# Each session runs its blocking menu loop on a small-stack thread; a
+# waiting session is a parked thread and costs no CPU
+SESSION_STACK_SIZE = 512 * 1024
+
+# Load test: an active client plays Rock-Paper-Scissors from the main menu
+LOAD_TEST_OPEN = ["5"]
+LOAD_TEST_ROUND = ["rock", ""]
+LOAD_TEST_CLOSE = ["quit", "", "0"]
+LATENCY_PERCENTILES = (50, 90, 99)
+
+_sessions = threading.local()
+
+
+class SessionStream(io.TextIOBase):
+    """Text stream that sends to one connection from a session thread."""
+
+    def __init__(self, loop, writer):
+        self.loop = loop
+        self.writer = writer
+
+    def isatty(self):
+        return True  # Telnet clients understand ANSI sequences
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        data = text.replace("\n", "\r\n").encode("utf-8", "replace")
+        self.send(data)
+        return len(text)
+
+    def send(self, data):
+        self.loop.call_soon_threadsafe(self.writer.write, data)
+
+
+class Session:
+    """One connection's menu loop, run on its own thread.
+
+    The event loop feeds received lines into a queue; the session's
+    input() blocks on that queue, so the asyncio side only ever awaits
+    socket reads and never blocks on a game. Valorant profiles, with
+    the last agent used, and followed-log state are private to each
+    session. Process-pool work goes to the server's shared pool, and
+    file paths the user types may be limited to one directory.
+    """
+
+    def __init__(self, loop, writer, factory, entry, executor=None,
+                 allowed_dir=None):
+        self.loop = loop
+        self.factory = factory
+        self.entry = entry
+        self.executor = executor
+        self.allowed_dir = allowed_dir
+        self.stream = SessionStream(loop, writer)
+        self.renderer = screen.FrameRenderer(self.stream, TERMINAL_SIZE)
+        self.lines = queue.SimpleQueue()
+        self.partial = bytearray()
+        self.finished = loop.create_future()
+
+    def feed(self, data):
+        """Split received bytes into lines, dropping telnet commands."""
+        data = self.partial + data
+        cleaned = bytearray()
+        position = 0
+        while position < len(data):
+            byte = data[position]
+            if byte != IAC:
+                cleaned.append(byte)
+                position += 1
+            elif position + 1 >= len(data):
+                break  # Command split across reads
+            elif data[position + 1] in NEGOTIATION_COMMANDS:
+                if position + 2 >= len(data):
+                    break
+                position += 3
+            else:
+                position += 2
+
+        *lines, rest = bytes(cleaned).split(b"\n")
+        self.partial = bytearray(rest) + data[position:]
+        for line in lines:
+            self.lines.put(line.rstrip(b"\r").decode("utf-8", "replace"))
+
+    def close_input(self):
+        self.lines.put(None)
+
+    def input(self, prompt=""):
+        """input() for this session: draw the frame, then wait for a line."""
+        self.renderer.write(str(prompt))
+        self.renderer.flush()
+        self.stream.send(GO_AHEAD)
+        line = self.lines.get()
+        if line is None:
+            raise EOFError("Connection closed")
+        return line
+
+    def wait_for_line(self, seconds):
+        """screen.wait_for_line for this session: a line, or None."""
+        self.renderer.flush()
+        self.stream.send(GO_AHEAD)
+        try:
+            line = self.lines.get(timeout=seconds)
+        except queue.Empty:
+            return None
+        if line is None:
+            raise EOFError("Connection closed")
+        return line
+
+    def run(self):
+        """Thread body: run the menu loop with this session's console."""
+        _sessions.session = self
+        session_dir = tempfile.mkdtemp(prefix="mekus-session-")
+        screen.bind_renderer(self.renderer)
+        screen.bind_line_source(self.wait_for_line)
+        randomness.bind(randomness.SessionRandom())
+        log_tail.bind_state_dir(os.path.join(session_dir, "tail"))
+        log_tail.bind_allowed_dir(self.allowed_dir)
+        nba_league.bind_executor(self.executor)
+        valorant_telemetry.bind_executor(self.executor)
+        valorant_profiles.bind(
+            valorant_profiles.ProfileStore(
+                os.path.join(session_dir, "profiles")
+            )
+        )
+        try:
+            getattr(self.factory(), self.entry)()
+            self.renderer.flush()
+        except EOFError:
+            pass
+        except Exception:
+            traceback.print_exc(file=sys.__stderr__)
+        finally:
+            screen.bind_renderer(None)
+            screen.bind_line_source(None)
+            randomness.bind(None)
+            log_tail.bind_state_dir(None)
+            log_tail.bind_allowed_dir(None)
+            nba_league.bind_executor(None)
+            valorant_telemetry.bind_executor(None)
+            valorant_profiles.bind(None)
+            shutil.rmtree(session_dir, ignore_errors=True)
+            _sessions.session = None
+            self.loop.call_soon_threadsafe(self.finish)
+
+    def finish(self):
+        if not self.finished.done():
+            self.finished.set_result(None)
+
+
+def start_session_thread(session):
+    """Start a session's thread with SESSION_STACK_SIZE of stack."""
+    # The size applies to every thread started meanwhile, process-wide,
+    # so it is restored as soon as this one is running
+    saved_size = threading.stack_size(SESSION_STACK_SIZE)
+    try:
+        threading.Thread(target=session.run, daemon=True).start()
+    finally:
+        threading.stack_size(saved_size)
+
+
+def routed_input(prompt=""):
+    """builtins.input while serving: reads from the thread's session."""
+    session = getattr(_sessions, "session", None)
+    if session is None:
+        return _original_input(prompt)
+    return session.input(prompt)
+
+
+class RoutedOutput(io.TextIOBase):
+    """sys.stdout while serving: writes go to the thread's session."""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def target(self):
+        return screen.bound_renderer() or self.fallback
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        return self.target().write(text)
+
+    def flush(self):
+        self.target().flush()
+
+
+_original_input = builtins.input
+
+
+class MekusServer:
+    """asyncio TCP server running an independent session per connection."""
+
+    def __init__(self, target=DEFAULT_TARGET, max_sessions=MAX_SESSIONS,
+                 data_dir=None):
+        self.factory, self.entry = load_target(target)
+        self.max_sessions = max_sessions
+        self.data_dir = data_dir
+        self.sessions = set()
+        self.server = None
+        self.executor = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Install the routed console and start listening.
+
+        Raises:
+            ValueError: host is not loopback and no data_dir was given,
+            so clients could open any file on this machine.
+        """
+        global _original_input
+        if self.data_dir is None and not is_loopback(host):
+            raise ValueError(
+                f"Serving on {host} needs a data directory (--data-dir) "
+                "to limit the files clients can open"
+            )
+
+        # Sessions share one pool; workers are spawned, since forking
+        # this threaded process could copy locks other threads hold
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        if builtins.input is not routed_input:
+            _original_input = builtins.input
+            builtins.input = routed_input
+        if not isinstance(sys.stdout, RoutedOutput):
+            sys.stdout = RoutedOutput(sys.stdout)
+
+        self.server = await asyncio.start_server(
+            self.handle_connection, host, port, backlog=1024
+        )
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle_connection(self, reader, writer):
+        if len(self.sessions) >= self.max_sessions:
+            writer.write(b"Server full, try again later.\r\n")
+            writer.close()
+            return
+
+        loop = asyncio.get_running_loop()
+        session = Session(
+            loop, writer, self.factory, self.entry, self.executor,
+            self.data_dir
+        )
+        self.sessions.add(session)
+        start_session_thread(session)
+        try:
+            while not session.finished.done():
+                read = asyncio.ensure_future(reader.read(READ_SIZE))
+                await asyncio.wait(
+                    (read, session.finished),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not read.done():
+                    read.cancel()
+                    break
+                data = read.result()
+                if not data:
+                    break
+                session.feed(data)
+                await writer.drain()
+        except OSError:
+            pass
+        finally:
+            session.close_input()
+            await session.finished
+            self.sessions.discard(session)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def close(self, timeout=5.0):
+        """Stop listening and give open sessions time to wind down."""
+        self.server.close()
+        deadline = time.monotonic() + timeout
+        while self.sessions and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+
+def is_loopback(host):
+    """Return whether host only accepts connections from this machine."""
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, target=DEFAULT_TARGET,
+          data_dir=None):
+    """Serve the Mekus menu until interrupted."""
+    async def run():
+        server = MekusServer(target, data_dir=data_dir)
+        bound = await server.start(host, port)
+        print(f"Serving {target} on {host}:{bound} "
+              f"(telnet {host} {bound})", file=sys.__stdout__, flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close(timeout=0)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+async def read_screen(reader):
+    """Read up to and including the next IAC GA; b"" at end of stream."""
+    try:
+        return await reader.readuntil(GO_AHEAD)
+    except asyncio.IncompleteReadError:
+        return b""
+
+
+async def run_client(host, port, script, hold_seconds, latencies):
+    """Connect, answer each screen with the next line, timing each step."""
+    reader, writer = await asyncio.open_connection(host, port)
+    await read_screen(reader)
+    for line in script:
+        started = time.perf_counter()
+        writer.write(line.encode("utf-8") + b"\r\n")
+        if not await read_screen(reader):
+            break
+        latencies.append(time.perf_counter() - started)
+    await asyncio.sleep(hold_seconds)
+    writer.close()
+
+
+def client_worker(arguments):
+    """Load-test process: open idle and active connections, return steps."""
+    host, port, idle, active, rounds, hold_seconds = arguments
+    script = LOAD_TEST_OPEN + LOAD_TEST_ROUND * rounds + LOAD_TEST_CLOSE
+
+    async def run():
+        latencies = []
+        clients = [
+            run_client(host, port, [], hold_seconds, latencies)
+            for _ in range(idle)
+        ] + [
+            run_client(host, port, script, 0, latencies)
+            for _ in range(active)
+        ]
+        results = await asyncio.gather(*clients, return_exceptions=True)
+        errors = sum(isinstance(result, Exception) for result in results)
+        return latencies, errors
+
+    return asyncio.run(run())
+
+
+def split_evenly(total, parts):
+    return [total // parts + (part < total % parts) for part in range(parts)]
+
+
+def load_test(idle=1000, active=100, rounds=20, processes=4,
+              hold_seconds=5.0):
+    """
+    Run a server in this process against local client processes.
+
+    Parameters:
+        idle (int): Connections that only open the menu and wait.
+        active (int): Connections that play `rounds` rounds.
+        processes (int): Client processes the connections are split over.
+        hold_seconds (float): How long idle connections stay open.
+
+    Returns:
+        dict: Connection and step counts, errors, peak concurrent
+        sessions, steps per second and step latency percentiles (ms).
+    """
+    async def run():
+        server = MekusServer()
+        port = await server.start(DEFAULT_HOST, 0)
+        loop = asyncio.get_running_loop()
+        jobs = [
+            (DEFAULT_HOST, port, idle_share, active_share, rounds,
+             hold_seconds)
+            for idle_share, active_share in zip(
+                split_evenly(idle, processes), split_evenly(active, processes)
+            )
+        ]
+
+        peak = 0
+        started = time.perf_counter()
+        # Spawned, not forked, as the server's threads are running
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes) as pool:
+            pending = loop.run_in_executor(
+                None, pool.map, client_worker, jobs
+            )
+            while not pending.done():
+                peak = max(peak, len(server.sessions))
+                await asyncio.sleep(0.05)
+            results = pending.result()
+        elapsed = time.perf_counter() - started
+        await server.close()
+        return results, peak, elapsed
+
+    results, peak, elapsed = asyncio.run(run())
+    latencies = sorted(
+        seconds * 1000 for steps, _ in results for seconds in steps
+    )
+    summary = {
+        "connections": idle + active,
+        "errors": sum(errors for _, errors in results),
+        "peak_sessions": peak,
+        "steps": len(latencies),
+        "steps_per_second": len(latencies) / elapsed
+    }
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        for percentile in LATENCY_PERCENTILES:
+            summary[f"p{percentile}_ms"] = cuts[percentile - 1]
+    return summary
+
+
+def main(arguments):
+    """
+    Usage: python -m mekus.server [--host H] [--port P] [--target T]
+                                  [--data-dir D]
+           python -m mekus.server --load-test [IDLE ACTIVE [PROCESSES]]
+    """
+    if arguments and arguments[0] == "--load-test":
+        counts = [int(argument) for argument in arguments[1:4]]
+        summary = load_test(*counts[:2], processes=(counts[2:] or [4])[0])
+        for key, value in summary.items():
+            text = f"{value:,.2f}" if isinstance(value, float) else value
+            print(f"{key}: {text}")
+        return 0 if not summary["errors"] else 1
+
+    options = {"--host": DEFAULT_HOST, "--port": DEFAULT_PORT,
+               "--target": DEFAULT_TARGET, "--data-dir": None}
+    while arguments:
+        option = arguments.pop(0)
+        if option not in options or not arguments:
+            print(main.__doc__)
+            return 2
+        options[option] = arguments.pop(0)
+    try:
+        serve(options["--host"], int(options["--port"]), options["--target"],
+              options["--data-dir"])
+    except ValueError as error:
+        print(error)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
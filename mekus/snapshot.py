@@ -0,0 +1,391 @@
+import importlib  # Standard library
+import os
+import struct
+
+# Snapshot layout: HEADER, then the kind's fields in a fixed order.
+# Integers are little-endian int64, flags are single bytes, and text and
+# blobs are prefixed with their uint32 byte length. Lists are prefixed
+# with their uint32 item count.
+HEADER = struct.Struct("<4sHB")
+MAGIC = b"MKSS"
+# Version 2 adds what followed match logs contributed to a game's totals;
+# version 1 snapshots still load, as if no logs were followed
+VERSION = 2
+
+INTEGER = struct.Struct("<q")
+FLAG = struct.Struct("<?")
+LENGTH = struct.Struct("<I")
+
+# Kinds of snapshot: one per game class, plus a whole menu session
+SESSION = 0
+KINDS = {
+    "RockPaperScissors": (1, "mekus.serohijos"),
+    "MobileLegendsStats": (2, "mekus.dazo"),
+    "PokemonGame": (3, "mekus.olazo"),
+    "NBA2K25": (4, "mekus.agulto"),
+    "ValorantOps": (5, "mekus.jundam")
+}
+KIND_NAMES = {code: name for name, (code, _) in KINDS.items()}
+
+
+class SnapshotError(ValueError):
+    """Raised for data that is not a snapshot this version can read."""
+
+
+class Writer:
+    """Collects the encoded fields of one snapshot."""
+
+    def __init__(self, kind):
+        self.parts = [HEADER.pack(MAGIC, VERSION, kind)]
+
+    def integer(self, value):
+        self.parts.append(INTEGER.pack(value))
+
+    def integers(self, values):
+        self.parts.append(LENGTH.pack(len(values)))
+        self.parts.append(struct.pack(f"<{len(values)}q", *values))
+
+    def flag(self, value):
+        self.parts.append(FLAG.pack(value))
+
+    def blob(self, data):
+        self.parts.append(LENGTH.pack(len(data)))
+        self.parts.append(data)
+
+    def text(self, value):
+        self.blob(value.encode("utf-8"))
+
+    def texts(self, values):
+        self.parts.append(LENGTH.pack(len(values)))
+        for value in values:
+            self.text(value)
+
+    def getvalue(self):
+        return b"".join(self.parts)
+
+
+class Reader:
+    """Decodes fields in the order a Writer encoded them."""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        try:
+            magic, version, self.kind = HEADER.unpack_from(self.data, 0)
+        except struct.error:
+            raise SnapshotError("Snapshot is truncated") from None
+        if magic != MAGIC:
+            raise SnapshotError("Not a Mekus snapshot")
+        if not 1 <= version <= VERSION:
+            raise SnapshotError(
+                f"Snapshot version {version} is not supported "
+                f"(expected {VERSION} or older)"
+            )
+        self.version = version
+        self.offset = HEADER.size
+
+    def unpack(self, layout):
+        try:
+            values = layout.unpack_from(self.data, self.offset)
+        except struct.error:
+            raise SnapshotError("Snapshot is truncated") from None
+        self.offset += layout.size
+        return values
+
+    def integer(self):
+        return self.unpack(INTEGER)[0]
+
+    def integers(self):
+        (count,) = self.unpack(LENGTH)
+        layout = f"<{count}q"
+        try:
+            values = struct.unpack_from(layout, self.data, self.offset)
+        except struct.error:
+            raise SnapshotError("Snapshot is truncated") from None
+        self.offset += 8 * count
+        return values
+
+    def flag(self):
+        return self.unpack(FLAG)[0]
+
+    def blob(self):
+        (length,) = self.unpack(LENGTH)
+        end = self.offset + length
+        if end > len(self.data):
+            raise SnapshotError("Snapshot is truncated")
+        data = self.data[self.offset:end]
+        self.offset = end
+        return data
+
+    def text(self):
+        return str(self.blob(), "utf-8")
+
+    def texts(self):
+        (count,) = self.unpack(LENGTH)
+        return [self.text() for _ in range(count)]
+
+
+def suspend(game):
+    """
+    Encode a game's state as a versioned binary snapshot.
+
+    Parameters:
+        game: A RockPaperScissors, MobileLegendsStats, PokemonGame,
+            NBA2K25 or ValorantOps instance.
+
+    Returns:
+        bytes: The snapshot; resume() turns it back into a game.
+    """
+    name = type(game).__name__
+    if name not in KINDS:
+        raise TypeError(f"Cannot snapshot a {name}")
+    writer = Writer(KINDS[name][0])
+    ENCODERS[name](game, writer)
+    return writer.getvalue()
+
+
+def resume(data):
+    """Rebuild a game from a snapshot made by suspend()."""
+    reader = Reader(data)
+    name = KIND_NAMES.get(reader.kind)
+    if name is None:
+        raise SnapshotError(f"Unknown snapshot kind {reader.kind}")
+    game_class = getattr(importlib.import_module(KINDS[name][1]), name)
+    return DECODERS[name](game_class, reader)
+
+
+def suspend_session(modules):
+    """Encode a menu session: menu key -> game, as kept by MekusModules."""
+    writer = Writer(SESSION)
+    writer.parts.append(LENGTH.pack(len(modules)))
+    for key, game in modules.items():
+        writer.text(key)
+        writer.blob(suspend(game))
+    return writer.getvalue()
+
+
+def resume_session(data):
+    """Rebuild the menu key -> game mapping of a suspended session."""
+    reader = Reader(data)
+    if reader.kind != SESSION:
+        raise SnapshotError("Not a session snapshot")
+    (count,) = reader.unpack(LENGTH)
+    modules = {}
+    for _ in range(count):
+        key = reader.text()
+        modules[key] = resume(reader.blob())
+    return modules
+
+
+def save(path, data):
+    """Park a snapshot on disk; readers never see a partial file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
+def load(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def encode_rock_paper_scissors(game, writer):
+    writer.integer(game.score["player"])
+    writer.integer(game.score["computer"])
+
+
+def decode_rock_paper_scissors(game_class, reader):
+    game = game_class()
+    game.score = {"player": reader.integer(), "computer": reader.integer()}
+    return game
+
+
+def encode_mobile_legends(game, writer):
+    from .dazo import LOG_TOTALS
+
+    writer.text(game.codename)
+    writer.integers((
+        game.kills, game.deaths, game.assists, game.matches_played,
+        game.wins
+    ))
+    writer.integers([
+        game.followed_totals.get(field, 0) for field in LOG_TOTALS
+    ])
+
+
+def decode_mobile_legends(game_class, reader):
+    from .dazo import LOG_TOTALS
+
+    game = game_class()
+    game.codename = reader.text()
+    (
+        game.kills, game.deaths, game.assists, game.matches_played,
+        game.wins
+    ) = reader.integers()
+    if reader.version >= 2:
+        game.followed_totals = dict(zip(LOG_TOTALS, reader.integers()))
+    return game
+
+
+def encode_pokemon_game(game, writer):
+    writer.text(game.player_name)
+    writer.text(game.difficulty)
+    writer.integers((
+        game.score, game.highest_score, game.streak, game.highest_streak,
+        game.attempts_left,
+        game.current_pokemon.dex if game.current_pokemon else 0
+    ))
+    writer.flag(game.is_game_active)
+    writer.flag(game.is_class_running)
+    # The ASCII art is looked up again from the Pokemon table on resume
+    writer.flag(bool(game.current_pokemon_ascii))
+    writer.integers(sorted(game.used_pokemon_ids))
+    writer.texts(game.hints)
+
+
+def decode_pokemon_game(game_class, reader):
+    game = game_class()
+    game.player_name = reader.text()
+    game.difficulty = reader.text()
+    (
+        game.score, game.highest_score, game.streak, game.highest_streak,
+        game.attempts_left, dex
+    ) = reader.integers()
+    game.is_game_active = reader.flag()
+    game.is_class_running = reader.flag()
+    ascii_shown = reader.flag()
+    game.used_pokemon_ids = set(reader.integers())
+    game.hints = reader.texts()
+
+    if dex:
+        game.current_pokemon = game.pokedex.get(dex)
+        if ascii_shown:
+            game.current_pokemon_ascii = game.pokedex.ascii(dex)
+    return game
+
+
+def encode_nba(game, writer):
+    writer.text(game.player_name)
+    writer.text(game.team)
+    writer.integers((
+        game.points, game.stamina, game.shooting_skill, game.dunk_skill,
+        game.three_point_skill, game.field_goal_attempted,
+        game.field_goal_made, game.play_log.capacity
+    ))
+    writer.blob(game.play_log.to_bytes())
+
+
+def decode_nba(game_class, reader):
+    from .nba_playlog import PlayLog
+
+    player_name = reader.text()
+    team = reader.text()
+    (
+        points, stamina, shooting_skill, dunk_skill, three_point_skill,
+        attempted, made, capacity
+    ) = reader.integers()
+    play_log = PlayLog(capacity)
+    play_log.load_bytes(reader.blob())
+
+    game = game_class(
+        player_name, team, shooting_skill, dunk_skill, three_point_skill,
+        play_log
+    )
+    game.points = points
+    game.stamina = stamina
+    game.field_goal_attempted = attempted
+    game.field_goal_made = made
+    return game
+
+
+def write_match_index(writer, index):
+    from .valorant_index import DIMENSIONS
+
+    for dimension in DIMENSIONS:
+        names = index.tags[dimension]
+        writer.texts(list(names))
+        writer.texts(list(names.values()))
+
+    # Groups are flattened into one integer array: the positions of the
+    # group's tags in a shared string list, then its counters
+    strings = {}
+    flat = []
+    for group_key, counters in index.groups.items():
+        flat.extend(strings.setdefault(tag, len(strings)) for tag in group_key)
+        flat.extend(counters)
+    writer.texts(list(strings))
+    writer.integers(flat)
+
+
+def read_match_index(reader):
+    from .valorant_index import DIMENSIONS, STAT_FIELDS, MatchIndex
+
+    index = MatchIndex()
+    for dimension in DIMENSIONS:
+        keys = reader.texts()
+        index.tags[dimension] = dict(zip(keys, reader.texts()))
+    strings = reader.texts()
+    flat = reader.integers()
+    width = len(DIMENSIONS) + len(STAT_FIELDS)
+    for start in range(0, len(flat), width):
+        tags = flat[start:start + len(DIMENSIONS)]
+        index.groups[tuple(strings[tag] for tag in tags)] = list(
+            flat[start + len(DIMENSIONS):start + width]
+        )
+    return index
+
+
+def encode_valorant(game, writer):
+    writer.texts((
+        game.agent_codename, game.agent_rank, game.agent_main_weapon,
+        game.agent_favorite_map
+    ))
+    write_match_index(writer, game.match_index)
+    # Per agent, the matches followed logs have added to the index
+    writer.parts.append(LENGTH.pack(len(game.live_telemetry)))
+    for codename, live in game.live_telemetry.items():
+        writer.text(codename)
+        write_match_index(writer, live.index)
+
+
+def decode_valorant(game_class, reader):
+    from . import valorant_profiles
+    from .valorant_telemetry import LiveTelemetry
+
+    # Built without __init__, which would read profiles and prompt
+    game = game_class.__new__(game_class)
+    game.profile_store = valorant_profiles.current()
+    (
+        game.agent_codename, game.agent_rank, game.agent_main_weapon,
+        game.agent_favorite_map
+    ) = reader.texts()
+    game.match_index = read_match_index(reader)
+    game.log_followers = {}
+    game.live_telemetry = {}
+    if reader.version >= 2:
+        (count,) = reader.unpack(LENGTH)
+        for _ in range(count):
+            codename = reader.text()
+            live = LiveTelemetry(codename)
+            live.index = read_match_index(reader)
+            game.live_telemetry[codename] = live
+    return game
+
+
+ENCODERS = {
+    "RockPaperScissors": encode_rock_paper_scissors,
+    "MobileLegendsStats": encode_mobile_legends,
+    "PokemonGame": encode_pokemon_game,
+    "NBA2K25": encode_nba,
+    "ValorantOps": encode_valorant
+}
+
+DECODERS = {
+    "RockPaperScissors": decode_rock_paper_scissors,
+    "MobileLegendsStats": decode_mobile_legends,
+    "PokemonGame": decode_pokemon_game,
+    "NBA2K25": decode_nba,
+    "ValorantOps": decode_valorant
+}
@@ -0,0 +1,127 @@
+import math  # Standard library
+from statistics import NormalDist
+
+# How a ratio with a zero denominator comes out, singly and in batches
+# alike (NumPy's rules for float division):
+#   x / 0 with x > 0  ->  inf (e.g. a KDA with no deaths)
+#   0 / 0             ->  NaN (undefined)
+INFINITE_TEXT = "∞"
+UNDEFINED_TEXT = "N/A"
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+def ratio(numerator, denominator):
+    """
+    Divide two counts with the module's zero-denominator rules.
+
+    Returns:
+        float: numerator / denominator, math.inf for x / 0, or
+        math.nan for 0 / 0.
+    """
+    if denominator == 0:
+        if numerator == 0:
+            return math.nan
+        return math.copysign(math.inf, numerator)
+    return numerator / denominator
+
+
+def percentage(numerator, denominator):
+    """Return ratio() as a percentage; inf and NaN pass through."""
+    return ratio(numerator, denominator) * 100
+
+
+def kda(kills, deaths, assists):
+    """Return (kills + assists) / deaths, following ratio()."""
+    return ratio(kills + assists, deaths)
+
+
+def is_finite(value):
+    """Return True for a ratio that is neither infinite nor undefined."""
+    return math.isfinite(value)
+
+
+def is_undefined(value):
+    """Return True for a 0 / 0 ratio."""
+    return math.isnan(value)
+
+
+def format_ratio(value, digits=2, suffix=""):
+    """Format a ratio for display, spelling out infinite and undefined."""
+    if math.isnan(value):
+        return UNDEFINED_TEXT
+    if math.isinf(value):
+        return INFINITE_TEXT
+    return f"{value:.{digits}f}{suffix}"
+
+
+def z_score(confidence):
+    """Return the two-sided normal quantile for a confidence level."""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_bounds(successes, trials, z):
+    """
+    Return (lower, upper) Wilson score bounds.
+
+    Written with plain arithmetic so the same formula serves single
+    values and NumPy arrays alike.
+    """
+    probability = successes / trials
+    spread = z * z / trials
+    center = (probability + spread / 2) / (1 + spread)
+    margin = z / (1 + spread) * (
+        probability * (1 - probability) / trials + spread / (4 * trials)
+    ) ** 0.5
+    return center - margin, center + margin
+
+
+def wilson_interval(successes, trials, confidence=DEFAULT_CONFIDENCE):
+    """
+    Return the Wilson score interval of a success rate.
+
+    Parameters:
+        successes (int): Successful attempts, e.g. made shots.
+        trials (int): All attempts.
+        confidence (float): Coverage of the interval.
+
+    Returns:
+        tuple: (lower, upper) as fractions; NaN with no trials.
+    """
+    if trials == 0:
+        return math.nan, math.nan
+    return wilson_bounds(successes, trials, z_score(confidence))
+
+
+def ratios(numerators, denominators):
+    """
+    Divide arrays of counts element-wise in one vectorized pass.
+
+    Returns:
+        numpy.ndarray: float ratios; inf for x / 0 and NaN for 0 / 0.
+    """
+    import numpy as np  # Only needed for batches
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.divide(numerators, denominators, dtype=np.float64)
+
+
+def percentages(numerators, denominators):
+    """Return ratios() as percentages."""
+    return ratios(numerators, denominators) * 100
+
+
+def wilson_intervals(successes, trials, confidence=DEFAULT_CONFIDENCE):
+    """
+    Return Wilson score intervals for arrays of counts.
+
+    Returns:
+        tuple: (lower, upper) float arrays; NaN where there are no
+        trials.
+    """
+    import numpy as np  # Only needed for batches
+
+    successes = np.asarray(successes, dtype=np.float64)
+    trials = np.asarray(trials, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return wilson_bounds(successes, trials, z_score(confidence))
@@ -0,0 +1,178 @@
+from .stats import kda, percentage, ratio
+
+# Counters kept for every recorded match, in storage order
+STAT_FIELDS = (
+    "matches",
+    "wins",
+    "kills",
+    "deaths",
+    "assists",
+    "headshots",
+    "shots",
+    "plants",
+    "plant_attempts",
+    "defusals",
+    "defusal_attempts",
+    "rounds",
+    "credits"
+)
+
+# Dimensions a match is tagged with
+DIMENSIONS = ("agent", "map", "weapon")
+
+# Placeholder for a dimension that is rolled up (summed over)
+ANY = "*"
+# Tag recorded for a blank map, weapon or agent, so it cannot be
+# mistaken for ANY; shown as UNKNOWN_NAME
+UNKNOWN = "(unknown)"
+UNKNOWN_NAME = "Unknown"
+
+# Every combination of kept/rolled-up dimensions: 2^3 rollups per match
+ROLLUP_MASKS = tuple(
+    tuple(bool(mask & (1 << bit)) for bit in range(len(DIMENSIONS)))
+    for mask in range(1 << len(DIMENSIONS))
+)
+
+
+def normalize_tag(value):
+    """Return the lookup form of a map, weapon or agent name."""
+    value = (value or "").strip().lower()
+    return value or ANY
+
+
+def record_tag(value):
+    """Return the key a match is recorded under; never ANY."""
+    key = normalize_tag(value)
+    return UNKNOWN if key == ANY else key
+
+
+class MatchIndex:
+    """Incrementally maintained group-by totals for Valorant matches.
+
+    Every recorded match is added to all eight agent/map/weapon rollups,
+    so any combination (e.g. "Vandal on Ascent", or "all matches on Bind")
+    is a single dictionary lookup instead of a rescan of raw matches.
+    """
+
+    __slots__ = ("groups", "tags")
+
+    def __init__(self):
+        self.groups = {}
+        self.tags = {dimension: {} for dimension in DIMENSIONS}
+
+    def record(self, agent, map_name, weapon, stats):
+        """
+        Add one match to the index.
+
+        Parameters:
+            agent (str): Agent codename that played the match.
+            map_name (str): Map the match was played on.
+            weapon (str): Weapon used for most of the match.
+            stats (dict): Counters named after STAT_FIELDS; "matches"
+                defaults to 1 and missing counters default to 0.
+        """
+        raw_tags = (agent, map_name, weapon)
+        keys = tuple(record_tag(tag) for tag in raw_tags)
+
+        # Remember a display name for each tag the first time it is seen
+        for dimension, key, raw in zip(DIMENSIONS, keys, raw_tags):
+            display_name = UNKNOWN_NAME if key == UNKNOWN else raw.strip()
+            self.tags[dimension].setdefault(key, display_name)
+
+        values = [stats.get(field, 0) for field in STAT_FIELDS]
+        values[0] = stats.get("matches", 1)
+
+        for mask in ROLLUP_MASKS:
+            group_key = tuple(
+                key if kept else ANY for key, kept in zip(keys, mask)
+            )
+            self.add_to_group(group_key, values)
+
+    def add_to_group(self, group_key, values):
+        """Add a list of counters (in STAT_FIELDS order) to one group."""
+        counters = self.groups.get(group_key)
+        if counters is None:
+            self.groups[group_key] = list(values)
+            return
+        for position, value in enumerate(values):
+            counters[position] += value
+
+    def merge(self, other, sign=1):
+        """
+        Fold the totals of another MatchIndex into this one.
+
+        With sign=-1 they are taken out again, e.g. to replace an older
+        copy of the same matches with a newer one.
+        """
+        for dimension, names in other.tags.items():
+            for key, display_name in names.items():
+                self.tags[dimension].setdefault(key, display_name)
+
+        for group_key, values in other.groups.items():
+            if sign != 1:
+                values = [sign * value for value in values]
+            self.add_to_group(group_key, values)
+
+    def totals(self, agent=ANY, map_name=ANY, weapon=ANY):
+        """Return the counters for one agent/map/weapon combination."""
+        group_key = (
+            normalize_tag(agent),
+            normalize_tag(map_name),
+            normalize_tag(weapon)
+        )
+        counters = self.groups.get(group_key)
+        if counters is None:
+            return dict.fromkeys(STAT_FIELDS, 0)
+        return dict(zip(STAT_FIELDS, counters))
+
+    def breakdown(self, dimension, **filters):
+        """
+        Return totals for every value seen along one dimension.
+
+        Parameters:
+            dimension (str): One of DIMENSIONS to group by.
+            **filters: Optional agent, map_name or weapon to hold fixed.
+
+        Returns:
+            dict: Display name mapped to that group's totals.
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {dimension}")
+
+        argument = "map_name" if dimension == "map" else dimension
+        result = {}
+        for key, display_name in self.tags[dimension].items():
+            totals = self.totals(**{**filters, argument: key})
+            if totals["matches"]:
+                result[display_name] = totals
+        return result
+
+
+def headshot_accuracy(totals):
+    """Headshot accuracy percentage for a totals dict."""
+    return percentage(totals["headshots"], totals["shots"])
+
+
+def win_rate(totals):
+    """Win rate percentage for a totals dict."""
+    return percentage(totals["wins"], totals["matches"])
+
+
+def plant_success(totals):
+    """Spike plant success percentage for a totals dict."""
+    return percentage(totals["plants"], totals["plant_attempts"])
+
+
+def defusal_success(totals):
+    """Bomb defusal success percentage for a totals dict."""
+    return percentage(totals["defusals"], totals["defusal_attempts"])
+
+
+def average_spend(totals):
+    """Average credits spent per round for a totals dict."""
+    return ratio(totals["credits"], totals["rounds"])
+
+
+def kda_ratio(totals):
+    """(Kills + Assists) / Deaths for a totals dict."""
+    return kda(totals["kills"], totals["deaths"], totals["assists"])
@@ -0,0 +1,85 @@
+import json  # Standard library
+import os
+import threading
+from urllib.parse import quote
+
+# Where agent profiles live unless MEKUS_PROFILE_DIR overrides it
+DEFAULT_PROFILE_DIR = os.path.join(
+    os.path.expanduser("~"), ".mekus", "valorant_profiles"
+)
+PROFILE_DIR_ENV = "MEKUS_PROFILE_DIR"
+
+# File holding the codename of the store's most recently used agent
+LAST_AGENT_FILE = "_last_agent"
+
+# Profile fields saved for every agent
+PROFILE_FIELDS = ("codename", "rank", "main_weapon", "favorite_map")
+
+_local = threading.local()
+
+
+class ProfileStore:
+    """Local store of Valorant agent profiles, indexed by codename.
+
+    Each profile is a tiny JSON file whose name is derived from the
+    codename, so loading one is a single file read no matter how many
+    profiles have been saved.
+    """
+
+    __slots__ = ("directory",)
+
+    def __init__(self, directory=None):
+        self.directory = (
+            directory
+            or os.environ.get(PROFILE_DIR_ENV)
+            or DEFAULT_PROFILE_DIR
+        )
+
+    def path_for(self, codename):
+        """Return the file path of a codename's profile."""
+        key = quote(codename.strip().lower(), safe="")
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, codename):
+        """Return the saved profile dict for a codename, or None."""
+        try:
+            with open(self.path_for(codename), encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, profile):
+        """Save a profile dict (see PROFILE_FIELDS) under its codename."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(profile["codename"])
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({field: profile[field] for field in PROFILE_FIELDS}, file)
+        os.replace(temp_path, path)
+
+    def last_codename(self):
+        """Return the codename of the last agent used, or None."""
+        path = os.path.join(self.directory, LAST_AGENT_FILE)
+        try:
+            with open(path, encoding="utf-8") as file:
+                return file.read().strip() or None
+        except OSError:
+            return None
+
+    def remember(self, codename):
+        """Mark a codename as the last agent used."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, LAST_AGENT_FILE)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(codename)
+
+
+def bind(store):
+    """Give the calling thread its own ProfileStore, or None to unbind."""
+    _local.store = store
+
+
+def current():
+    """Return the calling thread's ProfileStore, or the user's store."""
+    store = getattr(_local, "store", None)
+    return store if store is not None else ProfileStore()
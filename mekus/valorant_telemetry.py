@@ -0,0 +1,314 @@
+import csv  # Standard library
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .valorant_index import DIMENSIONS, MatchIndex, normalize_tag
+
+# Columns of a round-by-round telemetry export (one row per agent per round)
+TAG_COLUMNS = ("match_id", "agent", "map", "weapon")
+COUNT_COLUMNS = (
+    "kills",
+    "deaths",
+    "assists",
+    "headshots",
+    "shots",
+    "planted",
+    "plant_attempted",
+    "defused",
+    "defuse_attempted",
+    "round_won",
+    "credits_spent"
+)
+
+# Round columns folded into each MatchIndex counter
+ROUND_TO_MATCH_FIELD = {
+    "kills": "kills",
+    "deaths": "deaths",
+    "assists": "assists",
+    "headshots": "headshots",
+    "shots": "shots",
+    "planted": "plants",
+    "plant_attempted": "plant_attempts",
+    "defused": "defusals",
+    "defuse_attempted": "defusal_attempts",
+    "credits_spent": "credits"
+}
+
+# Shared process pools bound to threads that run their own session
+_local = threading.local()
+
+
+def read_rounds(path):
+    """
+    Stream rounds from a telemetry CSV file, one dict at a time.
+
+    Only the current row is held in memory, so files of any size can
+    be processed.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        try:
+            header = next(reader, None)
+            if header is None:
+                return
+            yield from parse_rounds(header, reader)
+        except (csv.Error, ValueError) as error:
+            raise ValueError(
+                f"{path}, line {reader.line_num}: {error}"
+            ) from None
+
+
+def parse_rounds(header, rows, skipped=None):
+    """
+    Yield round dicts from CSV rows laid out as header says.
+
+    A row with too few columns or a count that is not an integer raises
+    ValueError, or, when a skipped list is given, is appended to it and
+    left out.
+    """
+    positions = {name: header.index(name) for name in TAG_COLUMNS}
+    counts = [(name, header.index(name)) for name in COUNT_COLUMNS]
+    width = max(
+        list(positions.values()) + [position for _, position in counts]
+    ) + 1
+    for row in rows:
+        if not row:
+            continue
+        try:
+            if len(row) < width:
+                raise ValueError(f"{len(row)} of {width} columns")
+            round_data = {
+                name: row[position] for name, position in positions.items()
+            }
+            for name, position in counts:
+                round_data[name] = int(row[position] or 0)
+        except ValueError as error:
+            if skipped is None:
+                raise ValueError(f"Bad round: {error}") from None
+            skipped.append(row)
+            continue
+        yield round_data
+
+
+def filter_rounds(rounds, agent=None, map_name=None, weapon=None):
+    """Yield only rounds matching the given agent, map and weapon."""
+    wanted = {
+        "agent": normalize_tag(agent) if agent else None,
+        "map": normalize_tag(map_name) if map_name else None,
+        "weapon": normalize_tag(weapon) if weapon else None
+    }
+    wanted = {column: value for column, value in wanted.items() if value}
+
+    for round_data in rounds:
+        if all(
+            normalize_tag(round_data[column]) == value
+            for column, value in wanted.items()
+        ):
+            yield round_data
+
+
+def window_matches(rounds):
+    """
+    Group consecutive rounds of the same match into per-agent matches.
+
+    Exports are ordered by match, so only the agents of the match being
+    read are buffered. Yields (agent, map, weapon, stats) tuples in the
+    form MatchIndex.record expects; the weapon tag is the weapon the
+    agent used in the most rounds.
+    """
+    windows = MatchWindows()
+    for round_data in rounds:
+        yield from windows.add(round_data)
+    yield from windows.close()
+
+
+class MatchWindows:
+    """Rounds of the match being read, buffered per agent.
+
+    A live log can end mid-match, so the buffer can be saved with
+    to_state() and picked up later; a match is only yielded once a
+    round of the next match shows it is over.
+    """
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.current_match = state.get("match")
+        self.windows = {
+            agent: dict(window, weapons=Counter(window["weapons"]))
+            for agent, window in state.get("windows", {}).items()
+        }
+
+    def to_state(self):
+        return {"match": self.current_match, "windows": self.windows}
+
+    def add(self, round_data):
+        """Buffer a round; return the matches it shows are finished."""
+        closed = []
+        if round_data["match_id"] != self.current_match:
+            closed = self.close()
+            self.current_match = round_data["match_id"]
+
+        window = self.windows.get(round_data["agent"])
+        if window is None:
+            window = {
+                "map": round_data["map"],
+                "weapons": Counter(),
+                "rounds_won": 0,
+                "rounds": 0,
+                "stats": dict.fromkeys(ROUND_TO_MATCH_FIELD.values(), 0)
+            }
+            self.windows[round_data["agent"]] = window
+
+        window["weapons"][round_data["weapon"]] += 1
+        window["rounds"] += 1
+        window["rounds_won"] += round_data["round_won"]
+        stats = window["stats"]
+        for column, field in ROUND_TO_MATCH_FIELD.items():
+            stats[field] += round_data[column]
+        return closed
+
+    def close(self):
+        """Return the buffered match as match records and clear it."""
+        closed = list(close_windows(self.windows))
+        self.windows = {}
+        return closed
+
+
+def close_windows(windows):
+    """Turn the buffered rounds of one match into match records."""
+    for agent, window in windows.items():
+        stats = window["stats"]
+        stats["rounds"] = window["rounds"]
+        # A match is won when the agent's side won most of its rounds
+        rounds_lost = window["rounds"] - window["rounds_won"]
+        stats["wins"] = 1 if window["rounds_won"] > rounds_lost else 0
+        weapon = window["weapons"].most_common(1)[0][0]
+        yield agent, window["map"], weapon, stats
+
+
+def aggregate(matches, index=None):
+    """Fold match records into a MatchIndex and return it."""
+    index = index if index is not None else MatchIndex()
+    for agent, map_name, weapon, stats in matches:
+        index.record(agent, map_name, weapon, stats)
+    return index
+
+
+def summarize_file(path, agent=None, map_name=None, weapon=None):
+    """Run the full parse -> filter -> window -> aggregate pipeline."""
+    rounds = filter_rounds(read_rounds(path), agent, map_name, weapon)
+    return aggregate(window_matches(rounds))
+
+
+def bind_executor(executor):
+    """Give the calling thread a shared process pool to use, or None."""
+    _local.executor = executor
+
+
+def summarize_files(paths, processes=None, **filters):
+    """
+    Summarize many telemetry files, one file per worker process.
+
+    A pool bound with bind_executor() is used instead of a new one.
+
+    Parameters:
+        paths (list): Telemetry CSV files to read.
+        processes (int): Worker count; None uses one per CPU.
+        **filters: Optional agent, map_name and weapon filters.
+
+    Returns:
+        MatchIndex: Combined totals of every file.
+    """
+    paths = list(paths)
+    worker = partial(summarize_file, **filters)
+    if len(paths) <= 1 or processes == 1:
+        return merge_all(map(worker, paths))
+
+    executor = getattr(_local, "executor", None)
+    if executor is not None:
+        return merge_all(executor.map(worker, paths))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return merge_all(executor.map(worker, paths))
+
+
+class LiveTelemetry:
+    """Matches folded in from followed telemetry logs, for one agent.
+
+    Kept as a checkpoint next to the logs' read offsets (see
+    log_tail.LogFollower), including the rounds of matches still being
+    played.
+    """
+
+    def __init__(self, agent, checkpoint=None):
+        checkpoint = checkpoint or {}
+        self.agent = agent
+        self.index = index_from_state(checkpoint.get("index", {}))
+        self.windows = {
+            path: MatchWindows(state)
+            for path, state in checkpoint.get("windows", {}).items()
+        }
+
+    def to_checkpoint(self):
+        return {
+            "index": index_to_state(self.index),
+            "windows": {
+                path: windows.to_state()
+                for path, windows in self.windows.items()
+            }
+        }
+
+    def ingest(self, path, header, rows, skipped):
+        """
+        Fold newly appended rows of one log.
+
+        Malformed rows are appended to the skipped list and left out; a
+        header without the telemetry columns raises ValueError before
+        anything is folded in.
+
+        Returns:
+            list: The (agent, map, weapon, stats) matches they finished.
+        """
+        windows = self.windows.get(path)
+        if windows is None:
+            windows = self.windows[path] = MatchWindows()
+        rounds = filter_rounds(
+            parse_rounds(header, rows, skipped), agent=self.agent
+        )
+
+        finished = []
+        for round_data in rounds:
+            finished.extend(windows.add(round_data))
+        aggregate(finished, self.index)
+        return finished
+
+
+def index_to_state(index):
+    """Return a MatchIndex as JSON-compatible data."""
+    return {
+        "tags": index.tags,
+        "groups": [
+            list(group_key) + counters
+            for group_key, counters in index.groups.items()
+        ]
+    }
+
+
+def index_from_state(state):
+    """Rebuild a MatchIndex saved with index_to_state()."""
+    index = MatchIndex()
+    for dimension, names in state.get("tags", {}).items():
+        index.tags[dimension].update(names)
+    width = len(DIMENSIONS)
+    for group in state.get("groups", []):
+        index.groups[tuple(group[:width])] = group[width:]
+    return index
+
+
+def merge_all(indexes):
+    """Merge an iterable of MatchIndex objects into a new one."""
+    combined = MatchIndex()
+    for index in indexes:
+        combined.merge(index)
+    return combined
@@ -0,0 +1,28 @@
+from mekus import driver
+from mekus.dazo import MobileLegendsStats
+
+MATCH_LOG = "kills,deaths,assists,result\n5,2,7,win\n"
+
+
+def write_match_log(directory):
+    path = directory / "matches.csv"
+    path.write_text(MATCH_LOG, encoding="utf-8")
+    return str(path)
+
+
+def test_follow_match_logs_stops_on_enter(tmp_path):
+    log = write_match_log(tmp_path)
+    result = driver.run_session(
+        MobileLegendsStats, ["6", log, "", "", "0"], seed=0
+    )
+    assert result.error is None
+    assert result.completed
+    assert any("Stopped following." in frame for frame in result.frames)
+
+
+def test_follow_match_logs_ends_with_the_input(tmp_path):
+    log = write_match_log(tmp_path)
+    result = driver.run_session(MobileLegendsStats, ["6", log], seed=0)
+    assert result.error is None
+    assert not result.completed
+    assert "Press Enter to stop." in result.frames[-1]